@@ -0,0 +1,167 @@
+import io
+import json
+import os
+from datetime import datetime, timedelta
+
+from PIL import Image
+
+from bots.aljazeera_bot.constants import ALJAZEERA_DATE_SEPARATORS, ALJAZEERA_TITLE_SUFFIX, ITEMS_PER_PAGE
+
+# Search page mimicking the markup the scraper's XPaths expect. Results are rendered from the
+# same search endpoint the HTTP backend reads, so both backends scrape identical fixtures.
+SEARCH_PAGE_HTML = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Search fixture</title></head>
+<body>
+<button id="onetrust-accept-btn-handler" onclick="this.remove()">Accept cookies</button>
+<div class="site-header__search-trigger"><button type="button" onclick="openSearch()">Search</button></div>
+<div id="search-bar" style="display: none">
+    <input class="search-bar__input" type="text">
+    <div class="search-bar__button"><button type="button" onclick="search()">Go</button></div>
+</div>
+<div id="search-page"></div>
+<script>
+var page = 0, query = '', sort = 'relevance';
+
+function openSearch() {
+    document.getElementById('search-bar').style.display = 'block';
+}
+
+function search() {
+    query = document.querySelector('.search-bar__input').value;
+    document.getElementById('search-page').innerHTML =
+        '<div class="search-summary">Results for ' + query + '</div>' +
+        '<select id="search-sort-option" onchange="sortBy(this.value)">' +
+        '<option value="relevance">Relevance</option><option value="date">Date</option></select>' +
+        '<div class="search-result__list"></div>' +
+        '<div class="loading-animation" style="display: none">Loading</div>' +
+        '<button class="show-more-button grid-full-width" onclick="showMore()">Show more</button>';
+    sortBy(sort);
+}
+
+function sortBy(value) {
+    sort = value;
+    page = 0;
+    document.querySelector('.search-result__list').innerHTML = '';
+    loadPage();
+}
+
+function showMore() {
+    page += 1;
+    loadPage();
+}
+
+function loadPage() {
+    var loading = document.querySelector('.loading-animation');
+    var button = document.querySelector('.show-more-button');
+    var variables = JSON.stringify({query: query, start: page * %(items_per_page)d + 1, sort: sort});
+    loading.style.display = 'block';
+    fetch('/graphql?variables=' + encodeURIComponent(variables))
+        .then(function (response) { return response.json(); })
+        .then(function (payload) {
+            var items = payload.data.searchPosts.items;
+            var list = document.querySelector('.search-result__list');
+            items.forEach(function (item) {
+                var article = document.createElement('article');
+                article.className = 'gc';
+                article.innerHTML =
+                    '<div class="gc__content"><div class="gc__header-wrap"><h3 class="gc__title">' +
+                    '<a href="' + item.link + '"><span></span></a></h3></div>' +
+                    '<div class="gc__excerpt"><div class="gc__body-wrap"><p></p></div></div></div>' +
+                    '<div class="gc__image-wrap"><img src="' + item.pagemap.cse_image[0].src + '"></div>';
+                article.querySelector('span').textContent = item.title.replace(%(title_suffix)s, '');
+                article.querySelector('p').textContent = item.snippet;
+                list.appendChild(article);
+            });
+            loading.style.display = 'none';
+            button.style.display = items.length < %(items_per_page)d ? 'none' : 'block';
+        });
+}
+</script>
+</body>
+</html>
+"""
+
+
+class FixtureSet:
+    """
+    Search results and images served to the scraper by the benchmark server.
+
+    A fixture directory holds the search responses exactly as the search endpoint returns
+    them, one JSON file per page (``search/page-0000.json``), the images they reference
+    (``images/``) and the search page (``index.html``). Responses recorded from the live
+    site can be dropped in with the same layout, ``generate`` writes synthetic ones.
+
+    Example:
+        fixtures = FixtureSet.generate("benchmarks/results/fixtures-200", size=200)
+        fixtures.page(0)
+        {'data': {'searchPosts': {'items': [...]}}}
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @classmethod
+    def generate(cls, directory: str, size: int, hours_between_articles: int = 6) -> 'FixtureSet':
+        """
+        Writes ``size`` articles, newest first, one every ``hours_between_articles`` hours.
+
+        Image and article URLs are relative to the server root, the server makes them absolute.
+        """
+        os.makedirs(os.path.join(directory, 'search'), exist_ok=True)
+        os.makedirs(os.path.join(directory, 'images'), exist_ok=True)
+
+        with open(os.path.join(directory, 'index.html'), 'w', encoding='utf-8') as page_file:
+            page_file.write(SEARCH_PAGE_HTML % {
+                'items_per_page': ITEMS_PER_PAGE,
+                'title_suffix': json.dumps(ALJAZEERA_TITLE_SUFFIX),
+            })
+
+        image = cls.build_image()
+        now = datetime.now()
+        for page in range((size + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE):
+            items = []
+            for index in range(page * ITEMS_PER_PAGE, min(size, (page + 1) * ITEMS_PER_PAGE)):
+                published = now - timedelta(hours=index * hours_between_articles)
+                items.append({
+                    'title': f'Article {index} on the economy, costing $1,000{ALJAZEERA_TITLE_SUFFIX}',
+                    'link': f'/news/{index}',
+                    'snippet': f'{published.strftime("%b %d, %Y")} {ALJAZEERA_DATE_SEPARATORS} '
+                               f'Economy article {index} with a budget of 25 USD.',
+                    'pagemap': {'cse_image': [{'src': f'/images/{index}.jpg'}]},
+                })
+
+                # Distinct bytes per article so the image store doesn't share them
+                with open(os.path.join(directory, 'images', f'{index}.jpg'), 'wb') as image_file:
+                    image_file.write(image + index.to_bytes(4, 'big'))
+
+            page_path = os.path.join(directory, 'search', f'page-{page:04d}.json')
+            with open(page_path, 'w', encoding='utf-8') as page_file:
+                json.dump({'data': {'searchPosts': {'items': items}}}, page_file)
+
+        return cls(directory)
+
+    @staticmethod
+    def build_image(size: int = 320) -> bytes:
+        # A thumbnail sized JPEG, data after its end marker is ignored by decoders
+        buffer = io.BytesIO()
+        Image.new('RGB', (size, size * 9 // 16), (74, 123, 208)).save(buffer, format='JPEG', quality=85)
+        return buffer.getvalue()
+
+    @property
+    def size(self) -> int:
+        return sum(len(self.page(page)['data']['searchPosts']['items']) for page in range(self.pages))
+
+    @property
+    def pages(self) -> int:
+        return len([name for name in os.listdir(os.path.join(self.directory, 'search')) if name.endswith('.json')])
+
+    def page(self, page: int) -> dict:
+        # Search response of a zero based page, empty past the last one
+        path = os.path.join(self.directory, 'search', f'page-{page:04d}.json')
+        if not os.path.exists(path):
+            return {'data': {'searchPosts': {'items': []}}}
+
+        with open(path, encoding='utf-8') as page_file:
+            return json.load(page_file)
+
@@ -0,0 +1,191 @@
+"""
+Offline benchmark of the scraper against fixtures served from localhost.
+
+Every case scrapes a fixture set end to end in a fresh process and reports throughput,
+per-page latency, WebDriver calls, peak RSS and export time. Results are printed and
+saved as JSON; with ``--baseline`` the run fails if throughput regressed.
+
+Usage:
+    python -m benchmarks.run --sizes 50 200 1000 --backends http browser
+    python -m benchmarks.run --baseline benchmarks/results/baseline.json --max-regression 0.2
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.fixtures import FixtureSet
+
+# Search window wide enough for every fixture to be scraped
+BENCHMARK_MONTHS = 1200
+BENCHMARK_PHRASE = 'economy'
+BENCHMARK_REQUEST_RATE = 10000
+DEFAULT_RESULTS_DIRECTORY = 'benchmarks/results'
+
+
+def run_case(fixtures_directory: str, backend: str, export_formats: str, workdir: str) -> dict:
+    """Scrapes the fixtures once with ``backend`` and measures the run, in the current process."""
+    # Imported here so each case process starts from a clean state
+    from bots.aljazeera_bot.bot import AlJazeeraScraper
+    from bots.aljazeera_bot.http_backend import AlJazeeraHttpBackend
+    from benchmarks.server import FixtureServer
+    from configs import logger
+    from configs.workitem_configs import WorkItemInputs
+    from core.backends import BrowserBackend
+    from core.rate_limits import RateLimiter
+
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    # Outputs and state of the case stay in its own directory
+    os.chdir(workdir)
+
+    with FixtureServer(FixtureSet(fixtures_directory)) as server:
+
+        class BenchmarkHttpBackend(AlJazeeraHttpBackend):
+            api_url = server.url + 'graphql'
+
+        class BenchmarkScraper(AlJazeeraScraper):
+            domain = start_url = server.url
+            backends = {BrowserBackend.name: BrowserBackend, BenchmarkHttpBackend.name: BenchmarkHttpBackend}
+
+        config = WorkItemInputs(
+            search_phrase=BENCHMARK_PHRASE,
+            month=BENCHMARK_MONTHS,
+            backend=backend,
+            export_formats=export_formats,
+            image_store_path='',
+            browser_profile='fast',
+            resume=False
+        )
+
+        started = time.perf_counter()
+        # The local server needs no politeness, a throttled run would only measure the rate limit
+        rate_limiter = RateLimiter(
+            max_rate=BENCHMARK_REQUEST_RATE, initial_rate=BENCHMARK_REQUEST_RATE, burst=BENCHMARK_REQUEST_RATE
+        )
+        scraper = BenchmarkScraper(config=config, rate_limiter=rate_limiter)
+        scraper.main()
+        duration = time.perf_counter() - started
+
+    stages = scraper.profiler.summary()
+    page = stages.get('page') or stages.get('fetch_page') or {}
+    return {
+        'items': scraper.items_scraped,
+        'status': 'failed' if scraper.error else 'completed',
+        'error': str(scraper.error) if scraper.error else None,
+        'duration_seconds': round(duration, 3),
+        'articles_per_second': round(scraper.items_scraped / duration, 2) if duration else 0,
+        'pages': page.get('count', 0),
+        'page_p50_seconds': page.get('p50'),
+        'page_p95_seconds': page.get('p95'),
+        'webdriver_calls': sum(stats['count'] for name, stats in stages.items() if name.startswith('webdriver.')),
+        'export_seconds': stages.get('close_exporters', {}).get('total'),
+        'archive_seconds': stages.get('archive_image', {}).get('total'),
+        # Peak of this process only, browsers run in their own processes
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def case_worker(results, *args):
+    try:
+        results.put(run_case(*args))
+    except Exception as e:  # Report failures of a case, e.g. no browser installed, and carry on
+        results.put({'items': 0, 'status': 'failed', 'error': f'{type(e).__name__}: {e}'})
+
+
+def run_isolated(*args) -> dict:
+    # A fresh process per case, so peak RSS and imports are not shared between cases
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=case_worker, args=(results, *args))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def find_regressions(cases: list, baseline: dict, max_regression: float) -> list:
+    # Cases whose throughput dropped by more than `max_regression` compared to the baseline
+    baseline_cases = {(case['backend'], case['size']): case for case in baseline['cases']}
+    regressions = []
+    for case in cases:
+        previous = baseline_cases.get((case['backend'], case['size']))
+        if not previous or not previous.get('articles_per_second'):
+            continue
+        if case.get('articles_per_second', 0) < previous['articles_per_second'] * (1 - max_regression):
+            regressions.append(
+                f"{case['backend']} x {case['size']}: {case.get('articles_per_second', 0)} articles/s, "
+                f"baseline {previous['articles_per_second']}"
+            )
+    return regressions
+
+
+def print_table(cases: list):
+    columns = ('backend', 'size', 'status', 'articles_per_second', 'page_p50_seconds', 'page_p95_seconds',
+               'webdriver_calls', 'peak_rss_mb', 'export_seconds')
+    print(' | '.join(columns))
+    for case in cases:
+        print(' | '.join(str(case.get(column, '')) for column in columns))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200, 1000], help='Articles per fixture set')
+    parser.add_argument('--backends', nargs='+', default=['http'], help='Backends to benchmark, e.g. http browser')
+    parser.add_argument('--formats', default='xlsx', help='Comma separated export formats')
+    parser.add_argument('--fixtures', help='Recorded fixture directory to use instead of generated sets')
+    parser.add_argument('--output', default=DEFAULT_RESULTS_DIRECTORY, help='Directory of the JSON results')
+    parser.add_argument('--baseline', help='Results of a previous run to compare throughput with')
+    parser.add_argument('--max-regression', type=float, default=0.2, help='Allowed throughput drop, 0.2 is 20%%')
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='scraper-benchmark-')
+    if args.fixtures:
+        fixture_sets = [FixtureSet(os.path.abspath(args.fixtures))]
+    else:
+        fixture_sets = [FixtureSet.generate(os.path.join(workdir, f'fixtures-{size}'), size) for size in args.sizes]
+
+    cases = []
+    for fixtures in fixture_sets:
+        for backend in args.backends:
+            case_directory = tempfile.mkdtemp(prefix=f'{backend}-', dir=workdir)
+            result = run_isolated(fixtures.directory, backend, args.formats, case_directory)
+            cases.append({'backend': backend, 'size': fixtures.size, **result})
+            print(f"{backend} x {fixtures.size}: {result['status']}, {result.get('articles_per_second', 0)} articles/s",
+                  file=sys.stderr)
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'formats': args.formats,
+        'cases': cases,
+    }
+    os.makedirs(args.output, exist_ok=True)
+    report_path = os.path.join(args.output, f'benchmark-{report["created_at"]}.json')
+    with open(report_path, 'w', encoding='utf-8') as report_file:
+        json.dump(report, report_file, indent=2)
+
+    print_table(cases)
+    print(f'Results saved at {report_path}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            regressions = find_regressions(cases, json.load(baseline_file), args.max_regression)
+        for regression in regressions:
+            print(f'Throughput regression: {regression}', file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
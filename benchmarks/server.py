@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.fixtures import FixtureSet
+from bots.aljazeera_bot.constants import ALJAZEERA_SCRAPE_URL, ITEMS_PER_PAGE
+
+
+class FixtureServer:
+    """
+    Serves a fixture set over HTTP on localhost, standing in for the site and its search endpoint.
+
+    ``/`` serves the search page, ``/graphql`` the recorded search response of the requested
+    page and ``/images/<name>`` the images. Links in the responses are rewritten to point at
+    the server, so a run never leaves the machine.
+
+    Example:
+        with FixtureServer(fixtures) as server:
+            server.url
+            'http://127.0.0.1:41231/'
+    """
+
+    def __init__(self, fixtures: FixtureSet, host: str = '127.0.0.1', port: int = 0):
+        self.fixtures = fixtures
+        self.httpd = ThreadingHTTPServer((host, port), self.build_handler())
+        self.httpd.daemon_threads = True
+        self.url = f'http://{host}:{self.httpd.server_address[1]}/'
+        self.thread = None
+
+    def __enter__(self) -> 'FixtureServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-server', daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def localize(self, url: str) -> str:
+        # Point relative and live site links at the fixture server
+        if url.startswith(ALJAZEERA_SCRAPE_URL):
+            return self.url + url[len(ALJAZEERA_SCRAPE_URL):]
+        if url.startswith('/'):
+            return self.url + url[1:]
+        return url
+
+    def search_response(self, variables: dict) -> dict:
+        payload = self.fixtures.page((variables.get('start', 1) - 1) // ITEMS_PER_PAGE)
+        for item in payload['data']['searchPosts']['items']:
+            item['link'] = self.localize(item['link'])
+            for image in (item.get('pagemap') or {}).get('cse_image') or []:
+                image['src'] = self.localize(image['src'])
+        return payload
+
+    def build_handler(self):
+        server = self
+        images_directory = os.path.join(self.fixtures.directory, 'images')
+
+        class FixtureHandler(BaseHTTPRequestHandler):
+
+            def log_message(self, *args):
+                # Keep the benchmark output readable
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+
+                if url.path == '/graphql':
+                    variables = json.loads(parse_qs(url.query).get('variables', ['{}'])[0])
+                    self.reply(json.dumps(server.search_response(variables)).encode(), 'application/json')
+
+                elif url.path.startswith('/images/'):
+                    image_path = os.path.join(images_directory, os.path.basename(url.path))
+                    if not os.path.exists(image_path):
+                        self.send_error(404)
+                        return
+                    with open(image_path, 'rb') as image_file:
+                        self.reply(image_file.read(), 'image/jpeg')
+
+                else:
+                    with open(os.path.join(server.fixtures.directory, 'index.html'), 'rb') as page_file:
+                        self.reply(page_file.read(), 'text/html; charset=utf-8')
+
+            def reply(self, body: bytes, content_type: str):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return FixtureHandler
@@ -1,34 +1,52 @@
+import json
+import time
+from concurrent.futures import Future
+
 from bots.aljazeera_bot.constants import (
     ALJAZEERA_DATE_SEPARATORS,
     ALJAZEERA_SCRAPE_URL,
-    ITEMS_PER_PAGE,
+    BULK_EXTRACTION,
     SORT_BY_ARTICLES
 )
+from bots.aljazeera_bot.http_backend import AlJazeeraHttpBackend
 from bots.aljazeera_bot.model import AljazeeraModel
 from bots.aljazeera_bot.utils import parse_date_string
+from core.backends import BrowserBackend
 from core.base import BaseScraper
+from core.profiler import profiled
+from core.javascript import build_bulk_extract_script, build_clear_inputs_script, build_count_script
+from core.waits import WaitEngine
 from bots.aljazeera_bot import XpathSelectors
 from configs.loggers import logger as log
 
 from RPA.Browser.Selenium import By
-
-from core.exceptions import ScraperStopException
+from selenium.common import TimeoutException
 
 
 class AlJazeeraScraper(BaseScraper, XpathSelectors):
     # Class to scrape Al Jazeera website, inheriting from BaseScraper and XpathSelectors
 
     domain = start_url = ALJAZEERA_SCRAPE_URL  # Set domain and start URL
-    page = -1  # Initialize page counter
-    items_per_page = ITEMS_PER_PAGE  # Set number of items per page
     bot_name = 'AljazeeraNews'  # Set bot name
-    close_spider = False  # Flag to indicate when to stop scraping
+    site_name = 'aljazeera'  # Key in the scraper registry
+    bulk_extraction = BULK_EXTRACTION  # Read each page with a single JavaScript call
+    item_class = AljazeeraModel  # Model of the scraped articles
+
+    # Scrape through the browser, or directly from the search endpoint
+    backends = {
+        BrowserBackend.name: BrowserBackend,
+        AlJazeeraHttpBackend.name: AlJazeeraHttpBackend,
+    }
 
     def parse(self):
         """Parse the website to extract article data."""
 
-        # Accept cookies if prompted
-        self.accept_cookies()
+        # The landing page and search form share one waiting budget
+        self.waits.start_page()
+
+        # Accept cookies if prompted, pooled browsers have already done it
+        if not self.browser_is_warm:
+            self.accept_cookies()
 
         # Enter search phrase in search bar
         self.input_search_phrase()
@@ -43,35 +61,95 @@ class AlJazeeraScraper(BaseScraper, XpathSelectors):
         self.parse_articles()
 
     def parse_articles(self):
-        """Recursively parse the pages until a stop condition is met."""
-        # Stop parsing if no more articles are found and it's not the first page
-        if self.page != -1 and not self.browser.is_element_visible(self.search_results_xpath):
-            raise ScraperStopException("No more articles.")
+        """Parse the result pages one at a time until a stop condition is met."""
+        for articles in self.iter_result_pages():
+            with log.contextualize(page=self.page):
+                # Drop articles past the stop date before extracting them, this page is then the last one
+                articles, reached_stop_date = self.split_at_stop_date(articles)
+
+                # Extract information from each article
+                for item in self.extract_articles(articles):
+                    # Continue to the next page if the spider should not be closed
+                    if not self.close_spider:
+                        self.store_item(item)  # Store the extracted item
+
+                if reached_stop_date:
+                    self.close_spider = True
+
+                # Don't load more results once the stop date or articles from a previous incremental run are reached
+                if self.close_spider:
+                    log.info("Stop condition met.")
+                    return
+
+                # Periodically record the position so an interrupted run can resume from here
+                self.save_checkpoint()
+
+    def iter_result_pages(self):
+        """
+        Yields the articles of each page of results, loading the next page in between.
+
+        The crawl ends when the results disappear or there is no "Show more" button left.
+        A resumed run first reloads the pages its interrupted run had already scraped.
+        """
+        if self.page != -1:
+            self.load_scraped_pages()
+
+        while True:
+            # Every page of results gets its own waiting budget
+            self.waits.start_page()
+            page_started = time.monotonic()
+
+            # Stop parsing if no more articles are found and it's not the first page
+            if self.page != -1 and not self.browser.is_element_visible(self.search_results_xpath):
+                log.info("No more articles.")
+                return
+
+            # Get articles from the current page
+            yield self.select_articles_from_page()
+
+            # Click the next button and wait for more articles
+            more_results = self.click_next_item()
+            self.profiler.record('page', time.monotonic() - page_started)
+            if not more_results:
+                return
 
-        # Get articles from the current page
-        articles = self.select_articles_from_page()
+    @profiled()
+    def load_scraped_pages(self):
+        # Grow the results list past the checkpoint without reading it again
+        log.info(f"Loading {self.page + 1} pages scraped before the checkpoint")
+        for _ in range(self.page + 1):
+            self.waits.start_page()
+            if not self.click_next_item(min_results=self.count_results() + 1):
+                return
 
-        # Extract information from each article
-        for item in self.extract_articles(articles):
-            # Continue to the next page if the spider should not be closed
-            if not self.close_spider:
-                self.store_item(item)  # Store the extracted item
+    @classmethod
+    def warm_up_browser(cls, browser):
+        # Accept cookies once in a fresh pooled browser
+        if WaitEngine(browser).wait_for(cls.cookie_button_xpath, optional=True):
+            browser.click_button(cls.cookie_button_xpath)
+            return
+        log.debug("No Cookies Banner found to Click")
 
-        self.click_next_item()  # Click the next button to load more articles
-        self.browser.wait_until_element_is_not_visible(self.loading_animation_xpath, timeout=10)
-        self.parse_articles()  # Recursively parse the next page of articles
+    def reset_browser(self):
+        # Go back to the start page and clear any leftover search phrase
+        super().reset_browser()
+        self.browser.execute_javascript(build_clear_inputs_script(self.search_input_xpath))
 
+    @profiled()
     def accept_cookies(self):
-        # Click the accept cookies button if visible
-        if self.element_is_visible(self.cookie_button_xpath):
-            self.browser.click_button_when_visible(self.cookie_button_xpath)
+        # Click the accept cookies button if visible, without waiting long for a banner that may never come
+        if self.element_is_visible(self.cookie_button_xpath, optional=True):
+            self.browser.click_button(self.cookie_button_xpath)
             log.debug("Cookie Accept button clicked")
+            return
         log.debug("No Cookies Banner found to Click")
 
+    @profiled()
     def wait_for_search_items_to_load(self):
         # Wait until search items are visible, with up to 10 retries
         self.element_is_visible(self.sort_by_xpath, max_retries=10)
 
+    @profiled()
     def input_search_phrase(self):
         # Enter the search phrase in the search input
         self.element_is_visible(self.search_icon_xpath)
@@ -80,56 +158,112 @@ class AlJazeeraScraper(BaseScraper, XpathSelectors):
         self.browser.input_text_when_element_is_visible(self.search_input_xpath, self.search_phrase)
         self.browser.click_button_when_visible(self.search_submit_xpath)
 
+    @profiled()
     def sort_by_latest(self):
         # Sort search results by date
         self.element_is_visible(self.sort_by_xpath, max_retries=5)
         self.browser.select_from_list_by_value(self.sort_by_select_xpath, SORT_BY_ARTICLES)
         log.debug("Sort by latest")
 
-    def click_next_item(self):
-        # Scroll to the bottom of the page and click the next button if visible
+    @profiled()
+    def click_next_item(self, min_results=None):
+        """
+        Clicks "Show more" and waits for the next articles.
+
+        Args:
+            min_results (int, optional): Number of results expected once loaded. Defaults to one
+                more than the articles read so far.
+
+        Returns:
+            bool: False if there is no next button, i.e. no further results.
+        """
+        # Scroll to the bottom of the page and click the next button if visible. The results are loaded by now,
+        # so the button is checked once: the last page has none and waiting for it would only stall the crawl.
         self.browser.execute_javascript("window.scrollTo(0, document.body.scrollHeight);")
-        if self.element_is_visible(self.click_next_button_xpath, raise_exception=False):
-            self.browser.click_element_when_clickable(self.click_next_button_xpath)
-            log.debug("Next button clicked")
-            self.browser.wait_until_element_is_not_visible(self.loading_animation_xpath, timeout=5)
-            return True
-        raise ScraperStopException("No further elements to be scraped")
+        if not self.waits.wait_for(self.click_next_button_xpath, timeout=0):
+            log.info("No further elements to be scraped")
+            return False
+
+        # Paced by the site's request rate, a click whose results time out is retried at a lower rate
+        self.rate_limiter.call(lambda: self.load_next_results(min_results), retryable=self.is_retryable_error)
+        self.waits.wait_for(self.loading_animation_xpath, state='hidden')
+        return True
+
+    def load_next_results(self, min_results=None):
+        # A retried click may have landed after its wait timed out, only click again while results are missing
+        count = min_results or self.cursor.index + 1
+        if self.count_results() >= count:
+            return
+
+        self.browser.click_element_when_clickable(self.click_next_button_xpath)
+        log.debug("Next button clicked")
+
+        # Done as soon as new articles are appended
+        if not self.waits.wait_for(self.search_results_xpath, state='count', count=count):
+            raise TimeoutException(f"Less than {count} results loaded")
+
+    def count_results(self) -> int:
+        # Number of articles currently in the results list
+        return self.browser.execute_javascript(build_count_script(self.search_results_xpath))
 
+    @profiled()
     def select_articles_from_page(self):
         """
-        Selects and returns a slice of articles from the current search results page.
+        Selects and returns the articles appended to the search results since the last page.
 
         Returns:
-            list: A list of article elements from the current page.
+            list: A list of article records (dicts with url, title, description and image_src).
 
         Optimizations:
-            - Added comments to clarify each step in the function.
-            - Removed unnecessary comments that merely restated the code.
+            - Only nodes after the results cursor are read, so each page costs O(new articles)
+              regardless of how long the "Show more" list has grown, and any page size works.
+            - In bulk mode all new articles are read with a single JavaScript call.
         """
         # Ensure search results are visible on the page
         self.element_is_visible(self.search_results_xpath, max_retries=5)
 
-        # Find all article elements on the current page
-        results = self.browser.find_elements(self.search_results_xpath)
-
         # Increment page counter for pagination tracking
         self.page += 1
-        log.debug(f"Current page={self.page}")
-
-        # Calculate indices to slice the results based on pagination
-        start_index = self.page * self.items_per_page
-        end_index = start_index + self.items_per_page
-
-        # Return a slice of the results based on the current page
-        return results[start_index:end_index]
+        log.debug("Current page={}, cursor={}", self.page, self.cursor)
+
+        if self.bulk_extraction:
+            return self.read_articles_in_bulk()
+
+        # Find only the article elements appended after the cursor
+        new_results_xpath = f"({self.search_results_xpath})[position() > {self.cursor.index}]"
+        records = [self.read_article(article) for article in self.browser.find_elements(new_results_xpath)]
+        self.cursor.advance(self.cursor.index, records, key_field='url')
+        return records
+
+    def read_articles_in_bulk(self):
+        # Read every article after the cursor in one WebDriver round-trip
+        script = build_bulk_extract_script(
+            self.search_results_xpath,
+            self.article_fields,
+            start=self.cursor.index,
+            key_field='url',
+            anchor=self.cursor.last_key
+        )
+        result = json.loads(self.browser.execute_javascript(script))
+
+        # The script may re-sync the start index if the list was re-rendered
+        self.cursor.advance(result['start'], result['records'], key_field='url')
+        return result['records']
+
+    def read_article(self, article):
+        # Read a single article element field by field
+        record = {}
+        for name, (xpath, attribute) in self.article_fields.items():
+            element = article.find_element(By.XPATH, xpath)
+            record[name] = element.get_attribute(attribute) if attribute else element.text
+        return record
 
     def extract_articles(self, articles):
         """
-        Extracts information from each article element and yields an BaseModel inherited item.
+        Extracts information from each article record and yields an BaseModel inherited item.
 
         Args:
-            articles (list): List of article elements to extract information from.
+            articles (list): List of article records to extract information from.
 
         Yields:
             Model: An inherited instance of BaseModel containing extracted article information.
@@ -140,7 +274,7 @@ class AlJazeeraScraper(BaseScraper, XpathSelectors):
         """
         for article in articles:
             # Extract description and publish date form article,
-            title_description = article.find_element(By.XPATH, self.article_description_xpath).text
+            title_description = article['description'] or ''
 
             # Skip articles without publish date in the description
             if ALJAZEERA_DATE_SEPARATORS not in title_description:
@@ -148,37 +282,90 @@ class AlJazeeraScraper(BaseScraper, XpathSelectors):
                 continue
 
             # separate publish date and description from description text
-            publish_date_str, description = [x.strip() for x in title_description.split(ALJAZEERA_DATE_SEPARATORS, 1)]
-            publish_date = parse_date_string(publish_date_str)
+            publish_date, description = self.read_publish_date(article)
+
+            # Without a date the article can't be checked against the stop date
+            if publish_date is None:
+                log.error(f"Article publish date could not be parsed: {title_description}")
+                continue
 
             # Check if the article's publish date is beyond the stop date
-            log.debug(f"Check Stop date {self.stop_date} >= {publish_date}: {self.stop_date >= publish_date}")
+            log.debug("Check Stop date {} >= {}", self.stop_date, publish_date)
             if self.stop_date >= publish_date:
                 log.info("Content found till required date")
                 self.close_spider = True
                 return
 
-            # Extract article title
-            title = article.find_element(By.XPATH, self.article_title_xpath).text
+            # Extract article title and link
+            title = article['title']
+            url = article.get('url') or ''
 
-            # Extract and process article image URL
-            image_src = article.find_element(By.XPATH, self.article_image_xpath).get_attribute('src')
-            image_path = self.get_image_path(image_src)
+            # In incremental mode skip articles captured by a previous run, without downloading their image
+            if self.is_already_seen(AljazeeraModel.article_key(url, title, publish_date)):
+                if self.close_spider:
+                    return
+                continue
+
+            # Extract article image URL and schedule its download
+            image_src = article['image_src']
+            image = self.get_image_path(image_src) if image_src else None
 
             # Log the extraction details
-            log.info(f"Article extracted: {title}, {publish_date}, {image_path}")
+            log.bind(article=url or title).info("Article extracted: {}, {}, {}", title, publish_date, image_src)
 
             # Create and yield an instance of Model
             item = AljazeeraModel(
                 title=title,
                 description=description,
-                image_path=image_path,
+                **self.image_fields(image),
                 publish_date=publish_date,
-                search_phrase=self.search_phrase
+                search_phrase=self.search_phrase,
+                url=url
             )
             yield item  # Yield the extracted article item
 
-    def get_image_path(self, image_url) -> str:
+    @staticmethod
+    def read_publish_date(article):
+        """
+        Splits an article description into its publish date and text.
+
+        Returns:
+            tuple: The publish date (None if missing or not parseable) and the description.
+        """
+        title_description = article['description'] or ''
+        if ALJAZEERA_DATE_SEPARATORS not in title_description:
+            return None, title_description.strip()
+
+        publish_date_str, description = [x.strip() for x in title_description.split(ALJAZEERA_DATE_SEPARATORS, 1)]
+        return parse_date_string(publish_date_str), description
+
+    def split_at_stop_date(self, articles):
+        """
+        Cuts a page of article records at the stop date, before any of them is extracted.
+
+        Results are sorted by date, so once the oldest article of a page is past the stop date
+        the articles from the first one past it are dropped (never extracted, their images
+        never downloaded) and no further page needs to be loaded.
+
+        Args:
+            articles (list): Article records of a page, newest first.
+
+        Returns:
+            tuple: The records published after the stop date, and whether the page reached it.
+        """
+        stop_date = self.stop_date
+        dates = [self.read_publish_date(article)[0] for article in articles]
+
+        # One look at the oldest date tells if the page reaches the stop date at all
+        oldest = min((date for date in dates if date is not None), default=None)
+        if oldest is None or oldest > stop_date:
+            return articles, False
+
+        cut = next(index for index, date in enumerate(dates) if date is not None and date <= stop_date)
+        log.info(f"Content found till required date, {len(articles) - cut} articles past {stop_date} skipped")
+        return articles[:cut], True
+
+    def get_image_path(self, image_url) -> Future:
         # Add domain to the relative image src
         if 'http' not in image_url:
             image_url = self.domain + image_url  # Ensure the image URL is complete
@@ -9,3 +9,18 @@ PUBLISH_DATE = 'publish_date'
 SORT_BY_ARTICLES = 'date'
 
 ITEMS_PER_PAGE = 10
+
+# Read all new articles of a page with one JavaScript call instead of per-element lookups
+BULK_EXTRACTION = True
+
+# Search endpoint used by the browser-less HTTP backend
+ALJAZEERA_SEARCH_API_URL = 'https://www.aljazeera.com/graphql'
+ALJAZEERA_SEARCH_OPERATION = 'SearchQuery'
+ALJAZEERA_SITE = 'aje'
+ALJAZEERA_TITLE_SUFFIX = ' | Al Jazeera'
+
+# Compiled search phrase patterns kept by AljazeeraModel
+PHRASE_PATTERN_CACHE_SIZE = 256
+
+# Parsed absolute publish dates kept by parse_date_string
+DATE_CACHE_SIZE = 1024
@@ -0,0 +1,110 @@
+import json
+from typing import List
+
+from bots.aljazeera_bot.constants import (
+    ALJAZEERA_SEARCH_API_URL,
+    ALJAZEERA_SEARCH_OPERATION,
+    ALJAZEERA_SITE,
+    ALJAZEERA_TITLE_SUFFIX,
+    ITEMS_PER_PAGE,
+    SORT_BY_ARTICLES
+)
+from core.backends import HttpBackend
+from core.pagination import ShardedPagination, plan_shards
+from configs.loggers import logger as log
+
+
+class AlJazeeraHttpBackend(HttpBackend):
+    """
+    Scrapes Al Jazeera search results from the JSON endpoint the search page itself calls.
+
+    Produces the same article records as the browser extraction (url, title, description
+    and image_src), so ``AlJazeeraScraper.extract_articles`` builds identical items.
+    Point ``api_url`` at a stub server to run against saved fixture responses.
+    """
+
+    # Search endpoint, overridable to serve fixtures locally
+    api_url = ALJAZEERA_SEARCH_API_URL
+
+    # The endpoint serves several editions, selected by this header
+    headers = {'wp-site': ALJAZEERA_SITE}
+
+    def run(self):
+        scraper = self.scraper
+
+        # Long windows fetch several pages at once, see `plan_shards`
+        shards = plan_shards(scraper.month)
+        pagination = ShardedPagination(self.fetch_page, shards, key_field='url', start_page=scraper.page + 1)
+        log.debug("Fetching {} pages at a time", shards)
+
+        for scraper.page, records in pagination.waves():
+            with log.contextualize(page=scraper.page):
+                log.debug("Current page={}", scraper.page)
+
+                # Drop articles past the stop date before extracting them, this wave is then the last one
+                records, reached_stop_date = scraper.split_at_stop_date(records)
+
+                # Pages are merged in order, sort the wave by date in case results shifted between pages
+                items = sorted(scraper.extract_articles(records), key=lambda item: item.publish_date, reverse=True)
+                for item in items:
+                    scraper.store_item(item)
+
+                if reached_stop_date:
+                    scraper.close_spider = True
+                if scraper.close_spider:
+                    log.info("Stop condition met.")
+                    return
+
+                # Periodically record the position so an interrupted run can resume from here
+                scraper.save_checkpoint()
+
+        log.info("No more articles.")
+
+    def fetch_page(self, page: int) -> List[dict]:
+        """
+        Fetches one page of search results.
+
+        Args:
+            page (int): Zero based page index.
+
+        Returns:
+            list: Article records of the page, empty when there are no more results.
+        """
+        variables = {
+            'query': self.scraper.search_phrase,
+            'start': page * ITEMS_PER_PAGE + 1,
+            'sort': SORT_BY_ARTICLES,
+        }
+        params = {
+            'wp-site': ALJAZEERA_SITE,
+            'operationName': ALJAZEERA_SEARCH_OPERATION,
+            'variables': json.dumps(variables, separators=(',', ':')),
+            'extensions': '{}',
+        }
+        with self.scraper.profiler.stage('fetch_page'):
+            payload = self.scraper.rate_limiter.call(
+                lambda: self.get_json(self.api_url, params=params), retryable=self.is_retryable
+            )
+        return self.parse_results(payload)
+
+    @staticmethod
+    def parse_results(payload: dict) -> List[dict]:
+        # Map the search response onto the records produced by the browser extraction
+        search_posts = (payload.get('data') or {}).get('searchPosts') or {}
+
+        records = []
+        for result in search_posts.get('items') or []:
+            pagemap = result.get('pagemap') or {}
+            images = pagemap.get('cse_image') or pagemap.get('cse_thumbnail') or [{}]
+
+            title = result.get('title') or ''
+            if title.endswith(ALJAZEERA_TITLE_SUFFIX):
+                title = title[:-len(ALJAZEERA_TITLE_SUFFIX)]
+
+            records.append({
+                'url': result.get('link'),
+                'title': title.strip(),
+                'description': ' '.join((result.get('snippet') or '').split()),
+                'image_src': images[0].get('src'),
+            })
+        return records
@@ -1,19 +1,33 @@
 import re
+from functools import lru_cache
+
+from bots.aljazeera_bot.constants import PHRASE_PATTERN_CACHE_SIZE
 from models import BaseItem
+from models.base import derived_property
+
+# Amounts of money such as $11.1, 11 dollars or 11 USD
+MONEY_PATTERN = re.compile(
+    r"\$\d+(\.\d{1,2})?|"
+    r"\d+\s+dollars?|"
+    r"\d+\s+USD"
+)
 
 
 class AljazeeraModel(BaseItem):
+    # No per-instance dict, the values live in BaseItem's slots and derived ones in these
+    __slots__ = ('_count_search_phrases', '_contains_money')
+
+    @staticmethod
+    @lru_cache(maxsize=PHRASE_PATTERN_CACHE_SIZE)
+    def phrase_pattern(search_phrase: str) -> re.Pattern:
+        # Compiled once per search phrase, matched literally and case-insensitively
+        return re.compile(re.escape(search_phrase), re.IGNORECASE)
 
-    @property
+    @derived_property
     def count_search_phrases(self) -> int:
-        search_phrases = re.findall(self.search_phrase, f"{self.title} {self.description}", re.IGNORECASE)
+        search_phrases = self.phrase_pattern(self.search_phrase).findall(f"{self.title} {self.description}")
         return len(search_phrases)
 
-    @property
+    @derived_property
     def contains_money(self) -> bool:
-        money_pattern = re.compile(
-            r"\$\d+(\.\d{1,2})?|"
-            r"\d+\s+dollars?|"
-            r"\d+\s+USD"
-        )
-        return bool(money_pattern.search(f"{self.title} {self.description}"))
+        return bool(MONEY_PATTERN.search(f"{self.title} {self.description}"))
@@ -29,3 +29,14 @@ class XpathSelectors:
     article_date_xpath = './div//span[@class="screen-reader-text"]'
     # XPath for the image of an individual article in the search results
     article_image_xpath = './div[@class="gc__image-wrap"]//img'
+    # XPath for the link to an individual article, its URL identifies the article
+    article_link_xpath = './div//h3[@class="gc__title"]/a'
+
+    # Fields read from every article in bulk, as (relative xpath, attribute) pairs.
+    # An empty attribute reads the element text.
+    article_fields = {
+        'url': (article_link_xpath, 'href'),
+        'title': (article_title_xpath, ''),
+        'description': (article_description_xpath, ''),
+        'image_src': (article_image_xpath, 'src'),
+    }
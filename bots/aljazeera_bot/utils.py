@@ -1,8 +1,96 @@
+import calendar
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 from dateutil.parser import parse as date_parser, ParserError
+from dateutil.relativedelta import relativedelta
+
+from bots.aljazeera_bot.constants import DATE_CACHE_SIZE
 from configs import logger as log
 
+# "2 hours ago", "an hour ago", "3 days ago"
+RELATIVE_DATE_PATTERN = re.compile(
+    r'^\s*(?:about\s+)?(an?|\d+)\s+(second|sec|minute|min|hour|hr|day|week|month|year)s?\s+ago\b', re.IGNORECASE
+)
+# "12 Jun 2024", "12 June, 2024"
+DAY_MONTH_YEAR_PATTERN = re.compile(r'^\s*(\d{1,2})\s+([a-z]{3,9})\.?,?\s+(\d{4})\b', re.IGNORECASE)
+# "Jun 12, 2024", "June 12 2024"
+MONTH_DAY_YEAR_PATTERN = re.compile(r'^\s*([a-z]{3,9})\.?\s+(\d{1,2}),?\s+(\d{4})\b', re.IGNORECASE)
+
+# Month number by lowercase full and abbreviated English name
+MONTHS = {
+    **{name.lower(): number for number, name in enumerate(calendar.month_name) if name},
+    **{name.lower(): number for number, name in enumerate(calendar.month_abbr) if name},
+    'sept': 9,
+}
+
+# Length of one relative unit
+RELATIVE_UNITS = {
+    'second': relativedelta(seconds=1),
+    'sec': relativedelta(seconds=1),
+    'minute': relativedelta(minutes=1),
+    'min': relativedelta(minutes=1),
+    'hour': relativedelta(hours=1),
+    'hr': relativedelta(hours=1),
+    'day': relativedelta(days=1),
+    'week': relativedelta(weeks=1),
+    'month': relativedelta(months=1),
+    'year': relativedelta(years=1),
+}
+
+
+def parse_relative_date(text: str, now: Optional[datetime] = None) -> datetime | None:
+    # Relative dates depend on the current time, so they are computed on every call
+    match = RELATIVE_DATE_PATTERN.match(text)
+    if not match:
+        return None
+
+    amount, unit = match.groups()
+    amount = 1 if amount.lower() in ('a', 'an') else int(amount)
+    return (now or datetime.now()) - RELATIVE_UNITS[unit.lower()] * amount
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_known_date(text: str) -> datetime | None:
+    """
+    Parses the absolute date formats of Al Jazeera.
+
+    Results are memoized, articles of the same day share their date string and these
+    formats never depend on the current date.
+    """
+    match = DAY_MONTH_YEAR_PATTERN.match(text)
+    if match:
+        day, month, year = match.groups()
+    else:
+        match = MONTH_DAY_YEAR_PATTERN.match(text)
+        month, day, year = match.groups() if match else (None, None, None)
+
+    month = MONTHS.get(month.lower()) if month else None
+    if month:
+        try:
+            return datetime(int(year), month, int(day))
+        except ValueError:
+            pass
+    return None
+
+
+def parse_absolute_date(text: str) -> datetime | None:
+    """Parses the absolute date formats of Al Jazeera, falling back to a fuzzy parse."""
+    date = parse_known_date(text)
+    if date:
+        return date
+
+    # Unknown format, let dateutil find a date in the text. Not memoized, dateutil fills in
+    # whatever the text leaves out (e.g. the year) from today's date.
+    try:
+        return date_parser(text, fuzzy=True)
+
+    except (ValueError, ParserError, OverflowError) as e:
+
+        log.error(f"Date not convertable {text}", exc_info=e)
+        return None
+
 
 def parse_date_string(text: str) -> datetime | None:
     """
@@ -19,20 +107,18 @@ def parse_date_string(text: str) -> datetime | None:
         None: This function handles exceptions internally and logs errors.
 
     Example:
-        get_date_obj("2 months ago")
-        datetime.datetime(2020, 1, 1, 0, 0)
+        parse_date_string("2 hours ago")
+        datetime.datetime(2024, 6, 12, 10, 0)
+
+        parse_date_string("12 Jun 2024")
+        datetime.datetime(2024, 6, 12, 0, 0)
 
-        get_date_obj("Invalid date string")
+        parse_date_string("Invalid date string")
         None
 
-    The function uses a fuzzy date parser to attempt to convert a given text string
-    into a datetime object. If the parsing fails, it logs an error and returns None.
+    Relative ("N units ago") and absolute ("DD Mon YYYY", "Mon DD, YYYY") dates are matched
+    with precompiled patterns. Other formats fall back to a fuzzy date parser; if that fails
+    too, an error is logged and None is returned.
     """
-    try:
-
-        return date_parser(text, fuzzy=True)
-
-    except (ValueError, ParserError) as e:
-
-        log.error(f"Date not convertable {text}", exc_info=e)
-        return None
+    text = (text or '').strip()
+    return parse_relative_date(text) or parse_absolute_date(text)
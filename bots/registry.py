@@ -0,0 +1,6 @@
+from bots.aljazeera_bot.bot import AlJazeeraScraper
+
+# Scrapers by the site name used in the SITES configuration, see `core.registry.resolve_sites`
+SCRAPERS = {
+    AlJazeeraScraper.site_name: AlJazeeraScraper,
+}
@@ -1,9 +1,11 @@
 from .loggers import logger, setup_logger
-from .workitem_configs import get_work_items
+from .workitem_configs import get_work_items, get_batch_work_items, get_batch_workers
 
 
 __all__ = [
     'logger',
     'setup_logger',
-    'get_work_items'
+    'get_work_items',
+    'get_batch_work_items',
+    'get_batch_workers'
 ]
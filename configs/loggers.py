@@ -1,22 +1,60 @@
 from loguru import logger
+import os
 import sys
 
+from constants import (
+    LOG_CONSOLE_LEVEL,
+    LOG_FILE_LEVEL,
+    LOG_ERROR_FILE_LEVEL,
+    LOG_ENQUEUE,
+    LOG_JSON,
+    DEFAULT_LOG_LEVEL,
+    DISABLED_LOG_LEVEL
+)
+
+
+def sink_level(name: str, default: str) -> str | None:
+    # Level of a sink from the environment, None when the sink is turned off
+    level = os.getenv(name, default).strip().upper()
+    return None if level == DISABLED_LOG_LEVEL else level
+
 
 def setup_logger(log_path):
+    """
+    Registers the console, application log and error log sinks.
+
+    Each sink's level is read from the environment (LOG_CONSOLE_LEVEL, LOG_FILE_LEVEL,
+    LOG_ERROR_FILE_LEVEL), "OFF" drops the sink. With LOG_ENQUEUE, the default, logging calls
+    only queue the message and a background thread writes it. With LOG_JSON every record is
+    written as a JSON object, including the run, page and article it was logged for.
+    """
+    # Imported here, the work item configs import this package
+    from configs.workitem_configs import to_bool
+
+    enqueue = to_bool(os.getenv(LOG_ENQUEUE, True))
+    serialize = to_bool(os.getenv(LOG_JSON, False))
+
     # Remove the default logger
     logger.remove()
-    # Add a logger that outputs to the console
     format = "{time} - {name} - {level} - {message}"
-    logger.add(sys.stdout, format=format, level="DEBUG")
+
+    # Add a logger that outputs to the console
+    console_level = sink_level(LOG_CONSOLE_LEVEL, DEFAULT_LOG_LEVEL)
+    if console_level:
+        logger.add(sys.stdout, format=format, level=console_level, enqueue=enqueue, serialize=serialize)
 
     # Add a logger that outputs to a file with rotation and compression
-    logger.add(
-        f"{log_path}/app.log", rotation="5 MB", retention="10 days", compression="zip", level="DEBUG",
-        format=format
-    )
+    file_level = sink_level(LOG_FILE_LEVEL, DEFAULT_LOG_LEVEL)
+    if file_level:
+        logger.add(
+            f"{log_path}/app.log", rotation="5 MB", retention="10 days", compression="zip", level=file_level,
+            format=format, enqueue=enqueue, serialize=serialize
+        )
 
     # Add a logger for errors only
-    logger.add(
-        f"{log_path}/error.log", level="ERROR", rotation="1 MB", retention="10 days",
-        format=format
-    )
+    error_level = sink_level(LOG_ERROR_FILE_LEVEL, "ERROR")
+    if error_level:
+        logger.add(
+            f"{log_path}/error.log", level=error_level, rotation="1 MB", retention="10 days",
+            format=format, enqueue=enqueue, serialize=serialize
+        )
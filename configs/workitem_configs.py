@@ -1,21 +1,96 @@
 import os
 from dataclasses import dataclass
-from typing import cast
+from typing import List, cast
 
 from RPA.Robocorp.WorkItems import WorkItems
 from robocorp.workitems import JSONType
 
-from constants import SEARCH_PHRASE, MONTH
+from constants import (
+    SEARCH_PHRASE,
+    SEARCH_PHRASES,
+    SEARCH_PHRASES_FILE,
+    MONTH,
+    SCRAPER_BACKEND,
+    DEFAULT_BACKEND,
+    EXPORT_FORMATS,
+    DEFAULT_EXPORT_FORMATS,
+    INCREMENTAL,
+    SEEN_INDEX_PATH,
+    DEFAULT_SEEN_INDEX_PATH,
+    IMAGE_STORE_PATH,
+    DEFAULT_IMAGE_STORE_PATH,
+    BATCH_WORKERS,
+    DEFAULT_BATCH_WORKERS,
+    BROWSER_PROFILE,
+    DEFAULT_BROWSER_PROFILE,
+    RESUME,
+    CHECKPOINT_MAX_AGE_HOURS,
+    DEFAULT_CHECKPOINT_MAX_AGE_HOURS,
+    ARCHIVE_FORMAT,
+    DEFAULT_ARCHIVE_FORMAT,
+    KEEP_IMAGES_FOLDER,
+    IMAGE_MAX_DIMENSION,
+    DEFAULT_IMAGE_MAX_DIMENSION,
+    IMAGE_FORMAT,
+    DEFAULT_IMAGE_FORMAT,
+    SITES,
+    DEFAULT_SITES
+)
+
+
+def to_bool(value) -> bool:
+    # Work items carry JSON booleans, environment variables carry strings
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
 
 
 @dataclass
 class WorkItemInputs:
     search_phrase: str
     month: int
+    backend: str = DEFAULT_BACKEND
+    export_formats: str = DEFAULT_EXPORT_FORMATS
+    incremental: bool = False
+    seen_index_path: str = DEFAULT_SEEN_INDEX_PATH
+    image_store_path: str = DEFAULT_IMAGE_STORE_PATH
+    browser_profile: str = DEFAULT_BROWSER_PROFILE
+    resume: bool = True
+    checkpoint_max_age_hours: float = DEFAULT_CHECKPOINT_MAX_AGE_HOURS
+    archive_format: str = DEFAULT_ARCHIVE_FORMAT
+    keep_images_folder: bool = True
+    image_max_dimension: int = DEFAULT_IMAGE_MAX_DIMENSION
+    image_format: str = DEFAULT_IMAGE_FORMAT
+    sites: str = DEFAULT_SITES
 
     def __str__(self):
         return f"{self.search_phrase}, {self.month} "
 
+    @classmethod
+    def from_payload(cls, workitems: JSONType) -> 'WorkItemInputs':
+        # Work item values take precedence over environment variables
+        return cls(
+            search_phrase=workitems.get(SEARCH_PHRASE, os.getenv(SEARCH_PHRASE)),
+            month=workitems.get(MONTH, os.getenv(MONTH)),
+            backend=workitems.get(SCRAPER_BACKEND, os.getenv(SCRAPER_BACKEND, DEFAULT_BACKEND)),
+            export_formats=workitems.get(EXPORT_FORMATS, os.getenv(EXPORT_FORMATS, DEFAULT_EXPORT_FORMATS)),
+            incremental=to_bool(workitems.get(INCREMENTAL, os.getenv(INCREMENTAL, False))),
+            seen_index_path=workitems.get(SEEN_INDEX_PATH, os.getenv(SEEN_INDEX_PATH, DEFAULT_SEEN_INDEX_PATH)),
+            image_store_path=workitems.get(IMAGE_STORE_PATH, os.getenv(IMAGE_STORE_PATH, DEFAULT_IMAGE_STORE_PATH)),
+            browser_profile=workitems.get(BROWSER_PROFILE, os.getenv(BROWSER_PROFILE, DEFAULT_BROWSER_PROFILE)),
+            resume=to_bool(workitems.get(RESUME, os.getenv(RESUME, True))),
+            checkpoint_max_age_hours=float(workitems.get(
+                CHECKPOINT_MAX_AGE_HOURS, os.getenv(CHECKPOINT_MAX_AGE_HOURS, DEFAULT_CHECKPOINT_MAX_AGE_HOURS)
+            )),
+            archive_format=workitems.get(ARCHIVE_FORMAT, os.getenv(ARCHIVE_FORMAT, DEFAULT_ARCHIVE_FORMAT)),
+            keep_images_folder=to_bool(workitems.get(KEEP_IMAGES_FOLDER, os.getenv(KEEP_IMAGES_FOLDER, True))),
+            image_max_dimension=int(
+                workitems.get(IMAGE_MAX_DIMENSION, os.getenv(IMAGE_MAX_DIMENSION, DEFAULT_IMAGE_MAX_DIMENSION))
+            ),
+            image_format=workitems.get(IMAGE_FORMAT, os.getenv(IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT)),
+            sites=workitems.get(SITES, os.getenv(SITES, DEFAULT_SITES))
+        )
+
 
 def get_work_items() -> WorkItemInputs:
 
@@ -28,7 +103,35 @@ def get_work_items() -> WorkItemInputs:
         return work_items.get_work_item_payload()
 
     workitems = load_work_items()
-    return WorkItemInputs(
-        search_phrase=workitems.get(SEARCH_PHRASE, os.getenv(SEARCH_PHRASE)),
-        month=workitems.get(MONTH, os.getenv(MONTH))
-    )
+    return WorkItemInputs.from_payload(workitems)
+
+
+def get_batch_work_items() -> List[WorkItemInputs]:
+    """
+    Loads every search to run in a batch.
+
+    In production all input work items are consumed, one search per work item. Locally the
+    phrases are read from SEARCH_PHRASES (separated by ";") or from the file at
+    SEARCH_PHRASES_FILE (one phrase per line), falling back to the single SEARCH_PHRASE.
+    MONTH, SCRAPER_BACKEND, EXPORT_FORMATS and SITES apply to every phrase unless a work item overrides them.
+    """
+
+    def load_work_items() -> List[JSONType]:
+        if os.getenv('ENVIRONMENT') == 'PROD':
+            work_items = WorkItems()
+            return work_items.for_each_input_work_item(work_items.get_work_item_payload)
+
+        if os.getenv(SEARCH_PHRASES_FILE):
+            with open(os.getenv(SEARCH_PHRASES_FILE), encoding='utf-8') as phrases_file:
+                phrases = phrases_file.read().splitlines()
+        else:
+            phrases = os.getenv(SEARCH_PHRASES, os.getenv(SEARCH_PHRASE) or '').split(';')
+
+        return [{SEARCH_PHRASE: phrase.strip()} for phrase in phrases if phrase.strip()]
+
+    return [WorkItemInputs.from_payload(workitems) for workitems in load_work_items()]
+
+
+def get_batch_workers() -> int:
+    # Number of searches scraped in parallel by the batch runner
+    return int(os.getenv(BATCH_WORKERS, DEFAULT_BATCH_WORKERS))
@@ -1,9 +1,146 @@
 SEARCH_PHRASE = 'SEARCH_PHRASE'
 MONTH = 'MONTH'
-CONFIG_KEYS = [SEARCH_PHRASE, MONTH]
+SCRAPER_BACKEND = 'SCRAPER_BACKEND'
+EXPORT_FORMATS = 'EXPORT_FORMATS'
+INCREMENTAL = 'INCREMENTAL'
+SEEN_INDEX_PATH = 'SEEN_INDEX_PATH'
+IMAGE_STORE_PATH = 'IMAGE_STORE_PATH'
+SEARCH_PHRASES = 'SEARCH_PHRASES'
+SEARCH_PHRASES_FILE = 'SEARCH_PHRASES_FILE'
+BATCH_WORKERS = 'BATCH_WORKERS'
+BROWSER_PROFILE = 'BROWSER_PROFILE'
+RESUME = 'RESUME'
+CHECKPOINT_MAX_AGE_HOURS = 'CHECKPOINT_MAX_AGE_HOURS'
+ARCHIVE_FORMAT = 'ARCHIVE_FORMAT'
+KEEP_IMAGES_FOLDER = 'KEEP_IMAGES_FOLDER'
+IMAGE_MAX_DIMENSION = 'IMAGE_MAX_DIMENSION'
+IMAGE_FORMAT = 'IMAGE_FORMAT'
+SITES = 'SITES'
+LOG_CONSOLE_LEVEL = 'LOG_CONSOLE_LEVEL'
+LOG_FILE_LEVEL = 'LOG_FILE_LEVEL'
+LOG_ERROR_FILE_LEVEL = 'LOG_ERROR_FILE_LEVEL'
+LOG_ENQUEUE = 'LOG_ENQUEUE'
+LOG_JSON = 'LOG_JSON'
+CONFIG_KEYS = [
+    SEARCH_PHRASE, MONTH, SCRAPER_BACKEND, EXPORT_FORMATS, INCREMENTAL, SEEN_INDEX_PATH, IMAGE_STORE_PATH,
+    BROWSER_PROFILE, RESUME, CHECKPOINT_MAX_AGE_HOURS, ARCHIVE_FORMAT, KEEP_IMAGES_FOLDER, IMAGE_MAX_DIMENSION,
+    IMAGE_FORMAT, SITES
+]
 
 IMAGES_FOLDER_NAME = 'images'
 EXCEL_FILE_PREFIX = 'news'
 SHEET_NAME = "News"
+PARTIAL_FILE_SUFFIX = '.partial.csv'
+
+# Output files
+DEFAULT_EXPORT_FORMATS = 'xlsx'
+EXPORT_FLUSH_EVERY = 50
+PARQUET_ROW_GROUP_SIZE = 1000
 DEFAULT_OUTPUT_DIRECTORY = 'output'
+SUMMARY_FILE_PREFIX = 'summary'
+STATE_DIRECTORY = 'state'
+PROFILE_FILE_PREFIX = 'profile'
+# Upper bounds in seconds of the profile histogram buckets, the last bucket holds anything slower
+PROFILE_HISTOGRAM_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
 WAIT_TIMEOUT = 10
+
+# Logging, a sink whose level is OFF is not registered
+DEFAULT_LOG_LEVEL = 'DEBUG'
+DISABLED_LOG_LEVEL = 'OFF'
+
+# Element waits, timeouts of optional elements are learned per selector from recent runs
+WAIT_MIN_TIMEOUT = 2
+WAIT_OPTIONAL_TIMEOUT = 2
+WAIT_PAGE_BUDGET = 60
+WAIT_SCRIPT_SLICE = 3
+WAIT_HISTORY_SIZE = 20
+WAIT_MIN_SAMPLES = 5
+WAIT_ADAPTIVE_FACTOR = 3
+WAIT_TIMINGS_PATH = f'{STATE_DIRECTORY}/wait_timings.json'
+
+# Image download pool
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_PER_HOST_LIMIT = 4
+DOWNLOAD_MAX_RETRIES = 3
+DOWNLOAD_BACKOFF_FACTOR = 0.5
+DOWNLOAD_TIMEOUT = 30
+
+# Image post-processing, disabled while the maximum dimension is 0
+DEFAULT_IMAGE_MAX_DIMENSION = 0
+DEFAULT_IMAGE_FORMAT = 'webp'
+IMAGE_QUALITY = 80
+IMAGE_PROCESS_WORKERS = 2
+
+# Image archive, written as downloads complete
+DEFAULT_ARCHIVE_FORMAT = 'zip'
+# Already compressed formats, stored in zip archives without deflating them again
+STORED_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+# Persistent image store shared across runs
+DEFAULT_IMAGE_STORE_PATH = f'{STATE_DIRECTORY}/images'
+IMAGE_STORE_MAX_MB = 1024
+
+# Browser-less HTTP backend
+DEFAULT_BACKEND = 'browser'
+HTTP_TIMEOUT = 30
+HTTP_POOL_SIZE = 10
+HTTP_USER_AGENT = (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+)
+
+# Browser profiles
+DEFAULT_BROWSER_PROFILE = 'default'
+FAST_BROWSER_WINDOW_SIZE = (1280, 800)
+# Requests the fast profile never makes: fonts, media and third-party ads and analytics
+BLOCKED_BROWSER_URLS = (
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*', '*google-analytics.com*',
+    '*googletagservices.com*', '*adservice.google.com*', '*amazon-adsystem.com*', '*scorecardresearch.com*',
+    '*chartbeat.com*', '*chartbeat.net*', '*facebook.net*', '*connect.facebook.com*', '*platform.twitter.com*',
+    '*taboola.com*', '*outbrain.com*', '*brightcove.net*', '*youtube.com/embed*', '*hotjar.com*',
+)
+
+# Parallel pagination of long search windows
+MONTHS_PER_SHARD = 1
+MAX_PAGINATION_SHARDS = 4
+
+# Batch runner
+DEFAULT_BATCH_WORKERS = 2
+
+# Sites scraped for every search phrase, and the default limits of each site
+DEFAULT_SITES = 'aljazeera'
+SITE_MAX_SEARCHES = 2
+
+# Adaptive request rate of a site in requests per second, raised additively and cut multiplicatively
+RATE_INITIAL = 4.0
+RATE_MIN = 0.2
+RATE_MAX = 20.0
+RATE_BURST = 4
+RATE_INCREASE = 0.5
+RATE_DECREASE_FACTOR = 0.5
+RATE_DECREASE_COOLDOWN = 2.0
+# A response is slow past this many seconds and this many times the usual latency
+RATE_SLOW_RESPONSE = 5.0
+RATE_SLOW_FACTOR = 3
+RATE_LATENCY_SMOOTHING = 0.2
+RATE_MAX_RETRIES = 3
+# Status codes worth retrying, everything else in the 4xx range is final
+RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+# Browser pool
+BROWSER_POOL_MAX_USES = 20
+BROWSER_POOL_MAX_MEMORY_GROWTH_MB = 300
+# Seconds a scraper waits for an idle pooled browser before giving up
+BROWSER_POOL_ACQUIRE_TIMEOUT = 300
+
+# Incremental runs
+DEFAULT_SEEN_INDEX_PATH = f'{STATE_DIRECTORY}/seen_articles.sqlite3'
+SEEN_INDEX_COMMIT_EVERY = 50
+SEEN_STOP_AFTER = 3
+
+# Checkpoints of interrupted runs
+CHECKPOINT_DIRECTORY = f'{STATE_DIRECTORY}/checkpoints'
+CHECKPOINT_EVERY_PAGES = 5
+# Older checkpoints are ignored, the site's results have moved on since, 0 resumes at any age
+DEFAULT_CHECKPOINT_MAX_AGE_HOURS = 24
@@ -0,0 +1,144 @@
+import io
+import os
+import tarfile
+import threading
+import zipfile
+
+from constants import STORED_IMAGE_EXTENSIONS
+from configs import logger as log
+
+
+class ImageArchive:
+    """
+    Archive that images are appended to as soon as they are downloaded.
+
+    Zip archives store already compressed image formats as they are and deflate anything
+    else. Tar archives are written as an uncompressed stream, a resumed run copies the members
+    of the interrupted run's tar into its new stream. Downloads complete on several threads,
+    so every write goes through a lock.
+
+    Example:
+        archive = ImageArchive("output/images.zip")
+        archive.add("output/images/a.jpg")
+        archive.close()
+    """
+
+    # Supported archive formats by file extension
+    formats = ('zip', 'tar')
+
+    def __init__(self, path: str, archive_format: str = 'zip', resume: bool = False):
+        self.path = path
+        self.archive_format = archive_format
+        self.members = 0
+        # Names already in the archive, a resumed run may download the same image again
+        self.names = set()
+        self._lock = threading.Lock()
+
+        if archive_format == 'zip':
+            self.archive = self.open_zip(resume)
+        else:
+            self.archive = self.open_tar(resume)
+
+    @staticmethod
+    def can_resume(path: str, archive_format: str) -> bool:
+        """
+        Whether a resumed run can keep every image archived at ``path`` by the interrupted run.
+
+        Tars are copied up to the last complete member. A zip is only readable once it was
+        closed, a run killed while writing it leaves an archive that can't be appended to.
+        """
+        if archive_format != 'zip' or not os.path.exists(path):
+            return True
+        return zipfile.is_zipfile(path)
+
+    def open_zip(self, resume: bool) -> zipfile.ZipFile:
+        # A zip closed by a previous run of the same search can be appended to
+        if resume and os.path.exists(self.path):
+            try:
+                archive = zipfile.ZipFile(self.path, 'a')
+                self.names = set(archive.namelist())
+                self.members = len(self.names)
+                return archive
+            except zipfile.BadZipFile:
+                log.warning(f"Archive {self.path} of the interrupted run is incomplete, writing a new one")
+
+        return zipfile.ZipFile(self.path, 'w')
+
+    def open_tar(self, resume: bool) -> tarfile.TarFile:
+        # Stream mode only ever writes a new tar, a resumed run moves the previous one aside and copies it over.
+        # A copy left aside by a resume that was itself interrupted is the complete one.
+        previous = f'{self.path}.previous'
+        if resume and os.path.exists(self.path) and not os.path.exists(previous):
+            os.replace(self.path, previous)
+
+        archive = tarfile.open(self.path, 'w|')
+        if resume and os.path.exists(previous):
+            self.copy_members(previous, archive)
+            os.remove(previous)
+        return archive
+
+    def copy_members(self, source: str, archive: tarfile.TarFile):
+        try:
+            with tarfile.open(source, 'r|') as previous:
+                for member in previous:
+                    # Read in full first, a member cut short by a killed run is never half written
+                    data = previous.extractfile(member).read() if member.isfile() else None
+                    if member.isfile() and len(data) < member.size:
+                        break
+                    archive.addfile(member, io.BytesIO(data) if data is not None else None)
+                    self.names.add(member.name)
+                    self.members += 1
+
+        except (tarfile.TarError, EOFError, OSError) as e:
+            log.warning(f"Archive {self.path} of the interrupted run is incomplete, {self.members} images kept: {e}")
+
+    def add_folder(self, folder: str, remove: bool = False):
+        """
+        Archives the images an interrupted run left in ``folder``, skipping those already archived.
+
+        Args:
+            folder (str): Images folder of the interrupted run.
+            remove (bool, optional): Delete the images once archived, when the folder isn't kept.
+        """
+        for name in sorted(os.listdir(folder)):
+            path = os.path.join(folder, name)
+            if name.endswith('.partial') or not os.path.isfile(path):
+                continue
+            self.add(path)
+            if remove:
+                os.remove(path)
+
+    def add(self, file_path: str, arcname: str = None) -> str:
+        """
+        Appends a file to the archive.
+
+        Returns:
+            str: The name of the file in the archive.
+        """
+        arcname = arcname or os.path.basename(file_path)
+
+        with self._lock:
+            if arcname in self.names:
+                return arcname
+            self.names.add(arcname)
+
+            if self.archive_format == 'zip':
+                stored = os.path.splitext(arcname)[1].lower() in STORED_IMAGE_EXTENSIONS
+                self.archive.write(
+                    file_path, arcname, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+                )
+            else:
+                self.archive.add(file_path, arcname)
+            self.members += 1
+
+        return arcname
+
+    def close(self):
+        with self._lock:
+            self.archive.close()
+
+        # Don't leave an empty archive behind
+        if not self.members and os.path.exists(self.path):
+            os.remove(self.path)
+            return
+        log.info(f"Images archived at {self.path}")
@@ -0,0 +1,113 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from constants import HTTP_TIMEOUT, HTTP_POOL_SIZE, HTTP_USER_AGENT, RETRY_STATUS_CODES
+
+
+class BaseBackend:
+    """
+    Drives a scraper through a website, subclasses decide how pages are fetched.
+
+    A backend is created per run by ``BaseScraper.main`` which calls ``start``, ``run``
+    and finally ``stop``. Items are handed back to the scraper through ``store_item``.
+    """
+
+    # Name used to select the backend from the configuration
+    name = ""
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+
+    def start(self, link: str):
+        """Prepare the backend for scraping, starting at ``link``."""
+
+    def run(self):
+        """Scrape the website until a stop condition is met."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def stop(self):
+        """Release any resources held by the backend."""
+
+
+class BrowserBackend(BaseBackend):
+    # Scrapes through a real browser with RPA.Browser.Selenium, borrowed from a pool if one is set
+
+    name = "browser"
+
+    def __init__(self, scraper):
+        super().__init__(scraper)
+        # Browser borrowed from the scraper's pool, if any
+        self.lease = None
+
+    def start(self, link: str):
+        pool = self.scraper.browser_pool
+        if pool is None:
+            self.scraper.open_browser(link)
+        else:
+            # A pooled browser is already warm and waiting at the start page
+            with self.scraper.profiler.stage('acquire_browser'):
+                self.lease = pool.acquire()
+            self.scraper.browser = self.lease.browser
+            self.scraper.browser_is_warm = self.lease.warm
+
+        # Time every WebDriver command of the run
+        self.scraper.profiler.instrument_webdriver(self.scraper.browser.driver)
+
+    def run(self):
+        self.scraper.parse()
+
+    def stop(self):
+        if self.lease is None:
+            # Closes all browser instances
+            self.scraper.browser.close_all_browsers()
+            return
+
+        # Hand the browser back to the pool, ready for the next search
+        self.scraper.browser_pool.release(self.lease, reset=self.scraper.reset_browser)
+        self.lease = None
+
+
+class HttpBackend(BaseBackend):
+    """
+    Scrapes by requesting the site's data endpoints directly, without starting a browser.
+
+    All requests share one pooled keep-alive session. Subclasses implement ``run`` using
+    ``get_json``/``get_text`` and hand the records to the scraper.
+    """
+
+    name = "http"
+
+    # Extra headers sent with every request
+    headers = {}
+
+    def __init__(self, scraper):
+        super().__init__(scraper)
+
+        # Shared session keeps connections alive between pages
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': HTTP_USER_AGENT, **self.headers})
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        # Send a GET request, raising on HTTP errors
+        response = self.session.get(url, timeout=HTTP_TIMEOUT, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def get_json(self, url: str, **kwargs):
+        return self.get(url, **kwargs).json()
+
+    def get_text(self, url: str, **kwargs) -> str:
+        return self.get(url, **kwargs).text
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        # Connection errors, timeouts, throttling and server errors, see `RateLimiter.call`
+        if not isinstance(error, requests.RequestException):
+            return False
+        return error.response is None or error.response.status_code in RETRY_STATUS_CODES
+
+    def stop(self):
+        self.session.close()
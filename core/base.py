@@ -1,157 +1,459 @@
+import hashlib
 import os
+import time
+from collections import deque
+from concurrent.futures import Future, wait
 from datetime import datetime, timedelta
+from urllib.parse import urlparse
 
 from RPA.Browser.Selenium import Selenium
-from RPA.Excel.Files import Files
-from RPA.HTTP import HTTP
-from RPA.Archive import Archive
 from robocorp.tasks import get_output_dir
+from requests import RequestException
 from selenium.common import NoSuchElementException, ElementNotVisibleException, TimeoutException, WebDriverException
 
-from constants import IMAGES_FOLDER_NAME, SHEET_NAME, EXCEL_FILE_PREFIX, DEFAULT_OUTPUT_DIRECTORY, WAIT_TIMEOUT
+from constants import (
+    IMAGES_FOLDER_NAME,
+    EXCEL_FILE_PREFIX,
+    DEFAULT_OUTPUT_DIRECTORY,
+    WAIT_TIMEOUT,
+    SEEN_STOP_AFTER,
+    CHECKPOINT_DIRECTORY,
+    CHECKPOINT_EVERY_PAGES,
+    PROFILE_FILE_PREFIX,
+    DEFAULT_ARCHIVE_FORMAT,
+    DEFAULT_IMAGE_FORMAT,
+    SITE_MAX_SEARCHES,
+    RATE_MAX
+)
+from core.archives import ImageArchive
+from core.backends import BrowserBackend
+from core.browser_profiles import BROWSER_PROFILES
+from core.checkpoint import Checkpoint, CheckpointStore
+from core.cursor import ResultsCursor
+from core.downloads import ImageDownloader
+from core.exporters import EXPORTERS
+from core.image_store import ImageStore
+from core.images import ImageFile, ImageProcessor
+from core.profiler import RunProfiler, profiled
+from core.rate_limits import RateLimiter
 from core.exceptions import ScraperStopException
+from core.seen_index import SeenIndex
+from core.utils import chain_future, slugify
+from core.waits import WaitEngine, WaitTimings
+from models.base import resolve_value
 from configs import logger as log
 
 
 class StorageMixin:
     # Class variables shared among all instances
 
-    # List to store scraped data items
-    scraped_data = []
-
     # Name of the bot (can be set by subclasses or instances)
     bot_name = ""
 
-    # Timestamp to create unique folder and file names
-    start_time = datetime.now()
+    # Key of the site in the scraper registry, names the run's files and fills the items' source
+    site_name = ""
+
+    # Output formats this scraper can export to, keyed by the configured format name
+    exporters = EXPORTERS
+
+    # Index of articles scraped by previous runs, only set in incremental mode
+    seen_index = None
+
+    # Folder of the persistent image store shared across runs, disabled when empty
+    image_store_path = None
+
+    # Model of the scraped items, lets a resumed run reopen its output files before any new item
+    item_class = None
+
+    # Format of the images archive, and whether the loose images folder is kept next to it
+    archive_format = DEFAULT_ARCHIVE_FORMAT
+    keep_images_folder = True
+
+    # Adaptive request rate of the site, shared with its page loads
+    rate_limiter = None
+
+    # Largest width or height of processed images and their format, images are kept as served when 0
+    image_max_dimension = 0
+    image_format = DEFAULT_IMAGE_FORMAT
+
+    def __init__(self, downloader=None, start_time=None, resuming=False, image_processor=None):
+
+        # Number of scraped items, kept per instance so several scrapers can run in one process
+        self.items_scraped = 0
+
+        # Scraped items waiting for their images before being exported, in scraping order
+        self.pending_items = deque()
+
+        # Exporters streaming rows to the output files, created with the first item
+        self.active_exporters = []
+
+        # Rows kept from the output files of an interrupted run when the exporters are opened
+        self.resume_rows = 0
+
+        # Timestamp to create unique folder and file names, a resumed run keeps the original one
+        self.start_time = start_time or datetime.now()
+
+        # Time spent in each stage of the run
+        self.profiler = RunProfiler()
 
-    def __init__(self):
+        # Thread pool for downloading images in the background, possibly shared with other scrapers
+        self.owns_downloader = downloader is None
+        self.downloader = downloader or ImageDownloader(
+            store=ImageStore(self.image_store_path) if self.image_store_path else None
+        )
 
-        # Files utility for handling Excel operations
-        self.excel = Files()
+        # Process pool resizing downloaded images, possibly shared with other scrapers
+        self.owns_image_processor = image_processor is None and bool(self.image_max_dimension)
+        self.image_processor = image_processor
+        if self.owns_image_processor:
+            self.image_processor = ImageProcessor(self.image_max_dimension, self.image_format)
 
-        # HTTP utility for downloading images
-        self.http = HTTP()
+        # Pending image downloads, awaited before archiving
+        self.image_downloads = []
+
+        # Image of every URL scheduled in this run, articles sharing an image share its download
+        self.images_by_url = {}
 
         # configure file paths
         self._initialize_paths()
 
+        # Images are appended to the archive as soon as they are downloaded
+        self.image_archive = ImageArchive(self.archive_path, self.archive_format, resume=resuming)
+
+        # Images a resumed run downloaded before its checkpoint, without the folder only those not archived yet are left
+        if resuming:
+            self.image_archive.add_folder(self.images_folder, remove=not self.keep_images_folder)
+
     def _initialize_paths(self):
 
-        # Directory to store downloaded images, with a unique timestamp
         output_dir = get_output_dir() if get_output_dir() else DEFAULT_OUTPUT_DIRECTORY
-        self.images_folder = f'{output_dir}/{IMAGES_FOLDER_NAME}-{self.start_time.isoformat()}'
+        suffix = self.build_run_suffix(self.start_time)
+
+        # Identifies the run in structured logs, a resumed run keeps the original one
+        self.run_id = suffix
+
+        # Directory to store downloaded images, with a unique timestamp
+        self.images_folder = f'{output_dir}/{IMAGES_FOLDER_NAME}-{suffix}'
 
         # Create the image folder if it doesn't exist
         os.makedirs(self.images_folder, exist_ok=True)
 
         # Directory to store archived images.
-        self.archive_path = f'{output_dir}/{IMAGES_FOLDER_NAME}-{self.start_time.isoformat()}.zip'
+        self.archive_path = self.build_archive_path(self.start_time)
+
+        # Run profile reports, without extension
+        self.profile_path = f'{output_dir}/{PROFILE_FILE_PREFIX}-{suffix}'
 
-        # Path to save the Excel file, with a unique timestamp
-        self.excel_path = f'{output_dir}/{EXCEL_FILE_PREFIX}-{self.start_time.isoformat()}.xlsx'
+        # Paths to save the output files, with a unique timestamp
+        self.output_paths = {name: self.build_output_path(name, self.start_time) for name in self.export_formats}
+
+    def build_run_suffix(self, start_time):
+        # Unique per site, search phrase and run, so concurrent runs don't overwrite each other
+        return '-'.join(filter(None, (self.site_name, slugify(self.search_phrase), start_time.isoformat())))
+
+    def build_archive_path(self, start_time):
+        output_dir = get_output_dir() if get_output_dir() else DEFAULT_OUTPUT_DIRECTORY
+        return f'{output_dir}/{IMAGES_FOLDER_NAME}-{self.build_run_suffix(start_time)}.{self.archive_format}'
+
+    def build_output_path(self, name, start_time):
+        output_dir = get_output_dir() if get_output_dir() else DEFAULT_OUTPUT_DIRECTORY
+        suffix = self.build_run_suffix(start_time)
+        return f'{output_dir}/{EXCEL_FILE_PREFIX}-{suffix}.{self.exporters[name].extension}'
 
     def download_image(self, url):
 
-        # Construct local path for the image
-        image_file = os.path.join(self.images_folder, os.path.basename(url))
+        # Each URL is downloaded, processed and archived once, repeats wait for the same image
+        if url in self.images_by_url:
+            return self.images_by_url[url]
 
-        # Download the image
-        self.http.download(url, image_file)
+        # Construct local path for the image, unique per URL so same-named images don't collide
+        url_digest = hashlib.sha1(url.encode()).hexdigest()[:10]
+        image_file = os.path.join(self.images_folder, f'{url_digest}-{os.path.basename(urlparse(url).path)}')
 
-        # Return the local path of the downloaded image
-        return image_file
+        # Schedule the download, the item resolves its image path from the future on export
+        future = self.downloader.submit(url, image_file, rate_limiter=self.rate_limiter)
 
-    def archive_image(self):
-        # Method to archive the images folder into a zip file
+        # Time from scheduling to completion, including time queued behind other downloads
+        started = time.monotonic()
+        future.add_done_callback(lambda _: self.profiler.record('download_image', time.monotonic() - started))
 
-        # Don't archive if no images found
-        if not os.listdir(self.images_folder):
-            return
+        # Process and archive the image right after its download, resolves to the final ImageFile
+        image = Future()
+        future.add_done_callback(lambda download: self.process_downloaded_image(download, image))
+        self.image_downloads.append(image)
+        self.images_by_url[url] = image
+        return image
 
-        # Initialize Archive utility
-        lib = Archive()
+    def process_downloaded_image(self, download, image):
+        # Runs on the download thread as soon as an image is saved, `image` must always get a result
+        try:
+            path = download.result()
+            if not path:
+                image.set_result(None)
+                return
+
+            if not self.image_processor:
+                self.archive_downloaded_image(ImageFile.from_path(path), image)
+                return
+
+            started = time.monotonic()
+            processed = self.image_processor.submit(path)
+            processed.add_done_callback(lambda done: self.archive_processed_image(done, path, image, started))
+
+        except Exception as e:  # Never leave the item waiting on its image
+            log.error(f"Image could not be handled after its download: {e}")
+            if not image.done():
+                image.set_result(None)
+
+    def archive_processed_image(self, processed, path, image, started):
+        self.profiler.record('process_image', time.monotonic() - started)
+        try:
+            image_file = processed.result()
+        except Exception as e:  # Any failure of the worker keeps the image as downloaded
+            log.error(f"Image could not be processed {path}: {e}")
+            image_file = ImageFile.from_path(path)
 
-        # Archive the images folder
-        lib.archive_folder_with_zip(self.images_folder, self.archive_path)
+        self.archive_downloaded_image(image_file, image)
 
-    def convert_to_excel(self):
-        """Convert the collected data to an Excel file."""
+    def archive_downloaded_image(self, image_file, image):
+        try:
+            arcname = self.image_archive.add(image_file.path)
 
-        if not self.scraped_data:
-            log.warning("No data available to compile in Excel File.")  # Log a warning if no data is available
-            # If no data is scraped, return early
-            return
+            # Without the loose folder the image only lives in the archive
+            if not self.keep_images_folder:
+                os.remove(image_file.path)
+                image_file = image_file._replace(path=os.path.join(self.archive_path, arcname))
 
-        self.excel.create_workbook(fmt='xlsx', path=self.excel_path, sheet_name=SHEET_NAME)
+        except Exception as e:  # The image stays on disk, un-archived
+            log.error(f"Image could not be archived {image_file.path}: {e}")
 
-        # Get attribute names of the first data item as headers
-        headers = self.scraped_data[0].get_headers()
+        finally:
+            if not image.done():
+                image.set_result(image_file)
 
-        # Append headers to the Excel sheet
-        self.excel.append_rows_to_worksheet(headers, SHEET_NAME)
+    @staticmethod
+    def image_fields(image):
+        """
+        Item fields of an image download, each resolving once the image is processed and archived.
 
-        for article in self.scraped_data:
-            # Prepare a row for each article
-            row = list(article.load_items().values())
+        Args:
+            image (Future, optional): Future returned by ``download_image``, None if the article has no image.
+
+        Returns:
+            dict: Keyword arguments for the item model.
+        """
+        if image is None:
+            return {'image_path': None}
+
+        return {
+            'image_path': chain_future(image, lambda image_file: image_file and image_file.path),
+            'image_width': chain_future(image, lambda image_file: image_file and image_file.width),
+            'image_height': chain_future(image, lambda image_file: image_file and image_file.height),
+            'image_bytes': chain_future(image, lambda image_file: image_file and image_file.size),
+        }
+
+    @profiled()
+    def wait_for_downloads(self):
+        # Block until every image download of this scraper has finished
+        wait(self.image_downloads)
+
+        # A shared downloader is shut down by its owner
+        if self.owns_downloader:
+            self.downloader.shutdown()
+        if self.owns_image_processor:
+            self.image_processor.shutdown()
+
+    @profiled()
+    def archive_image(self):
+        # Images were archived as their downloads completed, only the archive is left to finish
+        self.image_archive.close()
+
+        if not self.keep_images_folder and not os.listdir(self.images_folder):
+            os.rmdir(self.images_folder)
+
+    def export_ready_items(self, wait_for_all=False):
+        """
+        Writes scraped items to the output files as soon as their images are downloaded.
 
-            # Append the row to the Excel sheet
-            self.excel.append_rows_to_worksheet([row], SHEET_NAME)
+        Args:
+            wait_for_all (bool, optional): Block until every pending item can be written. Default is False.
+        """
+        while self.pending_items and (wait_for_all or self.pending_items[0].is_resolved()):
+            item = self.pending_items.popleft()
+
+            # Headers and column types are computed once from the model class
+            if not self.active_exporters:
+                self.open_exporters(type(item))
+
+            row = item.to_tuple()
+            for exporter in self.active_exporters:
+                exporter.write(row)
+
+            # Remember exported articles for the next incremental run
+            if self.seen_index:
+                self.seen_index.add(item.search_phrase, item.get_key(), resolve_value(item.image_path))
+
+    def open_exporters(self, item_class):
+        # Start streaming to every output file, keeping the rows of an interrupted run
+        headers = item_class.get_headers()
+        column_types = item_class.get_column_types()
+        self.active_exporters = [
+            self.exporters[name](path, headers, resume_rows=self.resume_rows, column_types=column_types)
+            for name, path in self.output_paths.items()
+        ]
+        self.resume_rows = 0
+
+    @profiled()
+    def close_exporters(self):
+        """Write the remaining items and close every output file."""
+
+        self.export_ready_items(wait_for_all=True)
+
+        if not self.active_exporters:
+            log.warning("No data available to compile in output files.")  # Log a warning if no data is available
+            # If no data is scraped, return early
+            return
 
-        # Save the Excel workbook
-        self.excel.save_workbook()
-        log.info(f"Excel file generated at {self.excel_path}")
+        for exporter in self.active_exporters:
+            exporter.close()
 
     def store_item(self, item):
-        # Method to store a scraped item in the class variable list
-        self.scraped_data.append(item)  # Add the item to the scraped_data list
+        # Queue the item for export, it is written once its image download completes
+        self.items_scraped += 1
+        item.source = item.source or self.site_name
+        self.pending_items.append(item)
+        self.export_ready_items()
 
     def share_stats(self):
-        scraped_content = len(self.scraped_data)
-        log.info(f"Total scraped content: {scraped_content}")
+        log.info(f"Total scraped content: {self.items_scraped}")
 
     def close_browser(self):
 
         # Log scraped items
         self.share_stats()
 
+        # Finish pending image downloads
+        self.wait_for_downloads()
+
         # archive images folder
         self.archive_image()
 
-        # Compile Excel file for the scraped items.
-        self.convert_to_excel()  # Convert scraped data to Excel and save it
+        # Complete the output files for the scraped items.
+        self.close_exporters()
+
+        if self.seen_index:
+            self.seen_index.close()
+
+        # Report where the run spent its time, and the request rate the site ended up allowing
+        metrics = self.rate_limiter.metrics() if self.rate_limiter else None
+        if metrics:
+            log.info(f"Request rate of {self.site_name or self.bot_name}: {metrics}")
+        self.profiler.write(self.profile_path, title=self.search_phrase, metrics=metrics)
 
 
 class BaseScraper(StorageMixin):
 
-    def __init__(self, config=None):
-        """Initialize the BaseScraper with necessary components."""
+    # Backends this scraper can run with, keyed by the configured backend name
+    backends = {BrowserBackend.name: BrowserBackend}
+
+    # Ways to launch the browser, keyed by the configured profile name
+    browser_profiles = BROWSER_PROFILES
+
+    # Politeness limits of the site: searches run at once by the batch runner and requests per second
+    max_concurrent_searches = SITE_MAX_SEARCHES
+    max_request_rate = RATE_MAX
+
+    def __init__(self, config=None, browser_pool=None, downloader=None, image_processor=None, rate_limiter=None):
+        """
+        Initialize the BaseScraper with necessary components.
+
+        Args:
+            config (WorkItemInputs): Search phrase, month and backend to scrape with.
+            browser_pool (BrowserPool, optional): Pool of warm browsers shared with other scrapers.
+            downloader (ImageDownloader, optional): Image download pool shared with other scrapers.
+            image_processor (ImageProcessor, optional): Image processing pool shared with other scrapers.
+            rate_limiter (RateLimiter, optional): Request rate shared with other scrapers of the same site.
+        """
         self.month = None
         self.search_phrase = None
+        self.backend_name = None
+        self.backend = None
+        self.export_formats = []
+        self.browser_profile = None
+
+        # Exception that ended the run, if any
+        self.error = None
 
+        # Flag to indicate when to stop scraping
+        self.close_spider = False
+
+        # Articles in a row already scraped by a previous run
+        self.seen_streak = 0
+
+        # Crawl position: last page scraped and how far the results list has been read
+        self.page = -1
+        self.cursor = ResultsCursor()
+
+        # Paces page loads and image downloads, shared by every scraper of the site in a batch
+        self.rate_limiter = rate_limiter or RateLimiter(self.max_request_rate)
+
+        # A pooled browser replaces this one when the run starts
+        self.browser_pool = browser_pool
         self.browser = Selenium()
+        # Whether the browser has already handled the site's one time prompts (e.g. cookies)
+        self.browser_is_warm = False
+
+        # Element waits, bound to the browser the run ends up using
+        self.wait_timings = WaitTimings.load()
+        self._waits = None
+
         self.load_workitems(config)
-        super().__init__()
+
+        # Checkpoint of an interrupted run of the same search, if it should be resumed
+        self.checkpoints = CheckpointStore(CHECKPOINT_DIRECTORY)
+        self.checkpoint = self.load_checkpoint(config)
+        # Page of the last checkpoint saved by this run
+        self.checkpoint_page = -1
+
+        start_time = datetime.fromisoformat(self.checkpoint.started_at) if self.checkpoint else None
+        super().__init__(
+            downloader=downloader,
+            start_time=start_time,
+            resuming=self.checkpoint is not None,
+            image_processor=image_processor
+        )
+
+        if self.checkpoint:
+            self.restore_checkpoint()
 
     def main(self):
         """Main method to start the scraping process."""
         start_url = self.get_start_url()
+        self.backend = self.backends[self.backend_name](self)
 
-        try:
-            self.open_browser(start_url)
-            self.parse()
+        # Every record logged by this run carries its run id, see `setup_logger`
+        with log.contextualize(run=self.run_id, search_phrase=self.search_phrase):
+            try:
+                self.backend.start(start_url)
+                self.backend.run()
 
-        except ScraperStopException:
-            pass
+            except ScraperStopException:
+                pass
 
-        except (NoSuchElementException,
-                ElementNotVisibleException,
-                TimeoutException,
-                WebDriverException) as e:
-            log.error(f"Failed with Exception {e}", exc_info=e)
+            except (NoSuchElementException,
+                    ElementNotVisibleException,
+                    TimeoutException,
+                    WebDriverException,
+                    RequestException) as e:
+                log.error(f"Failed with Exception {e}", exc_info=e)
+                self.error = e
 
-        finally:
-            self.close_browser()
+            finally:
+                self.close_browser()
+
+        # Nothing to resume once a run completed
+        if self.error is None:
+            self.checkpoints.clear(self.search_phrase, self.site_name)
 
     def get_start_url(self):
         """Return the starting URL for scraping."""
@@ -165,6 +467,45 @@ class BaseScraper(StorageMixin):
             raise ValueError("search_phrase is not configured")
         self.search_phrase = search_phrase
 
+    def set_backend(self, backend):
+        if backend not in self.backends:
+            raise ValueError(f"backend:{backend} is not supported, choose one of {list(self.backends)}")
+        self.backend_name = backend
+
+    def set_browser_profile(self, browser_profile):
+        if browser_profile not in self.browser_profiles:
+            raise ValueError(
+                f"browser profile:{browser_profile} is not supported, choose one of {list(self.browser_profiles)}"
+            )
+        self.browser_profile = self.browser_profiles[browser_profile]
+
+    def set_export_formats(self, export_formats):
+        # Comma separated format names, e.g. "xlsx,jsonl"
+        formats = [name.strip().lower() for name in export_formats.split(',') if name.strip()]
+        for name in formats:
+            if name not in self.exporters:
+                raise ValueError(f"export format:{name} is not supported, choose from {list(self.exporters)}")
+            if not self.exporters[name].available:
+                raise ValueError(f"export format:{name} requires optional dependencies that are not installed")
+        if not formats:
+            raise ValueError("export_formats is not configured")
+        self.export_formats = formats
+
+    def set_archive_format(self, archive_format):
+        if archive_format not in ImageArchive.formats:
+            raise ValueError(f"archive format:{archive_format} is not supported, choose one of {ImageArchive.formats}")
+        self.archive_format = archive_format
+
+    def set_image_processing(self, max_dimension, image_format):
+        if max_dimension < 0:
+            raise ValueError(f"image max dimension:{max_dimension} must not be negative")
+        if image_format not in ImageProcessor.formats:
+            raise ValueError(
+                f"image format:{image_format} is not supported, choose one of {tuple(ImageProcessor.formats)}"
+            )
+        self.image_max_dimension = max_dimension
+        self.image_format = image_format
+
     def set_month(self, month):
         try:
             self.month = float(month)
@@ -180,21 +521,52 @@ class BaseScraper(StorageMixin):
         raise NotImplementedError("Subclasses must implement this method")
         # This method is meant to be overridden by subclasses to implement specific parsing logic.
 
+    @profiled()
     def open_browser(self, link: str):
         """Open the browser with specified options and link."""
 
-        # Opens a browser instance with the provided link using the `open_available_browser` method.
-        self.browser.open_available_browser(link)
+        # Launches a browser instance as the configured profile describes, once.
+        self.browser_profile.open(self.browser)
+
+        # Opens the provided link, a page load that times out is retried at a lower request rate.
+        self.rate_limiter.call(lambda: self.browser.go_to(link), retryable=self.is_retryable_error)
+
+    @staticmethod
+    def is_retryable_error(error):
+        # Timeouts are what a throttled or overloaded site looks like to the browser
+        return isinstance(error, TimeoutException)
+
+    @classmethod
+    def warm_up_browser(cls, browser: Selenium):
+        """Handle one time prompts of the start page in a fresh pooled browser."""
+        # Nothing to do by default, subclasses can e.g. accept cookie banners here.
+
+    def reset_browser(self):
+        """Bring a pooled browser back to the start page before it serves the next search."""
+        self.browser.go_to(self.get_start_url())
+
+    @property
+    def waits(self) -> WaitEngine:
+        # A pooled browser may replace the scraper's own browser when the run starts
+        if self._waits is None or self._waits.browser is not self.browser:
+            self._waits = WaitEngine(self.browser, self.wait_timings)
+        return self._waits
 
     def close_browser(self):
         """Close the browser and convert collected data to Excel."""
 
         log.warning("Closing scraper")
 
-        # Closes all browser instances,
-        self.browser.close_all_browsers()
-        # calls the supe class's `close_browser` method to trigger all inherited methods.
-        super().close_browser()
+        # Keep what the waits learned for the next runs
+        if self._waits is not None:
+            self.wait_timings.save()
+
+        try:
+            # calls the supe class's `close_browser` method to trigger all inherited methods.
+            super().close_browser()
+        finally:
+            # Stops the backend once the outputs are complete, closing browser instances or HTTP sessions
+            self.backend.stop()
 
     def load_workitems(self, config):
         """Load work items for processing."""
@@ -203,19 +575,146 @@ class BaseScraper(StorageMixin):
 
         self.set_month(config.month)
 
-    def element_is_visible(self, xpath: str, max_retries: int = 5, raise_exception: bool=True) -> bool:
+        self.set_backend(config.backend)
+
+        self.set_export_formats(config.export_formats)
+
+        self.set_browser_profile(config.browser_profile)
+
+        self.set_archive_format(config.archive_format)
+
+        self.keep_images_folder = config.keep_images_folder
+
+        self.set_image_processing(config.image_max_dimension, config.image_format)
+
+        if config.incremental:
+            self.seen_index = SeenIndex.load(config.seen_index_path)
+
+        self.image_store_path = config.image_store_path
+
+    def load_checkpoint(self, config):
+        """Returns the checkpoint of an interrupted run to resume, if any."""
+        if not config.resume:
+            return None
+
+        checkpoint = self.checkpoints.load(self.search_phrase, self.site_name)
+        if checkpoint is None:
+            return None
+
+        if not checkpoint.matches(self.search_phrase, self.month, self.backend_name, self.export_formats):
+            log.info(f"Checkpoint of a different search found for '{self.search_phrase}', starting over")
+            return None
+
+        max_age = timedelta(hours=config.checkpoint_max_age_hours)
+        if max_age and checkpoint.age() > max_age:
+            log.info(f"Checkpoint of '{self.search_phrase}' saved at {checkpoint.saved_at} is too old, starting over")
+            return None
+
+        # Every output file must be readable, otherwise its rows would be lost
+        for name in self.export_formats:
+            path = self.build_output_path(name, datetime.fromisoformat(checkpoint.started_at))
+            if checkpoint.items_exported and not self.exporters[name].can_resume(path):
+                log.warning(f"Output file {path} cannot be resumed, starting over")
+                return None
+
+        # Without the images folder, the images of the interrupted run only exist in its archive
+        archive_path = self.build_archive_path(datetime.fromisoformat(checkpoint.started_at))
+        if not self.keep_images_folder and not ImageArchive.can_resume(archive_path, self.archive_format):
+            log.warning(f"Image archive {archive_path} cannot be resumed, starting over")
+            return None
+
+        return checkpoint
+
+    def restore_checkpoint(self):
+        # Continue the crawl and the output files where the interrupted run last saved them
+        checkpoint = self.checkpoint
+        log.info(f"Resuming from page {checkpoint.page} with {checkpoint.items_exported} items exported")
+
+        self.page = self.checkpoint_page = checkpoint.page
+        self.cursor = ResultsCursor(index=checkpoint.cursor_index, last_key=checkpoint.last_key)
+        self.items_scraped = self.resume_rows = checkpoint.items_exported
+
+        # Articles exported after the checkpoint are scraped and exported again
+        if self.seen_index:
+            self.seen_index.forget_since(self.search_phrase, checkpoint.saved_at)
+
+        if self.item_class is not None and self.resume_rows:
+            self.open_exporters(self.item_class)
+
+    def save_checkpoint(self, force=False):
+        """
+        Saves the crawl position every CHECKPOINT_EVERY_PAGES pages.
+
+        Pending images are awaited first so that every item scraped up to the current page
+        is in the output files, which are flushed to disk before the checkpoint points past them.
+
+        Args:
+            force (bool, optional): Save even if fewer pages were scraped since the last checkpoint.
+        """
+        if not force and self.page - self.checkpoint_page < CHECKPOINT_EVERY_PAGES:
+            return
+
+        self.export_ready_items(wait_for_all=True)
+        for exporter in self.active_exporters:
+            exporter.flush()
+        if self.seen_index:
+            self.seen_index.commit()
+
+        self.checkpoints.save(Checkpoint(
+            search_phrase=self.search_phrase,
+            month=self.month,
+            backend=self.backend_name,
+            export_formats=self.export_formats,
+            started_at=self.start_time.isoformat(),
+            page=self.page,
+            cursor_index=self.cursor.index,
+            last_key=self.cursor.last_key,
+            items_exported=self.items_scraped,
+            site=self.site_name,
+        ))
+        self.checkpoint_page = self.page
+        log.debug("Checkpoint saved at page {} with {} items", self.page, self.items_scraped)
+
+    def is_already_seen(self, article_key: str) -> bool:
+        """
+        Checks whether an article was scraped by a previous incremental run.
+
+        Results are sorted by date, so after SEEN_STOP_AFTER known articles in a row the rest
+        of the results are known as well and the scraper is flagged to stop.
+        """
+        if self.seen_index is None:
+            return False
+
+        if not self.seen_index.contains(self.search_phrase, article_key):
+            self.seen_streak = 0
+            return False
+
+        self.seen_streak += 1
+        if self.seen_streak >= SEEN_STOP_AFTER:
+            log.info("Reached articles scraped by a previous run")
+            self.close_spider = True
+        return True
+
+    def element_is_visible(self,
+                           xpath: str,
+                           max_retries: int = 5,
+                           raise_exception: bool = True,
+                           optional: bool = False) -> bool:
         """
         Checks if an element identified by XPath is visible on the page.
 
         Args:
             xpath (str): The XPath expression to locate the element.
-            max_retries (int, optional): Maximum number of retries to wait for the element to be visible. Default is 5.
+            max_retries (int, optional): Upper bound of the wait in multiples of WAIT_TIMEOUT. Default is 5.
+            raise_exception (bool, optional): Raise if the element does not show up. Default is True.
+            optional (bool, optional): The element is often absent (e.g. a cookie banner), give up
+                after a short wait and never raise. Default is False.
 
         Returns:
             bool: True if the element is visible, False otherwise.
 
         Raises:
-            NoSuchElementException: If the element is not found after max_retries attempts.
+            NoSuchElementException: If the element is not visible in time and raise_exception is set.
 
         Example:
             element_is_visible("//div[@id='example']")
@@ -224,33 +723,14 @@ class BaseScraper(StorageMixin):
             element_is_visible("//div[@id='invalid']")
             Exception NoSuchElementException
 
-        This method recursively attempts to find and check the visibility of an element
-        identified by XPath. It retries up to max_retries times. If the element is found
-        and visible, it returns True; otherwise, it returns False. If the element is not
-        found after all retries, it raises a NoSuchElementException.
+        The wait runs inside the browser and returns as soon as the element shows up. Its
+        timeout is learned from the selector's recent waits and bounded by the page's budget,
+        see ``WaitEngine``.
         """
-
-        def recursive_wait(tries: int) -> bool:
-            # Base case: If no retries left, raise exception
-            if tries == 0:
-                # No more tries, Exit as Xpath is invalid.
-                if raise_exception:
-                    raise NoSuchElementException(f"Element not found for xpath='{xpath}'")
-                return False
-
-            try:
-                log.debug(f"Finding element {xpath}")
-                # Wait until element is visible
-                self.browser.wait_until_element_is_visible(xpath, timeout=WAIT_TIMEOUT)
-
-                # Check if element is visible
-                return self.browser.is_element_visible(xpath)
-
-            except (NoSuchElementException, AssertionError) as e:
-                tries -= 1
-                log.error(f"Error finding element with xpath='{xpath}': {e}")
-                log.error(f"Tries left for xpath='{xpath}': {tries}")
-                return recursive_wait(tries)  # Retry recursively
-
-        return recursive_wait(max_retries)  # Start recursive wait with max_retries
-
+        log.debug("Finding element {}", xpath)
+        return self.waits.wait_for(
+            xpath,
+            timeout=WAIT_TIMEOUT * max_retries,
+            optional=optional,
+            raise_exception=raise_exception
+        )
@@ -0,0 +1,210 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List
+
+from robocorp.tasks import get_output_dir
+
+from constants import DEFAULT_OUTPUT_DIRECTORY, SUMMARY_FILE_PREFIX
+from core.backends import BrowserBackend
+from core.browser_pool import BrowserPool
+from core.browser_profiles import BROWSER_PROFILES
+from core.downloads import ImageDownloader
+from core.image_store import ImageStore
+from core.images import ImageProcessor
+from core.rate_limits import RateLimiter
+from core.registry import resolve_sites
+from configs import logger as log
+
+
+class BatchRunner:
+    """
+    Runs many searches on one or more sites in one process through a pool of scraper workers.
+
+    Every search phrase is scraped on each of its configured sites, the scraper of a site is
+    looked up in ``scrapers``. Workers pick the next search whose site is below its
+    ``max_concurrent_searches``, and scrapers of the same site share one adaptive ``RateLimiter``.
+    Browser searches borrow warm browsers from a pool per site and browser profile, and image
+    downloads and processing go through one pool per image store and per processing setting.
+    Each search produces its own output files and a combined summary of all searches is
+    written to the output directory.
+
+    Example:
+        runner = BatchRunner(SCRAPERS, get_batch_work_items(), workers=2)
+        runner.run()
+    """
+
+    def __init__(self, scrapers: Dict[str, type], configs: List, workers: int):
+        self.scrapers = scrapers
+
+        # One search per phrase and site, a phrase whose sites can't be scraped is reported as failed
+        self.searches = []
+        self.invalid = []
+        for config in configs:
+            try:
+                self.searches.extend((site, config) for site in resolve_sites(config.sites, scrapers))
+            except ValueError as e:
+                log.error(f"Batch search skipped {config}: {e}")
+                self.invalid.append(self.failure(config, e))
+
+        self.workers = max(1, min(workers, len(self.searches)))
+
+        # Searches waiting for a worker, the number running on each site and the summaries of finished ones
+        self.pending = list(self.searches)
+        self.results = []
+        self.running = {site: 0 for site, _ in self.searches}
+        self._condition = threading.Condition()
+
+        # Image download pools by image store path, shared by the searches using the same store
+        self.downloaders = {}
+        for _, config in self.searches:
+            if config.image_store_path not in self.downloaders:
+                store = ImageStore(config.image_store_path) if config.image_store_path else None
+                self.downloaders[config.image_store_path] = ImageDownloader(store=store)
+
+        # Image processing pools by maximum dimension and format, for the searches resizing images
+        self.image_processors = {}
+        for _, config in self.searches:
+            settings = self.image_settings(config)
+            if config.image_max_dimension and settings not in self.image_processors:
+                self.image_processors[settings] = ImageProcessor(*settings)
+
+        # Request rate of each site, shared by all of its scrapers and their image downloads
+        self.rate_limiters = {site: RateLimiter(scrapers[site].max_request_rate) for site in self.running}
+
+        # Warm browsers per site and browser profile, only for searches running through the browser backend
+        self.browser_pools = {}
+        for site, config in self.searches:
+            if config.backend != BrowserBackend.name or (site, config.browser_profile) in self.browser_pools:
+                continue
+
+            scraper_class = scrapers[site]
+            self.browser_pools[site, config.browser_profile] = BrowserPool(
+                scraper_class.start_url,
+                size=min(self.workers, scraper_class.max_concurrent_searches),
+                warm_up=scraper_class.warm_up_browser,
+                profile=scraper_class.browser_profiles.get(config.browser_profile, BROWSER_PROFILES['default'])
+            )
+
+    def run(self) -> List[dict]:
+        """Scrape every configured search and return one summary entry per search."""
+        start_time = datetime.now()
+
+        try:
+            for browser_pool in self.browser_pools.values():
+                browser_pool.warm()
+
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='scraper') as executor:
+                list(executor.map(lambda _: self.work(), range(self.workers)))
+
+        finally:
+            for browser_pool in self.browser_pools.values():
+                browser_pool.close()
+            for downloader in self.downloaders.values():
+                downloader.shutdown()
+            for image_processor in self.image_processors.values():
+                image_processor.shutdown()
+
+            # Report every search, including the ones an interrupted batch never started
+            with self._condition:
+                unstarted = [{'site': site, **self.failure(config, "Search did not run")}
+                             for site, config in self.pending]
+                results = self.invalid + self.results + unstarted
+            self.write_summary(results, start_time)
+
+        for site, rate_limiter in self.rate_limiters.items():
+            log.info(f"Request rate of {site}: {rate_limiter.metrics()}")
+        return results
+
+    def work(self):
+        # Run searches until none is left, a failing search is reported and the worker moves on
+        while True:
+            search = self.next_search()
+            if search is None:
+                return
+
+            site, config = search
+            try:
+                summary = self.scrape(site, config)
+            except Exception as e:
+                log.error(f"Batch search failed on {site} {config}: {e}")
+                summary = {'site': site, **self.failure(config, e)}
+
+            with self._condition:
+                self.results.append(summary)
+                self.running[site] -= 1
+                self._condition.notify_all()
+
+    def next_search(self):
+        # The first pending search whose site has room, waiting while every remaining site is busy
+        with self._condition:
+            while self.pending:
+                for index, (site, config) in enumerate(self.pending):
+                    if self.running[site] < self.scrapers[site].max_concurrent_searches:
+                        self.running[site] += 1
+                        return self.pending.pop(index)
+                self._condition.wait()
+            return None
+
+    def scrape(self, site, config) -> dict:
+        # Run a single search and describe its outcome
+        log.info(f"Batch search started on {site}: {config}")
+        started = time.monotonic()
+
+        try:
+            scraper = self.scrapers[site](
+                config=config,
+                browser_pool=self.browser_pools.get((site, config.browser_profile)),
+                downloader=self.downloaders[config.image_store_path],
+                image_processor=self.image_processors.get(self.image_settings(config)),
+                rate_limiter=self.rate_limiters[site]
+            )
+        except ValueError as e:
+            # Invalid work item, report it and carry on with the rest of the batch
+            log.error(f"Batch search skipped {config}: {e}")
+            return {'site': site, **self.failure(config, e)}
+
+        scraper.main()
+
+        return {
+            'site': site,
+            'search_phrase': scraper.search_phrase,
+            'month': scraper.month,
+            'backend': scraper.backend_name,
+            'items': scraper.items_scraped,
+            'outputs': scraper.output_paths,
+            'archive_path': scraper.archive_path,
+            'status': 'failed' if scraper.error else 'completed',
+            'error': str(scraper.error) if scraper.error else None,
+            'duration_seconds': round(time.monotonic() - started, 3),
+        }
+
+    @staticmethod
+    def image_settings(config) -> tuple:
+        # Key of the image processing pool of a search
+        return config.image_max_dimension, config.image_format
+
+    @staticmethod
+    def failure(config, error) -> dict:
+        return {'search_phrase': config.search_phrase, 'status': 'failed', 'error': str(error), 'items': 0}
+
+    def write_summary(self, results: List[dict], start_time: datetime):
+        # Write the combined summary of all searches next to their outputs
+        output_dir = get_output_dir() if get_output_dir() else DEFAULT_OUTPUT_DIRECTORY
+        os.makedirs(output_dir, exist_ok=True)
+        summary_path = f'{output_dir}/{SUMMARY_FILE_PREFIX}-{start_time.isoformat()}.json'
+
+        summary = {
+            'started_at': start_time.isoformat(),
+            'finished_at': datetime.now().isoformat(),
+            'searches': len(results),
+            'items': sum(result['items'] for result in results),
+            'results': results,
+        }
+        with open(summary_path, 'w', encoding='utf-8') as summary_file:
+            json.dump(summary, summary_file, indent=2)
+
+        log.info(f"Batch summary generated at {summary_path}")
@@ -0,0 +1,192 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import psutil
+from RPA.Browser.Selenium import Selenium
+from selenium.common import WebDriverException
+
+from constants import BROWSER_POOL_MAX_USES, BROWSER_POOL_MAX_MEMORY_GROWTH_MB, BROWSER_POOL_ACQUIRE_TIMEOUT
+from core.browser_profiles import BrowserProfile, BROWSER_PROFILES
+from configs import logger as log
+
+
+class PooledBrowser:
+    """A browser kept alive by the pool along with its usage statistics."""
+
+    def __init__(self, browser: Selenium):
+        self.browser = browser
+        # Number of scraping runs served by this browser
+        self.uses = 0
+        # Whether the start page was opened and its one time prompts (e.g. cookies) handled
+        self.warm = False
+        # Resident memory of the browser processes after warm-up, to detect growth across uses
+        self.baseline_memory = 0
+
+
+class BrowserPool:
+    """
+    Keeps warmed browsers alive across searches and hands them out to scrapers.
+
+    Browsers are opened at ``start_url`` with ``profile`` and passed to ``warm_up`` once (e.g. to accept the
+    cookie banner). After each use the browser is reset by the scraper and recycled once it
+    served ``max_uses`` runs, its processes grew by more than ``max_memory_growth_mb`` or it
+    stopped responding. A browser that could not be replaced leaves an empty slot in the
+    pool, which the next ``acquire`` fills.
+
+    Example:
+        pool = BrowserPool(AlJazeeraScraper.start_url, size=2, warm_up=AlJazeeraScraper.warm_up_browser)
+        pool.warm()
+        lease = pool.acquire()
+        ...
+        pool.release(lease, reset=scraper.reset_browser)
+        pool.close()
+    """
+
+    def __init__(self,
+                 start_url: str,
+                 size: int,
+                 warm_up: Optional[Callable[[Selenium], None]] = None,
+                 profile: BrowserProfile = BROWSER_PROFILES['default'],
+                 max_uses: int = BROWSER_POOL_MAX_USES,
+                 max_memory_growth_mb: int = BROWSER_POOL_MAX_MEMORY_GROWTH_MB,
+                 acquire_timeout: float = BROWSER_POOL_ACQUIRE_TIMEOUT):
+        self.start_url = start_url
+        self.size = size
+        self.warm_up = warm_up
+        self.profile = profile
+        self.max_uses = max_uses
+        self.max_memory_growth = max_memory_growth_mb * 1024 * 1024
+        self.acquire_timeout = acquire_timeout
+
+        # Idle browsers ready to be handed out, None for a slot whose browser still has to be opened
+        self.available = queue.Queue()
+
+        # Every browser owned by the pool, idle or leased
+        self.browsers = []
+        self._lock = threading.Lock()
+
+    def warm(self):
+        # Open and warm up every browser in parallel so no scraper pays the cold start
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='browser-warmup') as executor:
+            for pooled in executor.map(lambda _: self._try_create(), range(self.size)):
+                self.available.put(pooled)
+
+    def acquire(self) -> PooledBrowser:
+        """
+        Hands out an idle browser, opening one for an empty slot.
+
+        Raises:
+            TimeoutError: No browser became idle within ``acquire_timeout`` seconds.
+        """
+        try:
+            pooled = self.available.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No pooled browser became available within {self.acquire_timeout} seconds")
+
+        if pooled is not None:
+            return pooled
+
+        try:
+            return self._create()
+        except Exception:
+            # Keep the slot for the next scraper
+            self.available.put(None)
+            raise
+
+    def release(self, pooled: PooledBrowser, reset: Optional[Callable[[], None]] = None):
+        """
+        Returns a browser to the pool after a scraping run.
+
+        Args:
+            pooled (PooledBrowser): The browser handed out by ``acquire``.
+            reset (Callable, optional): Restores the browser to the start state, e.g. navigates
+                back to the start URL and clears the search input.
+        """
+        pooled.uses += 1
+
+        try:
+            if reset:
+                reset()
+            recycle = self._should_recycle(pooled)
+
+        except WebDriverException as e:
+            log.error(f"Pooled browser failed to reset: {e}")
+            recycle = True
+
+        if recycle:
+            self._close(pooled)
+            pooled = self._try_create()
+
+        self.available.put(pooled)
+
+    def close(self):
+        # Close every browser owned by the pool
+        with self._lock:
+            browsers, self.browsers = self.browsers, []
+
+        for pooled in browsers:
+            self._close(pooled, forget=False)
+
+    def _create(self) -> PooledBrowser:
+        pooled = PooledBrowser(Selenium())
+        self.profile.open(pooled.browser, self.start_url)
+
+        if self.warm_up:
+            self.warm_up(pooled.browser)
+        pooled.warm = True
+        pooled.baseline_memory = self._memory_usage(pooled)
+
+        with self._lock:
+            self.browsers.append(pooled)
+        log.debug(f"Pooled browser opened at {self.start_url}")
+        return pooled
+
+    def _try_create(self) -> Optional[PooledBrowser]:
+        # Opens a browser, None leaves the slot empty for acquire to fill
+        try:
+            return self._create()
+        except Exception as e:
+            log.error(f"Pooled browser could not be opened: {e}")
+            return None
+
+    def _close(self, pooled: PooledBrowser, forget: bool = True):
+        if forget:
+            with self._lock:
+                self.browsers.remove(pooled)
+
+        try:
+            pooled.browser.close_all_browsers()
+        except WebDriverException as e:
+            log.error(f"Pooled browser failed to close: {e}")
+
+    @staticmethod
+    def _memory_usage(pooled: PooledBrowser) -> int:
+        # Resident memory of the driver service and the browser processes it started, in bytes
+        try:
+            process = psutil.Process(pooled.browser.driver.service.process.pid)
+            processes = [process, *process.children(recursive=True)]
+        except (AttributeError, psutil.Error):
+            return 0
+
+        usage = 0
+        for process in processes:
+            try:
+                usage += process.memory_info().rss
+            except psutil.Error:
+                # Renderer processes come and go
+                continue
+        return usage
+
+    def _should_recycle(self, pooled: PooledBrowser) -> bool:
+        if pooled.uses >= self.max_uses:
+            log.debug(f"Recycling pooled browser after {pooled.uses} uses")
+            return True
+
+        growth = self._memory_usage(pooled) - pooled.baseline_memory
+        if growth > self.max_memory_growth:
+            log.debug(f"Recycling pooled browser after memory grew by {growth // (1024 * 1024)} MB")
+            return True
+
+        return False
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from RPA.Browser.Selenium import Selenium
+from selenium.common import WebDriverException
+from selenium.webdriver import ChromeOptions
+
+from constants import BLOCKED_BROWSER_URLS, FAST_BROWSER_WINDOW_SIZE
+from configs import logger as log
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """
+    How a scraper's browser is launched.
+
+    The default profile opens whatever browser is available with its usual settings. Other
+    profiles launch Chrome with extra options and block requests matching ``blocked_urls``
+    (hosts or file types) through the DevTools protocol, so pages only load what is scraped.
+
+    Example:
+        browser = Selenium()
+        BROWSER_PROFILES['fast'].open(browser, "https://www.aljazeera.com/")
+    """
+
+    # Name used to select the profile from the configuration
+    name: str
+    headless: bool | str = 'AUTO'
+    # Only set for profiles tied to Chrome options
+    browser_selection: str = 'AUTO'
+    arguments: Tuple[str, ...] = ()
+    preferences: Dict = field(default_factory=dict)
+    # "normal" waits for every subresource, "eager" only for the DOM
+    page_load_strategy: Optional[str] = None
+    # URL patterns never requested, wildcards allowed
+    blocked_urls: Tuple[str, ...] = ()
+
+    def build_options(self) -> Optional[ChromeOptions]:
+        if self.browser_selection == 'AUTO':
+            return None
+
+        options = ChromeOptions()
+        for argument in self.arguments:
+            options.add_argument(argument)
+        if self.preferences:
+            options.add_experimental_option('prefs', self.preferences)
+        if self.page_load_strategy:
+            options.page_load_strategy = self.page_load_strategy
+        return options
+
+    def open(self, browser: Selenium, url: Optional[str] = None):
+        """Opens ``browser`` with this profile, at ``url`` if given."""
+
+        options = self.build_options()
+        if options is None:
+            browser.open_available_browser(url, headless=self.headless)
+            return
+
+        # Block resources before the first page is requested
+        browser.open_available_browser(
+            headless=self.headless, browser_selection=self.browser_selection, options=options
+        )
+        self.block_urls(browser)
+        if url:
+            browser.go_to(url)
+
+    def block_urls(self, browser: Selenium):
+        if not self.blocked_urls:
+            return
+
+        try:
+            browser.driver.execute_cdp_cmd('Network.enable', {})
+            browser.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(self.blocked_urls)})
+        except (AttributeError, WebDriverException) as e:
+            # Only Chromium based drivers speak the DevTools protocol
+            log.warning(f"Browser profile {self.name} could not block requests: {e}")
+
+
+# Browser profiles available to scrapers, keyed by the configured profile name
+BROWSER_PROFILES = {
+    profile.name: profile
+    for profile in (
+        BrowserProfile(name='default'),
+        BrowserProfile(
+            name='fast',
+            headless=True,
+            browser_selection='Chrome',
+            arguments=(
+                f'--window-size={FAST_BROWSER_WINDOW_SIZE[0]},{FAST_BROWSER_WINDOW_SIZE[1]}',
+                '--disable-extensions',
+                '--disable-gpu',
+                '--disable-dev-shm-usage',
+                '--blink-settings=imagesEnabled=false',
+                '--autoplay-policy=user-gesture-required',
+                '--mute-audio',
+            ),
+            preferences={
+                # Image elements keep their src, only the downloads are skipped
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.plugins': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            },
+            page_load_strategy='eager',
+            blocked_urls=BLOCKED_BROWSER_URLS,
+        ),
+    )
+}
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from core.utils import slugify
+from configs import logger as log
+
+
+@dataclass
+class Checkpoint:
+    """
+    Where a crawl stood when everything scraped so far was safely on disk.
+
+    Attributes:
+        search_phrase (str): The search being crawled.
+        month (float): Number of months the search covers.
+        backend (str): Name of the backend crawling the search.
+        export_formats (List[str]): Output formats of the run.
+        started_at (str): Start time of the run, which names its output files.
+        page (int): Index of the last page fully scraped.
+        cursor_index (int): Results read from the top of the list, for "Show more" pagination.
+        last_key (Optional[str]): Key of the last article read.
+        items_exported (int): Rows written to every output file.
+        saved_at (str): When the checkpoint was saved.
+        site (str): Site being crawled, searches of the same phrase on other sites have their own checkpoint.
+    """
+    search_phrase: str
+    month: float
+    backend: str
+    export_formats: List[str]
+    started_at: str
+    page: int = -1
+    cursor_index: int = 0
+    last_key: Optional[str] = None
+    items_exported: int = 0
+    saved_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    site: str = ''
+
+    def matches(self, search_phrase: str, month: float, backend: str, export_formats: List[str]) -> bool:
+        # Only a run of the very same search continues from this checkpoint
+        return (self.search_phrase, self.month, self.backend, self.export_formats) == (
+            search_phrase, month, backend, export_formats
+        )
+
+    def age(self) -> timedelta:
+        # Time since the checkpoint was last saved
+        return datetime.now() - datetime.fromisoformat(self.saved_at)
+
+
+class CheckpointStore:
+    """
+    Keeps the latest checkpoint of each search as a JSON file.
+
+    A run that fails or is killed leaves its checkpoint behind and the next run of the same
+    search resumes from it. Completed runs remove their checkpoint.
+
+    Example:
+        store = CheckpointStore("state/checkpoints")
+        store.save(checkpoint)
+        store.load("economy", site="aljazeera")
+        Checkpoint(search_phrase='economy', ...)
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, search_phrase: str, site: str = '') -> str:
+        # The slug keeps files readable, the digest tells apart phrases with the same (or an empty) slug
+        digest = hashlib.sha1(search_phrase.encode()).hexdigest()[:8]
+        name = '-'.join(filter(None, (site, slugify(search_phrase), digest)))
+        return os.path.join(self.directory, f'{name}.json')
+
+    def load(self, search_phrase: str, site: str = '') -> Optional[Checkpoint]:
+        path = self.path_for(search_phrase, site)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, encoding='utf-8') as checkpoint_file:
+                return Checkpoint(**json.load(checkpoint_file))
+        except (OSError, ValueError, TypeError) as e:
+            log.warning(f"Ignoring unreadable checkpoint at {path}: {e}")
+            return None
+
+    def save(self, checkpoint: Checkpoint):
+        checkpoint.saved_at = datetime.now().isoformat()
+        path = self.path_for(checkpoint.search_phrase, checkpoint.site)
+
+        # Write next to the file and swap it in, a crash never leaves half a checkpoint
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(asdict(checkpoint), checkpoint_file, indent=2)
+        os.replace(f'{path}.tmp', path)
+
+    def clear(self, search_phrase: str, site: str = ''):
+        path = self.path_for(search_phrase, site)
+        if os.path.exists(path):
+            os.remove(path)
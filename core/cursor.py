@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class ResultsCursor:
+    """
+    Tracks how far an appending result list ("Show more" pagination) has been read.
+
+    Attributes:
+        index (int): Number of result nodes already read from the top of the list.
+        last_key (Optional[str]): Identity (e.g. the article URL) of the last node read, used to
+            re-sync the index if the site re-renders the list.
+    """
+    index: int = 0
+    last_key: Optional[str] = None
+
+    def advance(self, start: int, records: List[dict], key_field: str):
+        # Move past the records just read, remembering the last one as anchor
+        self.index = start + len(records)
+        if records:
+            self.last_key = records[-1].get(key_field) or self.last_key
@@ -0,0 +1,178 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from constants import (
+    DOWNLOAD_WORKERS,
+    DOWNLOAD_PER_HOST_LIMIT,
+    DOWNLOAD_MAX_RETRIES,
+    DOWNLOAD_BACKOFF_FACTOR,
+    DOWNLOAD_TIMEOUT,
+    RETRY_STATUS_CODES
+)
+from core.image_store import ImageStore
+from core.rate_limits import RateLimiter
+from configs import logger as log
+
+
+class ImageDownloader:
+    """
+    Downloads images in a bounded thread pool so scraping never waits on image I/O.
+
+    All workers share a single keep-alive ``requests.Session``, a semaphore per host caps
+    the number of concurrent connections to the same server, and transient failures are
+    retried with exponential backoff. With an ``ImageStore`` images already downloaded by a
+    previous run are revalidated with a conditional request and linked from the store. With a
+    ``RateLimiter`` every attempt waits for the site's rate and reports how it went.
+
+    Example:
+        downloader = ImageDownloader()
+        future = downloader.submit("https://example.com/a.jpg", "output/a.jpg")
+        future.result()
+        'output/a.jpg'
+    """
+
+    # Status codes worth retrying, everything else in the 4xx range is final
+    retry_status_codes = set(RETRY_STATUS_CODES)
+
+    def __init__(self,
+                 max_workers: int = DOWNLOAD_WORKERS,
+                 per_host_limit: int = DOWNLOAD_PER_HOST_LIMIT,
+                 max_retries: int = DOWNLOAD_MAX_RETRIES,
+                 backoff_factor: float = DOWNLOAD_BACKOFF_FACTOR,
+                 timeout: float = DOWNLOAD_TIMEOUT,
+                 store: Optional[ImageStore] = None):
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.store = store
+
+        # Bounded pool of download workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-download')
+
+        # Shared session keeps connections alive between downloads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # One semaphore per host, created lazily
+        self._host_limits = {}
+        self._lock = threading.Lock()
+
+    def submit(self, url: str, path: str, rate_limiter: Optional[RateLimiter] = None) -> Future:
+        """
+        Schedules a download and returns immediately.
+
+        Args:
+            url (str): The image URL to download.
+            path (str): The local file path to write the image to.
+            rate_limiter (RateLimiter, optional): Request rate of the site the image belongs to.
+
+        Returns:
+            Future: Resolves to ``path`` once downloaded, or ``None`` if the download failed.
+        """
+        return self.executor.submit(self._download, url, path, rate_limiter)
+
+    def shutdown(self, wait: bool = True):
+        # Stop accepting downloads and release pooled connections
+        self.executor.shutdown(wait=wait)
+        self.session.close()
+        if self.store:
+            self.store.close()
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_limits[host]
+
+    def _is_retryable(self, error: requests.RequestException) -> bool:
+        # Connection errors and timeouts have no response and are always retried
+        if error.response is None:
+            return True
+        return error.response.status_code in self.retry_status_codes
+
+    def _download(self, url: str, path: str, rate_limiter: Optional[RateLimiter] = None) -> str | None:
+        for attempt in range(self.max_retries + 1):
+            started = None
+            try:
+                if rate_limiter:
+                    rate_limiter.wait()
+                with self._host_semaphore(url):
+                    started = time.monotonic()
+                    self._fetch(url, path)
+                if rate_limiter:
+                    rate_limiter.record(time.monotonic() - started)
+                return path
+
+            except requests.RequestException as e:
+                # Only throttling and server errors say something about the site's health
+                retryable = self._is_retryable(e)
+                if rate_limiter and started is not None and retryable:
+                    rate_limiter.record(time.monotonic() - started, failed=True)
+
+                if attempt == self.max_retries or not retryable:
+                    log.error(f"Image download failed for url='{url}': {e}")
+                    return None
+
+                delay = self.backoff_factor * (2 ** attempt)
+                log.warning("Retrying image download in {}s for url='{}': {}", delay, url, e)
+                time.sleep(delay)
+
+            except (OSError, sqlite3.Error) as e:
+                # Local storage and image store failures are not worth retrying
+                log.error(f"Image could not be saved for url='{url}': {e}")
+                return None
+
+    def _fetch(self, url: str, path: str):
+        if self.store:
+            self._fetch_through_store(url, path)
+            return
+
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                with open(path, 'wb') as image_file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        image_file.write(chunk)
+
+        except requests.RequestException:
+            # Never leave a truncated image behind
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+    def _fetch_through_store(self, url: str, path: str):
+        # Revalidate images stored by a previous run instead of downloading them again
+        headers = {}
+        cached = self.store.lookup(url)
+        if cached:
+            digest, etag, last_modified = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        with self.session.get(url, timeout=self.timeout, stream=True, headers=headers) as response:
+            if cached and response.status_code == 304:
+                self.store.touch(digest)
+            else:
+                response.raise_for_status()
+                digest = self.store.add(
+                    url,
+                    response.iter_content(chunk_size=64 * 1024),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+
+        self.store.link(digest, path)
@@ -0,0 +1,303 @@
+import csv
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from openpyxl import Workbook, load_workbook
+
+from constants import SHEET_NAME, EXPORT_FLUSH_EVERY, PARQUET_ROW_GROUP_SIZE, PARTIAL_FILE_SUFFIX
+from configs import logger as log
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = pq = None
+
+
+class BaseExporter:
+    """
+    Streams scraped rows into an output file as items arrive.
+
+    Every exporter receives the same headers and rows, built from ``BaseItem.get_headers``
+    and ``BaseItem.to_row``, and is closed once at the end of the run. ``column_types`` maps
+    headers to the Python type of their values, see ``BaseItem.get_column_types``.
+
+    When a run resumes from a checkpoint, the first ``resume_rows`` rows of the file left by
+    the interrupted run are kept and rows written after its last checkpoint are dropped.
+    """
+
+    # Name used to select the exporter from the configuration
+    name = ""
+    # File extension of the output
+    extension = ""
+    # Whether the exporter's dependencies are installed
+    available = True
+
+    def __init__(self, path: str, headers: Sequence[str], flush_every: int = EXPORT_FLUSH_EVERY,
+                 resume_rows: int = 0, column_types: Optional[Dict[str, type]] = None):
+        self.path = path
+        self.headers = list(headers)
+        self.flush_every = flush_every
+        self.column_types = column_types or {}
+        self.rows = 0
+
+        # Rows of an interrupted run, read before the file is reopened and written again first
+        self.kept_rows = self.read_rows()[:resume_rows] if resume_rows else []
+        if len(self.kept_rows) < resume_rows:
+            log.warning(f"Only {len(self.kept_rows)} of {resume_rows} rows could be kept from {self.path}")
+
+    @classmethod
+    def can_resume(cls, path: str) -> bool:
+        # Whether an interrupted run left a file its rows can be read back from
+        return os.path.exists(path)
+
+    def read_rows(self) -> List[List[Any]]:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def restore_kept_rows(self):
+        for row in self.kept_rows:
+            self.write(row)
+        self.kept_rows = []
+
+    def write(self, row: List[Any]):
+        self.write_row(row)
+        self.rows += 1
+
+        if self.rows % self.flush_every == 0:
+            self.flush()
+
+    def write_row(self, row: List[Any]):
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def flush(self):
+        """Push buffered rows to disk."""
+
+    def close(self):
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class TextFileExporter(BaseExporter):
+    # Exporter writing to a line based text file, flushed and synced periodically
+
+    def __init__(self, path: str, headers: Sequence[str], flush_every: int = EXPORT_FLUSH_EVERY,
+                 resume_rows: int = 0, column_types: Optional[Dict[str, type]] = None):
+        super().__init__(path, headers, flush_every, resume_rows, column_types)
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+
+    def flush(self):
+        # Push the file to disk so a crash leaves every row written so far
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+        log.info(f"{self.name.upper()} file generated at {self.path}")
+
+
+class CsvExporter(TextFileExporter):
+    name = "csv"
+    extension = "csv"
+
+    def __init__(self, path: str, headers: Sequence[str], flush_every: int = EXPORT_FLUSH_EVERY,
+                 resume_rows: int = 0, column_types: Optional[Dict[str, type]] = None):
+        super().__init__(path, headers, flush_every, resume_rows, column_types)
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.headers)
+        self.restore_kept_rows()
+
+    def read_rows(self) -> List[List[Any]]:
+        # Rows after the header, as strings
+        with open(self.path, newline='', encoding='utf-8') as csv_file:
+            return list(csv.reader(csv_file))[1:]
+
+    def write_row(self, row: List[Any]):
+        self.writer.writerow(row)
+
+
+class JsonLinesExporter(TextFileExporter):
+    # One JSON object per line, dates in ISO format
+
+    name = "jsonl"
+    extension = "jsonl"
+
+    def __init__(self, path: str, headers: Sequence[str], flush_every: int = EXPORT_FLUSH_EVERY,
+                 resume_rows: int = 0, column_types: Optional[Dict[str, type]] = None):
+        super().__init__(path, headers, flush_every, resume_rows, column_types)
+        self.restore_kept_rows()
+
+    def read_rows(self) -> List[List[Any]]:
+        with open(self.path, encoding='utf-8') as jsonl_file:
+            records = [json.loads(line) for line in jsonl_file if line.strip()]
+        return [[record.get(header) for header in self.headers] for record in records]
+
+    def write_row(self, row: List[Any]):
+        record = dict(zip(self.headers, row))
+        self.file.write(json.dumps(record, default=self.encode, ensure_ascii=False) + '\n')
+
+    @staticmethod
+    def encode(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
+
+class XlsxExporter(BaseExporter):
+    """
+    Streams rows into an Excel file as items are scraped.
+
+    Rows go to a write-only (constant memory) workbook which can only be saved once, at the
+    end. To survive a crash, every row is also appended to a CSV journal next to the Excel
+    file, flushed to disk every ``flush_every`` rows and removed once the workbook is saved.
+
+    Example:
+        exporter = XlsxExporter("output/news.xlsx", ["title", "description"])
+        exporter.write(["Title", "Description"])
+        exporter.close()
+    """
+
+    name = "xlsx"
+    extension = "xlsx"
+
+    def __init__(self, path: str, headers: Sequence[str], flush_every: int = EXPORT_FLUSH_EVERY,
+                 resume_rows: int = 0, column_types: Optional[Dict[str, type]] = None):
+        super().__init__(path, headers, flush_every, resume_rows, column_types)
+
+        # Write-only workbook keeps memory constant regardless of the row count
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(SHEET_NAME)
+        self.sheet.append(self.headers)
+
+        # Crash-safe journal with the same rows, readable even if the run dies mid-way
+        self.journal = CsvExporter(self.journal_path(path), self.headers, flush_every)
+        self.restore_kept_rows()
+
+    @staticmethod
+    def journal_path(path: str) -> str:
+        return os.path.splitext(path)[0] + PARTIAL_FILE_SUFFIX
+
+    @classmethod
+    def can_resume(cls, path: str) -> bool:
+        return os.path.exists(cls.journal_path(path)) or os.path.exists(path)
+
+    def read_rows(self) -> List[List[Any]]:
+        # A killed run leaves only the journal, a failed run saved the workbook and removed it
+        if os.path.exists(self.journal_path(self.path)):
+            with open(self.journal_path(self.path), newline='', encoding='utf-8') as journal_file:
+                return [
+                    [self.restore_value(header, value) for header, value in zip(self.headers, row)]
+                    for row in list(csv.reader(journal_file))[1:]
+                ]
+
+        workbook = load_workbook(self.path, read_only=True)
+        try:
+            return [list(row) for row in workbook[SHEET_NAME].iter_rows(min_row=2, values_only=True)]
+        finally:
+            workbook.close()
+
+    def restore_value(self, header: str, value: str):
+        # The journal stores every cell as text, bring back the column's type from the model
+        if value == '':
+            return None
+
+        column_type = self.column_types.get(header)
+        try:
+            if column_type is bool:
+                return value == 'True'
+            if column_type is datetime:
+                return datetime.fromisoformat(value)
+            if column_type in (int, float):
+                return column_type(value)
+        except ValueError:
+            log.warning(f"Journal value {value!r} of {header} is not a {column_type.__name__}, kept as text")
+        return value
+
+    def write_row(self, row: List[Any]):
+        self.sheet.append(row)
+        self.journal.write_row(row)
+
+    def flush(self):
+        self.journal.flush()
+
+    def close(self):
+        self.journal.file.close()
+
+        # Save the Excel workbook, the journal is no longer needed once it exists
+        self.workbook.save(self.path)
+        os.remove(self.journal.path)
+        log.info(f"Excel file generated at {self.path}")
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Writes rows to a columnar Parquet file, one row group per ``row_group_size`` rows.
+
+    The schema is built once from the column types of the model, so a column empty in the
+    first row groups keeps its type. Columns of unknown type are stored as strings.
+    """
+
+    # Arrow type of each Python column type
+    arrow_types = {
+        str: pa.string(),
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+        datetime: pa.timestamp('us'),
+    } if pa is not None else {}
+
+    name = "parquet"
+    extension = "parquet"
+    available = pa is not None
+
+    def __init__(self, path: str, headers: Sequence[str], row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+                 resume_rows: int = 0, column_types: Optional[Dict[str, type]] = None):
+        super().__init__(
+            path, headers, flush_every=row_group_size, resume_rows=resume_rows, column_types=column_types
+        )
+        self.buffer = []
+        self.schema = pa.schema([
+            pa.field(header, self.arrow_types.get(self.column_types.get(header), pa.string()))
+            for header in self.headers
+        ])
+        # Created with the first row group
+        self.writer = None
+        self.restore_kept_rows()
+
+    @classmethod
+    def can_resume(cls, path: str) -> bool:
+        # A killed run never wrote the file footer, its rows cannot be read back
+        try:
+            pq.read_metadata(path)
+            return True
+        except (OSError, pa.ArrowException):
+            return False
+
+    def read_rows(self) -> List[List[Any]]:
+        return [[record.get(header) for header in self.headers] for record in pq.read_table(self.path).to_pylist()]
+
+    def write_row(self, row: List[Any]):
+        self.buffer.append(dict(zip(self.headers, row)))
+
+    def flush(self):
+        if not self.buffer:
+            return
+
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+
+        self.writer.write_table(pa.Table.from_pylist(self.buffer, schema=self.schema))
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+        log.info(f"Parquet file generated at {self.path}")
+
+
+# Exporters available to scrapers, keyed by the configured format name
+EXPORTERS = {
+    exporter.name: exporter
+    for exporter in (XlsxExporter, CsvExporter, JsonLinesExporter, ParquetExporter)
+}
@@ -0,0 +1,159 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+
+from constants import IMAGE_STORE_MAX_MB
+from configs import logger as log
+
+
+class ImageStore:
+    """
+    Persistent, content-addressed store of downloaded images shared by every run.
+
+    Images are saved once under the SHA-256 of their bytes, so identical images served from
+    different URLs share one file. An index maps each URL to its hash along with the
+    ``ETag``/``Last-Modified`` validators for conditional requests. Per-run image folders
+    hard link (or copy) files out of the store, and the least recently used images are
+    evicted once the store grows beyond ``max_mb``.
+
+    Example:
+        store = ImageStore("state/images")
+        digest = store.add("https://example.com/a.jpg", chunks, etag='"abc"', last_modified=None)
+        store.link(digest, "output/images/a.jpg")
+    """
+
+    def __init__(self, root: str, max_mb: int = IMAGE_STORE_MAX_MB):
+        self.root = root
+        self.max_bytes = max_mb * 1024 * 1024
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(root, 'tmp'), exist_ok=True)
+
+        # Downloads complete on several threads, so the connection is shared behind a lock
+        self.connection = sqlite3.connect(os.path.join(root, 'index.sqlite3'), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self.connection.executescript(
+                "CREATE TABLE IF NOT EXISTS urls ("
+                "url TEXT PRIMARY KEY, digest TEXT NOT NULL, etag TEXT, last_modified TEXT);"
+                "CREATE TABLE IF NOT EXISTS objects ("
+                "digest TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL);"
+            )
+            self.connection.commit()
+
+    def object_path(self, digest: str) -> str:
+        # Spread objects over sub folders to keep directories small
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+
+    def lookup(self, url: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        Finds the stored image of a URL.
+
+        Returns:
+            Optional[tuple]: ``(digest, etag, last_modified)``, or None if the URL was never
+            stored or its image has been evicted.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT digest, etag, last_modified FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row and os.path.exists(self.object_path(row[0])):
+            return row
+        return None
+
+    def add(self, url: str, chunks: Iterable[bytes], etag: Optional[str], last_modified: Optional[str]) -> str:
+        """
+        Streams an image into the store and records it for its URL.
+
+        Returns:
+            str: The SHA-256 digest identifying the image.
+        """
+        digest = hashlib.sha256()
+        size = 0
+
+        # Hash while writing to a temporary file, then move it into place atomically
+        handle, temp_path = tempfile.mkstemp(dir=os.path.join(self.root, 'tmp'))
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+                    size += len(chunk)
+
+            digest = digest.hexdigest()
+            object_path = self.object_path(digest)
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+
+            # Identical content is already stored, keep the existing object
+            if os.path.exists(object_path):
+                os.remove(temp_path)
+            else:
+                # Temporary files are private, stored images are readable like regular downloads
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, object_path)
+
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO urls (url, digest, etag, last_modified) VALUES (?, ?, ?, ?)",
+                (url, digest, etag, last_modified)
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO objects (digest, size, last_access) VALUES (?, ?, ?)",
+                (digest, size, time.time())
+            )
+            self.connection.commit()
+        return digest
+
+    def touch(self, digest: str):
+        # Mark an image as recently used so eviction keeps it
+        with self._lock:
+            self.connection.execute("UPDATE objects SET last_access = ? WHERE digest = ?", (time.time(), digest))
+            self.connection.commit()
+
+    def link(self, digest: str, path: str):
+        # Expose a stored image at `path`, sharing the bytes when the filesystem allows it
+        if os.path.exists(path):
+            os.remove(path)
+        try:
+            os.link(self.object_path(digest), path)
+        except OSError:
+            shutil.copyfile(self.object_path(digest), path)
+
+    def evict(self):
+        # Remove least recently used images until the store fits its size limit
+        with self._lock:
+            total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            evicted = []
+            for digest, size in self.connection.execute("SELECT digest, size FROM objects ORDER BY last_access"):
+                if total <= self.max_bytes:
+                    break
+                evicted.append(digest)
+                total -= size
+
+            for digest in evicted:
+                if os.path.exists(self.object_path(digest)):
+                    os.remove(self.object_path(digest))
+                self.connection.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+                self.connection.execute("DELETE FROM urls WHERE digest = ?", (digest,))
+            self.connection.commit()
+
+        log.debug(f"Evicted {len(evicted)} images from the image store")
+
+    def close(self):
+        self.evict()
+        with self._lock:
+            self.connection.close()
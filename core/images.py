@@ -0,0 +1,102 @@
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+from PIL import Image
+
+from constants import IMAGE_QUALITY, IMAGE_PROCESS_WORKERS, DEFAULT_IMAGE_FORMAT
+
+
+class ImageFile(NamedTuple):
+    # A downloaded image, dimensions are only known once it has been processed
+    path: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    size: Optional[int] = None
+
+    @classmethod
+    def from_path(cls, path: str) -> 'ImageFile':
+        try:
+            return cls(path, size=os.path.getsize(path))
+        except OSError:
+            return cls(path)
+
+
+def process_image(path: str, max_dimension: int, pil_format: str, extension: str, quality: int) -> ImageFile:
+    """
+    Shrinks an image to fit ``max_dimension`` and re-encodes it without its metadata.
+
+    Runs in a worker process. The result is written next to the original under the extension
+    of the new format and replaces it, the original is never modified in place since it may be
+    a link into the image store.
+    """
+    target = os.path.splitext(path)[0] + extension
+    partial = f'{target}.partial'
+
+    with Image.open(path) as image:
+        # Lets JPEG decode at a reduced scale, then resamples down, never up
+        image.draft('RGB', (max_dimension, max_dimension))
+        image.thumbnail((max_dimension, max_dimension))
+
+        if pil_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGBA')
+
+        # EXIF, ICC profiles and text chunks are not carried over unless passed to save
+        image.save(partial, format=pil_format, quality=quality, optimize=True)
+        width, height = image.size
+
+    os.replace(partial, target)
+    if target != path:
+        os.remove(path)
+
+    return ImageFile(target, width, height, os.path.getsize(target))
+
+
+class ImageProcessor:
+    """
+    Resizes and re-encodes downloaded images in a process pool, so decoding never blocks scraping.
+
+    Images are shrunk to fit ``max_dimension`` (never enlarged), converted to ``image_format``
+    and stripped of their metadata.
+
+    Example:
+        processor = ImageProcessor(max_dimension=640, image_format='webp')
+        processor.submit("output/images/a.jpg").result()
+        ImageFile(path='output/images/a.webp', width=640, height=360, size=18244)
+    """
+
+    # Pillow format and file extension by configured format name
+    formats = {
+        'webp': ('WEBP', '.webp'),
+        'jpeg': ('JPEG', '.jpg'),
+        'png': ('PNG', '.png'),
+    }
+
+    def __init__(self,
+                 max_dimension: int,
+                 image_format: str = DEFAULT_IMAGE_FORMAT,
+                 quality: int = IMAGE_QUALITY,
+                 max_workers: int = IMAGE_PROCESS_WORKERS):
+        self.max_dimension = max_dimension
+        self.pil_format, self.extension = self.formats[image_format]
+        self.quality = quality
+
+        # Workers are spawned rather than forked, the scraper process runs browser and download threads
+        self.executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def submit(self, path: str) -> Future:
+        """
+        Schedules the processing of a downloaded image.
+
+        Returns:
+            Future: Resolves to the processed ``ImageFile``.
+        """
+        return self.executor.submit(
+            process_image, path, self.max_dimension, self.pil_format, self.extension, self.quality
+        )
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait)
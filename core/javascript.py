@@ -0,0 +1,100 @@
+import json
+from typing import Dict, Optional, Tuple
+
+# Reads every node matched by `listXpath` from `start` to `end` (exclusive, -1 for all) and
+# returns one JSON object {start, records} with one property per configured field in each record.
+# When `anchor` is set it must match the `keyField` of the node just before `start`; if the list
+# was re-rendered the start index is re-synced to the node following the anchor.
+BULK_EXTRACT_SCRIPT = """
+var listXpath = %(list_xpath)s;
+var fields = %(fields)s;
+var start = %(start)d;
+var end = %(end)d;
+var keyField = %(key_field)s;
+var anchor = %(anchor)s;
+
+function readField(node, name) {
+    var xpath = fields[name][0], attribute = fields[name][1];
+    var element = document.evaluate(xpath, node, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!element) {
+        return null;
+    }
+    if (attribute) {
+        return element[attribute] || element.getAttribute(attribute);
+    }
+    return element.innerText.trim();
+}
+
+var snapshot = document.evaluate(listXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+
+if (anchor !== null && start > 0 &&
+        (start > snapshot.snapshotLength || readField(snapshot.snapshotItem(start - 1), keyField) !== anchor)) {
+    for (var j = 0; j < snapshot.snapshotLength; j++) {
+        if (readField(snapshot.snapshotItem(j), keyField) === anchor) {
+            start = j + 1;
+            break;
+        }
+    }
+}
+
+var last = end < 0 ? snapshot.snapshotLength : Math.min(end, snapshot.snapshotLength);
+var records = [];
+
+for (var i = start; i < last; i++) {
+    var node = snapshot.snapshotItem(i);
+    var record = {};
+    for (var name in fields) {
+        record[name] = readField(node, name);
+    }
+    records.push(record);
+}
+return JSON.stringify({start: start, records: records});
+"""
+
+
+def build_bulk_extract_script(list_xpath: str,
+                              fields: Dict[str, Tuple[str, str]],
+                              start: int = 0,
+                              end: int = -1,
+                              key_field: Optional[str] = None,
+                              anchor: Optional[str] = None) -> str:
+    """
+    Builds a script that extracts fields from a list of elements in a single WebDriver call.
+
+    Args:
+        list_xpath (str): XPath matching every element of the list.
+        fields (dict): Field name to ``(relative_xpath, attribute)``; an empty attribute reads the text.
+        start (int, optional): Index of the first element to read. Default is 0.
+        end (int, optional): Index after the last element to read, -1 reads to the end. Default is -1.
+        key_field (Optional[str]): Field identifying an element, used to check the anchor.
+        anchor (Optional[str]): Expected ``key_field`` value of the element just before ``start``.
+
+    Returns:
+        str: JavaScript returning ``{"start": int, "records": [...]}`` JSON encoded.
+
+    Example:
+        build_bulk_extract_script('//ul/li', {'url': ('./a', 'href')}, start=10, key_field='url', anchor='/a/9')
+    """
+    return BULK_EXTRACT_SCRIPT % {
+        'list_xpath': json.dumps(list_xpath),
+        'fields': json.dumps(fields),
+        'start': start,
+        'end': end,
+        'key_field': json.dumps(key_field),
+        'anchor': json.dumps(anchor),
+    }
+
+
+def build_clear_inputs_script(xpath: str) -> str:
+    # Empties every input matched by the XPath
+    return (
+        "var inputs = document.evaluate(%s, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);"
+        "for (var i = 0; i < inputs.snapshotLength; i++) { inputs.snapshotItem(i).value = ''; }"
+    ) % json.dumps(xpath)
+
+
+def build_count_script(xpath: str) -> str:
+    # Number of nodes matched by the XPath
+    return "return document.evaluate(%s, document, null, XPathResult.NUMBER_TYPE, null).numberValue;" % json.dumps(
+        f'count({xpath})'
+    )
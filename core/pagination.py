@@ -0,0 +1,82 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List
+
+from constants import MONTHS_PER_SHARD, MAX_PAGINATION_SHARDS
+
+
+def plan_shards(month: float, months_per_shard: float = MONTHS_PER_SHARD,
+                max_shards: int = MAX_PAGINATION_SHARDS) -> int:
+    """
+    Number of result pages to fetch in parallel for a search window.
+
+    Results are sorted by date, so consecutive pages cover consecutive date ranges. Short
+    windows end within a page or two and are fetched one page at a time; longer windows get
+    one parallel shard per ``months_per_shard`` months, up to ``max_shards``.
+
+    Example:
+        plan_shards(1)
+        1
+        plan_shards(12)
+        4
+    """
+    return max(1, min(max_shards, math.ceil(month / months_per_shard)))
+
+
+class ShardedPagination:
+    """
+    Fetches result pages in waves of ``shards`` concurrent requests.
+
+    Pages of a wave are merged in page order and records already returned by an earlier
+    page are dropped, since results may shift between pages while they are fetched. The
+    results end at the first empty page.
+
+    Example:
+        pagination = ShardedPagination(backend.fetch_page, shards=4)
+        for page, records in pagination.waves():
+            ...
+    """
+
+    def __init__(self, fetch_page: Callable[[int], List[dict]], shards: int, key_field: str = 'url',
+                 start_page: int = 0):
+        self.fetch_page = fetch_page
+        self.shards = shards
+        self.key_field = key_field
+        self.next_page = start_page
+
+        # Keys of every record returned so far
+        self.seen_keys = set()
+        self.exhausted = False
+
+    def waves(self) -> Iterator[tuple]:
+        """
+        Yields ``(last_page, records)`` for each wave, until the results are exhausted.
+
+        Stop iterating to stop fetching, no page after the current wave is requested.
+        """
+        with ThreadPoolExecutor(max_workers=self.shards, thread_name_prefix='page-shard') as executor:
+            while not self.exhausted:
+                pages = range(self.next_page, self.next_page + self.shards)
+                self.next_page += self.shards
+
+                # `map` keeps page order whatever order the requests complete in
+                records = self.merge(executor.map(self.fetch_page, pages))
+                if not records:
+                    return
+                yield pages[-1], records
+
+    def merge(self, pages: Iterator[List[dict]]) -> List[dict]:
+        merged = []
+        for page_records in pages:
+            if not page_records:
+                self.exhausted = True
+                break
+
+            for record in page_records:
+                key = record.get(self.key_field)
+                if key is not None:
+                    if key in self.seen_keys:
+                        continue
+                    self.seen_keys.add(key)
+                merged.append(record)
+        return merged
@@ -0,0 +1,191 @@
+import bisect
+import functools
+import html
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from constants import PROFILE_HISTOGRAM_BUCKETS
+from configs import logger as log
+
+PROFILE_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Run profile - %(title)s</title>
+<style>
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; }
+th, td { padding: 4px 10px; border-bottom: 1px solid #ddd; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+.bar { display: inline-block; width: 10px; margin-right: 1px; background: #4a7bd0; vertical-align: bottom; }
+</style>
+</head>
+<body>
+<h1>Run profile - %(title)s</h1>
+<p>%(started_at)s, %(duration).3fs wall clock. Histogram buckets (s): %(buckets)s</p>
+<table>
+<tr><th>Stage</th><th>Count</th><th>Total (s)</th><th>Mean (s)</th><th>p50 (s)</th><th>p95 (s)</th><th>Max (s)</th><th>Histogram</th></tr>
+%(rows)s
+</table>
+</body>
+</html>
+"""
+
+
+class RunProfiler:
+    """
+    Collects how long each stage of a run takes.
+
+    Stages are timed with the ``stage`` context manager, the ``profiled`` decorator or by
+    recording a duration directly, from any thread. WebDriver commands are timed by
+    ``instrument_webdriver``. ``write`` saves a JSON and an HTML report with the count,
+    totals, percentiles and a histogram of every stage.
+
+    Example:
+        profiler = RunProfiler()
+        with profiler.stage('open_browser'):
+            ...
+        profiler.write('output/profile-economy')
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.started = time.monotonic()
+        self.durations: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self.durations.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - started)
+
+    def instrument_webdriver(self, driver):
+        """
+        Times every command the WebDriver sends, as ``webdriver.<command>`` stages.
+
+        The driver is wrapped once and reports to the profiler that instrumented it last,
+        so a pooled browser reports to the scraper currently using it.
+        """
+        driver._run_profiler = self
+        if getattr(driver, '_profiled_execute', None):
+            return
+
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def profiled_execute(command, params=None):
+            started = time.monotonic()
+            try:
+                return execute(command, params)
+            finally:
+                driver._run_profiler.record(f'webdriver.{command}', time.monotonic() - started)
+
+        driver.execute = driver._profiled_execute = profiled_execute
+
+    def summary(self) -> Dict[str, dict]:
+        with self._lock:
+            durations = {name: sorted(values) for name, values in self.durations.items()}
+
+        summary = {}
+        for name, values in sorted(durations.items(), key=lambda entry: -sum(entry[1])):
+            histogram = [0] * (len(PROFILE_HISTOGRAM_BUCKETS) + 1)
+            for value in values:
+                histogram[bisect.bisect_left(PROFILE_HISTOGRAM_BUCKETS, value)] += 1
+
+            summary[name] = {
+                'count': len(values),
+                'total': round(sum(values), 6),
+                'mean': round(sum(values) / len(values), 6),
+                'min': round(values[0], 6),
+                'p50': round(self.percentile(values, 50), 6),
+                'p95': round(self.percentile(values, 95), 6),
+                'max': round(values[-1], 6),
+                'histogram': histogram,
+            }
+        return summary
+
+    @staticmethod
+    def percentile(sorted_values: List[float], percent: float) -> float:
+        index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    def write(self, path_prefix: str, title: Optional[str] = None, metrics: Optional[dict] = None):
+        """
+        Writes ``<path_prefix>.json`` and ``<path_prefix>.html``.
+
+        Args:
+            path_prefix (str): Path of the reports without extension.
+            title (Optional[str]): Shown in the HTML report, e.g. the search phrase.
+            metrics (Optional[dict]): Other figures of the run, e.g. the request rate, added to the JSON report.
+        """
+        summary = self.summary()
+        duration = time.monotonic() - self.started
+
+        report = {
+            'started_at': self.started_at.isoformat(),
+            'duration_seconds': round(duration, 6),
+            'histogram_buckets': list(PROFILE_HISTOGRAM_BUCKETS),
+            'stages': summary,
+        }
+        if metrics:
+            report['metrics'] = metrics
+        with open(f'{path_prefix}.json', 'w', encoding='utf-8') as json_file:
+            json.dump(report, json_file, indent=2)
+
+        rows = []
+        for name, stats in summary.items():
+            peak = max(stats['histogram']) or 1
+            bars = ''.join(
+                f'<span class="bar" title="{count}" style="height: {2 + 30 * count // peak}px"></span>'
+                for count in stats['histogram']
+            )
+            rows.append(
+                f"<tr><td>{html.escape(name)}</td><td>{stats['count']}</td><td>{stats['total']:.3f}</td>"
+                f"<td>{stats['mean']:.3f}</td><td>{stats['p50']:.3f}</td><td>{stats['p95']:.3f}</td>"
+                f"<td>{stats['max']:.3f}</td><td>{bars}</td></tr>"
+            )
+
+        with open(f'{path_prefix}.html', 'w', encoding='utf-8') as html_file:
+            html_file.write(PROFILE_HTML_TEMPLATE % {
+                'title': html.escape(title or ''),
+                'started_at': self.started_at.isoformat(),
+                'duration': duration,
+                'buckets': ', '.join(str(bucket) for bucket in PROFILE_HISTOGRAM_BUCKETS),
+                'rows': '\n'.join(rows),
+            })
+
+        log.info(f"Run profile generated at {path_prefix}.html")
+
+
+def profiled(stage: Optional[str] = None):
+    """
+    Decorator timing a scraper method with the instance's ``profiler``.
+
+    Example:
+        @profiled()
+        def sort_by_latest(self):
+            ...
+    """
+
+    def decorator(method):
+        name = stage or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.stage(name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
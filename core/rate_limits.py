@@ -0,0 +1,160 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from constants import (
+    RATE_INITIAL,
+    RATE_MIN,
+    RATE_MAX,
+    RATE_BURST,
+    RATE_INCREASE,
+    RATE_DECREASE_FACTOR,
+    RATE_DECREASE_COOLDOWN,
+    RATE_SLOW_RESPONSE,
+    RATE_SLOW_FACTOR,
+    RATE_LATENCY_SMOOTHING,
+    RATE_MAX_RETRIES
+)
+from configs import logger as log
+
+
+class RateLimiter:
+    """
+    Adaptive request rate of one site, shared by its page loads and image downloads.
+
+    Requests take tokens from a bucket refilled at the current rate, at most ``burst`` of them
+    go out back to back. The rate grows additively with every healthy response and is cut
+    multiplicatively (at most once per cooldown) on errors and on responses much slower than
+    usual, so scraping speeds up while the site keeps up and backs off as soon as it struggles.
+
+    Example:
+        limiter = RateLimiter(max_rate=10)
+        with limiter.track():
+            browser.go_to(url)
+        limiter.metrics()
+        {'rate': 4.5, 'latency_seconds': 0.8, 'requests': 1, ...}
+    """
+
+    def __init__(self,
+                 max_rate: float = RATE_MAX,
+                 initial_rate: float = RATE_INITIAL,
+                 min_rate: float = RATE_MIN,
+                 burst: int = RATE_BURST):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = min(initial_rate, max_rate)
+        self.burst = burst
+
+        # Token bucket, negative while requests are queued for a token
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+        # Smoothed latency of healthy responses, the baseline slow responses are measured against
+        self.latency = None
+        self.last_decrease = 0.0
+
+        # Metrics
+        self.requests = 0
+        self.errors = 0
+        self.slow_responses = 0
+        self.decreases = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> float:
+        """
+        Blocks until a request may be sent.
+
+        Returns:
+            float: Seconds spent waiting for a token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.throttled_seconds += delay
+
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def record(self, latency: float, failed: bool = False):
+        # Adjust the rate to the outcome of a request
+        with self._lock:
+            self.requests += 1
+            slow = not failed and self.latency is not None and latency > max(
+                RATE_SLOW_RESPONSE, RATE_SLOW_FACTOR * self.latency
+            )
+
+            if not failed:
+                self.latency = latency if self.latency is None else (
+                    RATE_LATENCY_SMOOTHING * latency + (1 - RATE_LATENCY_SMOOTHING) * self.latency
+                )
+
+            if not (failed or slow):
+                self.rate = min(self.max_rate, self.rate + RATE_INCREASE)
+                return
+
+            if failed:
+                self.errors += 1
+            else:
+                self.slow_responses += 1
+
+            # The next request waits for a fresh token, without the burst left in the bucket
+            self.tokens = min(self.tokens, 0.0)
+
+            # Requests in flight fail together, one cut per cooldown is enough
+            now = time.monotonic()
+            if now - self.last_decrease < RATE_DECREASE_COOLDOWN:
+                return
+            self.last_decrease = now
+            self.decreases += 1
+            self.rate = max(self.min_rate, self.rate * RATE_DECREASE_FACTOR)
+            rate = self.rate
+
+        log.warning("Request rate lowered to {:.2f}/s after a {} response", rate, 'failed' if failed else 'slow')
+
+    @contextmanager
+    def track(self):
+        """Waits for a token, then records how the wrapped request went."""
+        self.wait()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.record(time.monotonic() - started, failed=True)
+            raise
+        self.record(time.monotonic() - started)
+
+    def call(self, func: Callable, retryable: Callable[[Exception], bool], retries: int = RATE_MAX_RETRIES):
+        """
+        Calls ``func`` at the site's rate, retrying errors ``retryable`` accepts at a lowered rate.
+
+        Returns:
+            The result of ``func``.
+        """
+        for attempt in range(retries + 1):
+            try:
+                with self.track():
+                    return func()
+
+            except Exception as e:
+                if attempt == retries or not retryable(e):
+                    raise
+                log.warning("Retrying request {}/{} after {}: {}", attempt + 1, retries, type(e).__name__, e)
+
+    def metrics(self) -> dict:
+        # Current rate and counters, e.g. for run summaries
+        with self._lock:
+            return {
+                'rate': round(self.rate, 3),
+                'latency_seconds': round(self.latency, 3) if self.latency is not None else None,
+                'requests': self.requests,
+                'errors': self.errors,
+                'slow_responses': self.slow_responses,
+                'decreases': self.decreases,
+                'throttled_seconds': round(self.throttled_seconds, 3),
+            }
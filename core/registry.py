@@ -0,0 +1,19 @@
+from typing import Dict, List
+
+
+def resolve_sites(sites: str, scrapers: Dict[str, type]) -> List[str]:
+    """
+    Splits a comma separated list of sites and checks each one has a scraper in ``scrapers``.
+
+    Example:
+        resolve_sites("aljazeera", SCRAPERS)
+        ['aljazeera']
+    """
+    names = list(dict.fromkeys(site.strip().lower() for site in (sites or '').split(',') if site.strip()))
+    if not names:
+        raise ValueError("No site to scrape")
+
+    for name in names:
+        if name not in scrapers:
+            raise ValueError(f"site:{name} is not supported, choose from {list(scrapers)}")
+    return names
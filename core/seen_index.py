@@ -0,0 +1,120 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+
+from constants import SEEN_INDEX_COMMIT_EVERY
+from configs import logger as log
+
+
+class SeenIndex:
+    """
+    On-disk index of the articles already scraped for each search phrase.
+
+    Incremental runs consult it to skip articles captured by a previous run, and stop
+    paginating once they reach them. Articles are recorded when they are exported, so an
+    article only counts as seen once it made it into the output files. Instances are shared
+    per path: every scraper of a batch writes through one connection instead of holding
+    competing write transactions on the same file.
+
+    Example:
+        index = SeenIndex.load("state/seen_articles.sqlite3")
+        index.add("economy", "https://www.aljazeera.com/news/1", "output/images/1.jpg")
+        index.contains("economy", "https://www.aljazeera.com/news/1")
+        True
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str, commit_every: int = SEEN_INDEX_COMMIT_EVERY):
+        self.path = path
+        self.commit_every = commit_every
+        self.uncommitted = 0
+        # Scrapers using this index, the connection is closed when the last one is done
+        self.users = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Image downloads complete on other threads, so the connection is shared behind a lock
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            # Readers of other processes don't block on the batched write transaction
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS seen_articles ("
+                "search_phrase TEXT NOT NULL, "
+                "article_key TEXT NOT NULL, "
+                "image_path TEXT, "
+                "seen_at TEXT NOT NULL, "
+                "PRIMARY KEY (search_phrase, article_key))"
+            )
+            self.connection.commit()
+
+    @classmethod
+    def load(cls, path: str) -> 'SeenIndex':
+        with cls._instances_lock:
+            key = os.path.abspath(path)
+            if key not in cls._instances:
+                cls._instances[key] = cls(path)
+            index = cls._instances[key]
+            index.users += 1
+            return index
+
+    def contains(self, search_phrase: str, article_key: str) -> bool:
+        return self.get_image_path(search_phrase, article_key, default=False) is not False
+
+    def get_image_path(self, search_phrase: str, article_key: str, default=None) -> Optional[str]:
+        # Local image recorded for a seen article
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT image_path FROM seen_articles WHERE search_phrase = ? AND article_key = ?",
+                (search_phrase, article_key)
+            ).fetchone()
+        return row[0] if row else default
+
+    def add(self, search_phrase: str, article_key: str, image_path: Optional[str]):
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO seen_articles (search_phrase, article_key, image_path, seen_at) "
+                "VALUES (?, ?, ?, ?)",
+                (search_phrase, article_key, image_path, datetime.now().isoformat())
+            )
+            self.uncommitted += 1
+
+            # Commit in batches, a crash only forgets the last few articles
+            if self.uncommitted >= self.commit_every:
+                self.connection.commit()
+                self.uncommitted = 0
+
+    def commit(self):
+        with self._lock:
+            self.connection.commit()
+            self.uncommitted = 0
+
+    def forget_since(self, search_phrase: str, since: str):
+        # Drop articles recorded after `since` (ISO time), e.g. rows a resumed run is about to write again
+        with self._lock:
+            self.connection.execute(
+                "DELETE FROM seen_articles WHERE search_phrase = ? AND seen_at > ?", (search_phrase, since)
+            )
+            self.connection.commit()
+
+    def close(self):
+        with self._instances_lock:
+            self.users -= 1
+            if self.users > 0:
+                # Still used by other scrapers
+                self.commit()
+                return
+            self._instances.pop(os.path.abspath(self.path), None)
+
+        with self._lock:
+            self.connection.commit()
+            self.connection.close()
+        log.debug(f"Seen articles index saved at {self.path}")
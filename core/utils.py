@@ -0,0 +1,34 @@
+import re
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+def slugify(text: str, max_length: int = 50) -> str:
+    """
+    Converts a text into a lowercase, filesystem safe slug.
+
+    Example:
+        slugify("Climate Change: 2024!")
+        'climate-change-2024'
+    """
+    return re.sub(r'[^a-z0-9]+', '-', (text or '').lower()).strip('-')[:max_length]
+
+
+def chain_future(future: Future, func: Callable[[Any], Any]) -> Future:
+    """
+    Future resolving to ``func`` applied to the result of ``future``, once it completes.
+
+    Example:
+        width = chain_future(image, lambda image: image.width)
+    """
+    chained = Future()
+
+    def resolve(done: Future):
+        # An error of ``future`` or ``func`` fails the chained future rather than leaving it pending
+        try:
+            chained.set_result(func(done.result()))
+        except Exception as e:
+            chained.set_exception(e)
+
+    future.add_done_callback(resolve)
+    return chained
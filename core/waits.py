@@ -0,0 +1,245 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from RPA.Browser.Selenium import Selenium
+from selenium.common import NoSuchElementException, TimeoutException
+
+from constants import (
+    WAIT_TIMEOUT,
+    WAIT_MIN_TIMEOUT,
+    WAIT_OPTIONAL_TIMEOUT,
+    WAIT_PAGE_BUDGET,
+    WAIT_SCRIPT_SLICE,
+    WAIT_HISTORY_SIZE,
+    WAIT_MIN_SAMPLES,
+    WAIT_ADAPTIVE_FACTOR,
+    WAIT_TIMINGS_PATH
+)
+from configs import logger as log
+
+# Resolves as soon as the condition on the XPath holds, re-checked on every DOM mutation and
+# ready state change instead of polling from Python. Resolves false after `timeout` ms.
+# Conditions: "visible", "hidden" (missing or not visible) and "count" (at least `count` matches).
+WAIT_FOR_ELEMENT_SCRIPT = """
+var xpath = arguments[0], state = arguments[1], count = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function isVisible(element) {
+    if (!element || !(element.offsetWidth || element.offsetHeight || element.getClientRects().length)) {
+        return false;
+    }
+    return window.getComputedStyle(element).visibility !== 'hidden';
+}
+
+function check() {
+    if (state === 'count') {
+        return document.evaluate('count(' + xpath + ')', document, null, XPathResult.NUMBER_TYPE, null)
+            .numberValue >= count;
+    }
+    var element = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+        .singleNodeValue;
+    return state === 'visible' ? isVisible(element) : !isVisible(element);
+}
+
+if (check()) {
+    done(true);
+    return;
+}
+
+var observer, timer, finished = false;
+
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    document.removeEventListener('readystatechange', onChange);
+    done(result);
+}
+
+function onChange() {
+    if (check()) {
+        finish(true);
+    }
+}
+
+observer = new MutationObserver(onChange);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+document.addEventListener('readystatechange', onChange);
+timer = setTimeout(function () { finish(check()); }, timeout);
+"""
+
+
+class WaitTimings:
+    """
+    How long each selector took to appear in recent runs, persisted between runs.
+
+    Timeouts are derived from the slowest recent waits, so an optional element that is
+    usually late gets waited for long enough, while one that renders at once is given up on
+    quickly when it is missing. Instances are shared per path, every scraper of a batch
+    learns into the same history.
+
+    Example:
+        timings = WaitTimings.load("state/wait_timings.json")
+        timings.record("visible://div[@id='cookies']", 0.42)
+        timings.timeout_for("visible://div[@id='cookies']", default=2, maximum=10)
+        2
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self.history: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as timings_file:
+                    for key, durations in json.load(timings_file).items():
+                        self.history[key] = deque(durations, maxlen=WAIT_HISTORY_SIZE)
+            except (OSError, ValueError) as e:
+                log.warning(f"Ignoring unreadable wait timings at {path}: {e}")
+
+    @classmethod
+    def load(cls, path: str = WAIT_TIMINGS_PATH) -> 'WaitTimings':
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def record(self, key: str, duration: float):
+        with self._lock:
+            self.history.setdefault(key, deque(maxlen=WAIT_HISTORY_SIZE)).append(round(duration, 3))
+
+    def timeout_for(self, key: str, default: float, maximum: Optional[float] = None) -> float:
+        """
+        Timeout for a selector, learned from its recent wait durations.
+
+        Returns:
+            float: ``WAIT_ADAPTIVE_FACTOR`` times the slowest recent duration, at least
+            ``WAIT_MIN_TIMEOUT`` and at most ``maximum`` (``default`` if not given).
+            ``default`` until enough runs were seen.
+        """
+        with self._lock:
+            durations = list(self.history.get(key, ()))
+
+        if len(durations) < WAIT_MIN_SAMPLES:
+            return default
+        maximum = default if maximum is None else maximum
+        return min(maximum, max(WAIT_MIN_TIMEOUT, max(durations) * WAIT_ADAPTIVE_FACTOR))
+
+    def save(self):
+        with self._lock:
+            history = {key: list(durations) for key, durations in self.history.items()}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write next to the file and swap it in, concurrent readers never see half a file
+        temp_path = f'{self.path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as timings_file:
+            json.dump(history, timings_file)
+        os.replace(temp_path, self.path)
+
+
+class WaitEngine:
+    """
+    Waits for page elements inside the browser instead of polling from Python.
+
+    A single asynchronous script resolves as soon as the element shows up, driven by DOM
+    mutations. Each wait is bounded by its timeout and by the time left in the current page's
+    budget, started with ``start_page``. Optional elements (e.g. a cookie banner) get a timeout
+    learned from how long they took to show up, and never raise.
+
+    Example:
+        waits = WaitEngine(browser)
+        waits.start_page()
+        waits.wait_for("//div[@id='results']")
+        True
+        waits.wait_for("//button[@id='cookies']", optional=True)
+        False
+    """
+
+    def __init__(self, browser: Selenium, timings: Optional[WaitTimings] = None, page_budget: float = WAIT_PAGE_BUDGET):
+        self.browser = browser
+        self.timings = timings or WaitTimings.load()
+        self.page_budget = page_budget
+        self.page_started = time.monotonic()
+
+    def start_page(self):
+        # Every page gets the full waiting budget again
+        self.page_started = time.monotonic()
+
+    def budget_left(self) -> float:
+        return self.page_budget - (time.monotonic() - self.page_started)
+
+    def wait_for(self,
+                 xpath: str,
+                 state: str = 'visible',
+                 count: int = 1,
+                 timeout: float = WAIT_TIMEOUT,
+                 optional: bool = False,
+                 raise_exception: bool = False) -> bool:
+        """
+        Waits until the element matched by ``xpath`` reaches ``state``.
+
+        Args:
+            xpath (str): The XPath expression to locate the element.
+            state (str, optional): ``visible``, ``hidden`` or ``count``. Default is ``visible``.
+            count (int, optional): Matches required by the ``count`` state. Default is 1.
+            timeout (float, optional): Upper bound in seconds. Default is WAIT_TIMEOUT.
+            optional (bool, optional): The element is often absent, wait briefly. Default is False.
+            raise_exception (bool, optional): Raise if the condition is not met. Default is False.
+
+        Returns:
+            bool: True if the condition was met in time, False otherwise.
+
+        Raises:
+            NoSuchElementException: If ``raise_exception`` is set and the condition is not met.
+        """
+        # One history per selector and state, the number of results awaited grows page by page
+        key = f'{state}:{xpath}'
+        if optional:
+            timeout = self.timings.timeout_for(key, default=WAIT_OPTIONAL_TIMEOUT, maximum=timeout)
+        # Required elements always get the full timeout, a shorter learned one would only fail them sooner
+        timeout = min(timeout, max(self.budget_left(), 0))
+
+        started = time.monotonic()
+        met = self._wait(xpath, state, count, timeout)
+        elapsed = time.monotonic() - started
+
+        if met:
+            self.timings.record(key, elapsed)
+            return True
+
+        log.debug("Condition {} not met after {:.2f}s", key, elapsed)
+        if raise_exception and not optional:
+            raise NoSuchElementException(f"Element not {state} for xpath='{xpath}' after {elapsed:.2f}s")
+        return False
+
+    def _wait(self, xpath: str, state: str, count: int, timeout: float) -> bool:
+        driver = self.browser.driver
+        deadline = time.monotonic() + timeout
+
+        # Wait in slices shorter than the driver's script timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            slice_ms = math.ceil(max(min(remaining, WAIT_SCRIPT_SLICE), 0) * 1000)
+            try:
+                if driver.execute_async_script(WAIT_FOR_ELEMENT_SCRIPT, xpath, state, count, slice_ms):
+                    return True
+            except TimeoutException:
+                pass
+
+            if remaining <= WAIT_SCRIPT_SLICE:
+                return False
@@ -1,26 +1,191 @@
 import inspect
 import re
+from concurrent.futures import Future
 from dataclasses import dataclass, fields
-from typing import Iterable, Dict, Any
+from typing import Iterable, Dict, Any, ClassVar, List, Optional, Tuple, Union, get_args, get_origin, get_type_hints
 from datetime import datetime
 
 
-@dataclass
+def resolve_value(value):
+    # Deferred values (e.g. image downloads) are stored as futures until they are read
+    return value.result() if isinstance(value, Future) else value
+
+
+def derived_property(func):
+    """
+    Property computed once per item and cached in a private slot, for fields derived from scraped values.
+
+    The value is kept in the slot ``_<name>``, which the item class declares in its ``__slots__``.
+    ``BaseItem.add_value`` clears it so derived values follow field updates.
+
+    Example:
+        __slots__ = ('_word_count',)
+
+        @derived_property
+        def word_count(self) -> int:
+            return len(self.description.split())
+    """
+    slot = f'_{func.__name__}'
+
+    def getter(self):
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            # Unset slots raise until the value is first computed
+            value = func(self)
+            setattr(self, slot, value)
+            return value
+
+    getter.__name__ = func.__name__
+    getter.__doc__ = func.__doc__
+    getter.__annotations__ = func.__annotations__
+    getter.slot = slot
+    return property(getter)
+
+
+@dataclass(slots=True)
 class BaseItem:
+    """
+    Scraped item stored in slots rather than a per-instance dict.
+
+    Subclasses add derived properties and declare ``__slots__`` to stay dict-free, holding the
+    cached value of each ``derived_property`` (empty if there are none). The field and property
+    names are introspected once per class and cached.
+    """
     title:          str
     description:    str
-    image_path:     str
+    image_path:     Union[str, Future]
     search_phrase:  str
     publish_date:   datetime
     created_at:     datetime = datetime.now()
+    url:            str = ''
+    source:         str = ''
+    image_width:    Optional[Union[int, Future]] = None
+    image_height:   Optional[Union[int, Future]] = None
+    image_bytes:    Optional[Union[int, Future]] = None
+
+    # Field and property names of the class, and both in header order, computed on first use
+    _schema:        ClassVar[Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]] = None
+    _headers:       ClassVar[Optional[Tuple[str, ...]]] = None
+
+    # Slots caching the derived properties of the class
+    _derived_slots: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super(BaseItem, cls).__init_subclass__(**kwargs)
+        # Computed lazily, once any dataclass decorator of the subclass has added its fields
+        cls._schema = None
+        cls._headers = None
+
+        cls._derived_slots = tuple(
+            member.fget.slot for _, member in inspect.getmembers(cls, lambda v: isinstance(v, property))
+            if hasattr(member.fget, 'slot')
+        )
+        for slot in cls._derived_slots:
+            if not hasattr(cls, slot):
+                raise TypeError(f"{cls.__name__} must declare the slot {slot} of its derived property")
+
+    @classmethod
+    def get_schema(cls) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        # Public dataclass fields and properties, introspected once per class
+        if cls._schema is None:
+            field_names = tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+            property_names = tuple(
+                name for name, _ in inspect.getmembers(cls, lambda v: isinstance(v, property))
+            )
+            cls._schema = (field_names, property_names)
+        return cls._schema
 
     def add_value(self, name, value):
-        if hasattr(self, name):
-            setattr(self, name, value)
-        raise AttributeError(f"{name:} not specified")
+        if not hasattr(self, name):
+            raise AttributeError(f"{name:} not specified")
+        setattr(self, name, value)
+
+        # Derived values may depend on the updated field
+        for slot in self._derived_slots:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                pass
+
+    @classmethod
+    def field_names(cls) -> Tuple[str, ...]:
+        # Public dataclass fields, private ones hold internal state
+        return cls.get_schema()[0]
+
+    @classmethod
+    def property_names(cls) -> Tuple[str, ...]:
+        return cls.get_schema()[1]
+
+    @classmethod
+    def get_column_types(cls) -> Dict[str, type]:
+        """
+        Python type of the values of every header, e.g. for typed output files.
+
+        Deferred values are typed by what they resolve to, ``Union[int, Future]`` is ``int``.
+        """
+        hints = get_type_hints(cls)
+        types = {name: hints[name] for name in cls.field_names()}
+        for name in cls.property_names():
+            types[name] = get_type_hints(getattr(cls, name).fget).get('return')
+
+        for name, hint in types.items():
+            if get_origin(hint) is Union:
+                hint = next((arg for arg in get_args(hint) if arg not in (type(None), Future)), None)
+            types[name] = hint
+        return types
+
+    @classmethod
+    def evaluate(cls, items: Iterable['BaseItem']) -> List['BaseItem']:
+        """
+        Computes the derived properties of many items at once.
+
+        Args:
+            items (Iterable[BaseItem]): Items to evaluate, e.g. loaded back from storage for re-export.
+
+        Returns:
+            list: The same items with every property cached.
+        """
+        items = list(items)
+        property_names = cls.property_names()
+        for item in items:
+            for name in property_names:
+                getattr(item, name)
+        return items
+
+    @classmethod
+    def header_names(cls) -> Tuple[str, ...]:
+        # Field names followed by property names, the same order as `load_items` and `to_tuple`
+        if cls._headers is None:
+            cls._headers = cls.field_names() + cls.property_names()
+        return cls._headers
+
+    @classmethod
+    def get_headers(cls) -> List[str]:
+        return list(cls.header_names())
+
+    @staticmethod
+    def article_key(url: str, title: str, publish_date: Optional[datetime]) -> str:
+        # Identity of an article: its URL, or its title and publish date when the URL is unknown
+        if url:
+            return url
+        return f"{title}|{publish_date.isoformat() if publish_date else ''}"
+
+    def get_key(self) -> str:
+        return self.article_key(self.url, self.title, self.publish_date)
+
+    def is_resolved(self) -> bool:
+        # Whether every deferred value (e.g. image download) has completed
+        values = (getattr(self, name) for name in self.field_names())
+        return all(value.done() for value in values if isinstance(value, Future))
+
+    def to_row(self, headers: List[str]) -> List[Any]:
+        # Values for the given headers, waiting for any deferred values
+        return [resolve_value(getattr(self, name)) for name in headers]
 
-    def get_headers(self):
-        return list(self.load_items().keys())
+    def to_tuple(self) -> Tuple[Any, ...]:
+        # Values in `get_headers` order, the fast path for exporters
+        return tuple(resolve_value(getattr(self, name)) for name in self.header_names())
 
     def load_items(self) -> Dict[str, Any]:
         """
@@ -30,14 +195,11 @@ class BaseItem:
             dict: A dictionary with attribute names as keys and their corresponding values.
         """
 
-        # Get all dataclass fields
-        dataclass_fields = {f.name: getattr(self, f.name) for f in fields(self)}
+        # Get all dataclass fields, waiting for any deferred values
+        dataclass_fields = {name: resolve_value(getattr(self, name)) for name in self.field_names()}
 
         # Get all properties
-        properties = {
-            name: getattr(self, name)
-            for name, value in inspect.getmembers(self.__class__, lambda v: isinstance(v, property))
-        }
+        properties = {name: getattr(self, name) for name in self.property_names()}
 
         # Combine both
         return {**dataclass_fields, **properties}
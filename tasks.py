@@ -1,11 +1,13 @@
-from bots.aljazeera_bot.bot import AlJazeeraScraper
-from configs import get_work_items, setup_logger, logger
+from bots.registry import SCRAPERS
+from configs import get_work_items, get_batch_work_items, get_batch_workers, setup_logger, logger
+from core.batch import BatchRunner
+from core.registry import resolve_sites
 from robocorp.tasks import task, get_output_dir
 
 from constants import DEFAULT_OUTPUT_DIRECTORY
 
 
-def pre_configs():
+def pre_configs(load_work_items=get_work_items):
 
     """Pre Execution Configs here"""
 
@@ -13,7 +15,7 @@ def pre_configs():
     output_dir = get_output_dir() if get_output_dir() else DEFAULT_OUTPUT_DIRECTORY
     setup_logger(output_dir)
     # Load Config from Work items
-    return get_work_items()
+    return load_work_items()
 
 
 @task
@@ -21,7 +23,22 @@ def run_news_scraper_bot():
     config = pre_configs()
     logger.info("Task Started")
 
-    scraper = AlJazeeraScraper(config=config)
-    scraper.main()
+    sites = resolve_sites(config.sites, SCRAPERS)
+    if len(sites) == 1:
+        scraper = SCRAPERS[sites[0]](config=config)
+        scraper.main()
+    else:
+        # Several sites of one phrase are scraped concurrently
+        runner = BatchRunner(SCRAPERS, [config], workers=len(sites))
+        runner.run()
     logger.info("Task Completed")
 
+
+@task
+def run_news_scraper_batch():
+    configs = pre_configs(get_batch_work_items)
+    logger.info(f"Batch Task Started with {len(configs)} searches")
+
+    runner = BatchRunner(SCRAPERS, configs, workers=get_batch_workers())
+    runner.run()
+    logger.info("Batch Task Completed")
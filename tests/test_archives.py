@@ -0,0 +1,77 @@
+import os
+import tarfile
+
+import pytest
+
+from core.archives import ImageArchive
+
+
+def write_image(folder, name):
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as image_file:
+        image_file.write(os.urandom(2048))
+    return path
+
+
+def archive_and_remove(archive, folder, *names):
+    # What a run with KEEP_IMAGES_FOLDER=false does with each downloaded image
+    for name in names:
+        path = write_image(folder, name)
+        archive.add(path)
+        os.remove(path)
+
+
+def tar_names(path):
+    with tarfile.open(path) as archive:
+        return sorted(archive.getnames())
+
+
+@pytest.mark.parametrize('truncate', [False, True])
+def test_resumed_tar_keeps_the_images_of_the_interrupted_run(tmp_path, truncate):
+    folder, path = str(tmp_path / 'images'), str(tmp_path / 'images.tar')
+    os.makedirs(folder)
+
+    first = ImageArchive(path, 'tar')
+    archive_and_remove(first, folder, 'a.jpg', 'b.jpg')
+    first.close()
+    if truncate:
+        # Killed while writing the last member
+        with open(path, 'r+b') as archive_file:
+            archive_file.truncate(512 + 2048 + 512 + 1024)
+
+    # Downloaded but not archived yet when the run stopped
+    write_image(folder, 'c.jpg')
+
+    assert ImageArchive.can_resume(path, 'tar')
+    resumed = ImageArchive(path, 'tar', resume=True)
+    resumed.add_folder(folder, remove=True)
+    archive_and_remove(resumed, folder, 'd.jpg')
+    resumed.close()
+
+    expected = ['a.jpg', 'c.jpg', 'd.jpg'] if truncate else ['a.jpg', 'b.jpg', 'c.jpg', 'd.jpg']
+    assert tar_names(path) == expected
+    assert os.listdir(folder) == []
+    assert not os.path.exists(f'{path}.previous')
+
+
+def test_resumed_zip_skips_images_already_archived(tmp_path):
+    folder, path = str(tmp_path / 'images'), str(tmp_path / 'images.zip')
+    os.makedirs(folder)
+
+    first = ImageArchive(path, 'zip')
+    first.add(write_image(folder, 'a.jpg'))
+    first.close()
+
+    resumed = ImageArchive(path, 'zip', resume=True)
+    resumed.add_folder(folder)
+    resumed.close()
+    assert resumed.members == 1
+
+
+def test_unclosed_zip_cannot_be_resumed(tmp_path):
+    path = str(tmp_path / 'images.zip')
+    with open(path, 'wb') as archive_file:
+        archive_file.write(b'PK\x03\x04 killed while writing')
+
+    assert not ImageArchive.can_resume(path, 'zip')
+    assert ImageArchive.can_resume(str(tmp_path / 'missing.zip'), 'zip')
@@ -0,0 +1,79 @@
+import glob
+import json
+from types import SimpleNamespace
+
+from core.batch import BatchRunner
+
+
+class FakeScraper:
+    # Scrapes nothing, fails for the phrase "broken"
+
+    max_concurrent_searches = 1
+    max_request_rate = 100
+
+    def __init__(self, config, **kwargs):
+        self.config, self.pools = config, kwargs
+        self.search_phrase = config.search_phrase
+        self.month = 1
+        self.backend_name = config.backend
+        self.items_scraped = 0
+        self.output_paths = []
+        self.archive_path = None
+        self.error = None
+
+    def main(self):
+        if self.search_phrase == 'broken':
+            raise RuntimeError("scraper crashed")
+        self.items_scraped = 3
+
+
+def config_for(phrase, **settings):
+    return SimpleNamespace(**{'search_phrase': phrase, 'sites': 'fake', 'backend': 'http', 'image_store_path': None,
+                              'image_max_dimension': None, 'image_format': 'webp', 'browser_profile': 'default',
+                              **settings})
+
+
+def test_failed_search_is_summarised_and_the_batch_carries_on(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    configs = [config_for('broken'), config_for('economy')]
+
+    results = BatchRunner({'fake': FakeScraper}, configs, workers=1).run()
+
+    statuses = {result['search_phrase']: (result['status'], result['error']) for result in results}
+    assert statuses == {'broken': ('failed', 'scraper crashed'), 'economy': ('completed', None)}
+
+    [summary_path] = glob.glob('output/*.json')
+    with open(summary_path, encoding='utf-8') as summary_file:
+        summary = json.load(summary_file)
+    assert summary['searches'] == 2
+    assert summary['items'] == 3
+
+
+def test_searches_get_the_pools_of_their_own_image_settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    configs = [
+        config_for('economy'),
+        config_for('war', image_store_path=str(tmp_path / 'store'), image_max_dimension=640),
+        config_for('climate', image_max_dimension=640, image_format='jpeg'),
+        config_for('sports', image_max_dimension=640),
+    ]
+    scrapers = []
+
+    class RecordingScraper(FakeScraper):
+        def main(self):
+            scrapers.append(self)
+
+    runner = BatchRunner({'fake': RecordingScraper}, configs, workers=1)
+    runner.run()
+
+    assert len(scrapers) == 4
+    assert len(runner.downloaders) == 2
+    assert set(runner.image_processors) == {(640, 'webp'), (640, 'jpeg')}
+    for scraper in scrapers:
+        config, pools = scraper.config, scraper.pools
+        assert pools['downloader'] is runner.downloaders[config.image_store_path]
+        processor = pools['image_processor']
+        if config.image_max_dimension:
+            assert processor.extension == {'webp': '.webp', 'jpeg': '.jpg'}[config.image_format]
+        else:
+            assert processor is None
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from core.browser_pool import BrowserPool, PooledBrowser
+
+
+class FakeBrowser:
+
+    def __init__(self):
+        self.closed = False
+
+    def close_all_browsers(self):
+        self.closed = True
+
+
+class FlakyPool(BrowserPool):
+    # Opens fake browsers, failing while ``broken`` is set
+
+    def __init__(self, **kwargs):
+        super().__init__('https://example.com', size=1, **kwargs)
+        self.broken = False
+
+    def _create(self):
+        if self.broken:
+            raise RuntimeError("browser failed to start")
+        pooled = PooledBrowser(FakeBrowser())
+        self.browsers.append(pooled)
+        return pooled
+
+
+def test_failed_replacement_keeps_the_slot():
+    pool = FlakyPool(max_uses=1, acquire_timeout=0.1)
+    pool.warm()
+
+    lease = pool.acquire()
+    pool.broken = True
+    # Recycled after its only use, the replacement fails to open
+    pool.release(lease)
+    assert lease.browser.closed
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+    # The slot survives failed attempts and is filled once browsers open again
+    pool.broken = False
+    assert isinstance(pool.acquire().browser, FakeBrowser)
+
+
+def test_acquire_times_out_when_every_browser_is_leased():
+    pool = FlakyPool(acquire_timeout=0.1)
+    pool.warm()
+    pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+
+def test_memory_usage_covers_the_driver_process():
+    pooled = PooledBrowser(FakeBrowser())
+    assert BrowserPool._memory_usage(pooled) == 0
+
+    # Measured from the driver service process, here the test process itself
+    pooled.browser.driver = type('Driver', (), {})()
+    pooled.browser.driver.service = type('Service', (), {})()
+    pooled.browser.driver.service.process = type('Process', (), {'pid': os.getpid()})()
+    assert BrowserPool._memory_usage(pooled) > 0
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from core.checkpoint import Checkpoint, CheckpointStore
+
+
+def checkpoint_for(phrase, site='aljazeera'):
+    return Checkpoint(phrase, month=1, backend='http', export_formats=['csv'], started_at=datetime.now().isoformat(),
+                      page=4, cursor_index=40, last_key='https://example.com/40', items_exported=38, site=site)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    checkpoint = checkpoint_for('economy')
+    store.save(checkpoint)
+
+    assert store.load('economy', site='aljazeera') == checkpoint
+    assert store.load('economy', site='other') is None
+
+    store.clear('economy', site='aljazeera')
+    assert store.load('economy', site='aljazeera') is None
+
+
+def test_phrases_with_the_same_slug_keep_their_own_checkpoint(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    # Neither phrase has an ASCII character left once slugified
+    store.save(checkpoint_for('اقتصاد'))
+    store.save(checkpoint_for('经济'))
+
+    assert store.path_for('اقتصاد', 'aljazeera') != store.path_for('经济', 'aljazeera')
+    assert store.load('اقتصاد', site='aljazeera').search_phrase == 'اقتصاد'
+    assert store.load('经济', site='aljazeera').search_phrase == '经济'
+
+
+def test_checkpoint_age():
+    checkpoint = checkpoint_for('economy')
+    checkpoint.saved_at = (datetime.now() - timedelta(hours=30)).isoformat()
+    assert checkpoint.age() > timedelta(hours=24)
@@ -0,0 +1,24 @@
+from core.cursor import ResultsCursor
+
+
+def test_cursor_advances_past_the_records_read():
+    cursor = ResultsCursor()
+    cursor.advance(0, [{'url': 'a'}, {'url': 'b'}], key_field='url')
+    assert (cursor.index, cursor.last_key) == (2, 'b')
+
+
+def test_cursor_keeps_its_anchor_without_a_new_key():
+    cursor = ResultsCursor(index=2, last_key='b')
+
+    cursor.advance(2, [], key_field='url')
+    assert (cursor.index, cursor.last_key) == (2, 'b')
+
+    cursor.advance(2, [{'url': None}], key_field='url')
+    assert (cursor.index, cursor.last_key) == (3, 'b')
+
+
+def test_cursor_follows_a_resynced_start():
+    # The list was re-rendered and the anchor found further down, reading resumed after it
+    cursor = ResultsCursor(index=2, last_key='b')
+    cursor.advance(5, [{'url': 'f'}], key_field='url')
+    assert (cursor.index, cursor.last_key) == (6, 'f')
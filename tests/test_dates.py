@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta
+
+from bots.aljazeera_bot import utils
+from bots.aljazeera_bot.utils import parse_date_string
+
+
+def test_known_formats():
+    assert parse_date_string("12 Jun 2024") == datetime(2024, 6, 12)
+    assert parse_date_string("June 12, 2024") == datetime(2024, 6, 12)
+    assert parse_date_string("Invalid date string") is None
+
+
+def test_relative_dates_follow_the_clock():
+    assert abs(parse_date_string("2 hours ago") - (datetime.now() - timedelta(hours=2))) < timedelta(seconds=5)
+
+
+def test_fuzzy_fallback_is_not_memoized(monkeypatch):
+    # Dateutil completes a date without a year from today, a cached result would go stale
+    parsed = []
+    monkeypatch.setattr(utils, 'date_parser', lambda text, fuzzy: parsed.append(text) or datetime(2024, 6, 12))
+
+    for _ in range(2):
+        assert parse_date_string("Published on 12/06") == datetime(2024, 6, 12)
+    assert parsed == ["Published on 12/06"] * 2
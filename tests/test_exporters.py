@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+
+from core.exporters import EXPORTERS, ParquetExporter
+
+HEADERS = ['title', 'publish_date', 'image_width']
+COLUMN_TYPES = {'title': str, 'publish_date': datetime, 'image_width': int}
+ROWS = [
+    ['First', datetime(2024, 6, 12), None],
+    ['Second', datetime(2024, 6, 11), 640],
+    ['Third', datetime(2024, 6, 10), 320],
+]
+
+
+def read_back(exporter_class, path):
+    # Opening an exporter truncates its file, read it through an instance that was never opened
+    reader = exporter_class.__new__(exporter_class)
+    reader.path, reader.headers, reader.column_types = path, HEADERS, COLUMN_TYPES
+    return reader.read_rows()
+
+
+def export(exporter_class, path, rows, resume_rows=0, **kwargs):
+    exporter = exporter_class(path, HEADERS, resume_rows=resume_rows, column_types=COLUMN_TYPES, **kwargs)
+    for row in rows:
+        exporter.write(row)
+    exporter.close()
+    return exporter
+
+
+@pytest.mark.parametrize('name', ['csv', 'jsonl', 'xlsx', 'parquet'])
+def test_resumed_file_keeps_rows_of_the_interrupted_run(tmp_path, name):
+    exporter_class = EXPORTERS[name]
+    if not exporter_class.available:
+        pytest.skip(f'{name} dependencies are not installed')
+    path = str(tmp_path / f'news.{exporter_class.extension}')
+
+    export(exporter_class, path, ROWS[:2])
+    assert exporter_class.can_resume(path)
+
+    # The checkpoint was saved after the first row, the second is scraped again
+    export(exporter_class, path, ROWS[1:], resume_rows=1)
+
+    rows = read_back(exporter_class, path)
+    assert [row[0] for row in rows] == ['First', 'Second', 'Third']
+
+
+def test_parquet_types_columns_empty_in_the_first_row_group(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    path = str(tmp_path / 'news.parquet')
+
+    # A row group of one row whose image width is still unknown
+    export(ParquetExporter, path, ROWS, row_group_size=1)
+
+    import pyarrow.parquet as pq
+    table = pq.read_table(path)
+    assert table.schema.field('image_width').type == pa.int64()
+    assert table.column('image_width').to_pylist() == [None, 640, 320]
+
+
+def test_resumed_xlsx_rows_keep_the_types_of_their_columns(tmp_path):
+    path = str(tmp_path / 'news.xlsx')
+    rows = [['2024', datetime(2024, 6, 12), 640], ['2024-06-11', datetime(2024, 6, 11), None]]
+
+    # Killed before the workbook was saved, only the journal is left
+    exporter = EXPORTERS['xlsx'](path, HEADERS, column_types=COLUMN_TYPES)
+    for row in rows:
+        exporter.write(row)
+    exporter.journal.file.close()
+
+    assert read_back(EXPORTERS['xlsx'], path) == rows
+    exporter.workbook.save(str(tmp_path / 'discarded.xlsx'))
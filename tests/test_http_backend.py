@@ -0,0 +1,63 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from bots.aljazeera_bot.constants import ALJAZEERA_TITLE_SUFFIX
+from bots.aljazeera_bot.http_backend import AlJazeeraHttpBackend
+
+
+def test_search_results_map_onto_browser_records():
+    payload = {'data': {'searchPosts': {'items': [
+        {
+            'link': 'https://www.aljazeera.com/economy/1',
+            'title': f'Economy grows{ALJAZEERA_TITLE_SUFFIX}',
+            'snippet': '12 Jun 2024 ...   The economy\n grew',
+            'pagemap': {'cse_image': [{'src': 'https://example.com/1.jpg'}]},
+        },
+        {'link': 'https://www.aljazeera.com/economy/2', 'title': 'No image'},
+    ]}}}
+
+    assert AlJazeeraHttpBackend.parse_results(payload) == [
+        {'url': 'https://www.aljazeera.com/economy/1', 'title': 'Economy grows',
+         'description': '12 Jun 2024 ... The economy grew', 'image_src': 'https://example.com/1.jpg'},
+        {'url': 'https://www.aljazeera.com/economy/2', 'title': 'No image', 'description': '', 'image_src': None},
+    ]
+    assert AlJazeeraHttpBackend.parse_results({'data': None}) == []
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+@pytest.mark.parametrize('error, retryable', [
+    (requests.ConnectionError(), True),
+    (http_error(429), True),
+    (http_error(503), True),
+    (http_error(404), False),
+    (ValueError(), False),
+])
+def test_only_transient_errors_are_retried(error, retryable):
+    assert AlJazeeraHttpBackend.is_retryable(error) is retryable
+
+
+def test_crawl_ends_normally_once_the_results_run_out():
+    pages = {0: [{'url': 'a'}], 1: [{'url': 'b'}]}
+    stored, checkpoints = [], []
+    scraper = SimpleNamespace(
+        month=1, page=-1, close_spider=False,
+        split_at_stop_date=lambda records: (records, False),
+        extract_articles=lambda records: [SimpleNamespace(publish_date=datetime(2024, 6, 12), **r) for r in records],
+        store_item=stored.append,
+        save_checkpoint=lambda: checkpoints.append(scraper.page),
+    )
+    backend = AlJazeeraHttpBackend.__new__(AlJazeeraHttpBackend)
+    backend.scraper = scraper
+    backend.fetch_page = lambda page: pages.get(page, [])
+
+    assert backend.run() is None
+    assert [item.url for item in stored] == ['a', 'b']
+    assert checkpoints == [0, 1]
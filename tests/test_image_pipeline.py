@@ -0,0 +1,100 @@
+import sqlite3
+from concurrent.futures import Future
+
+import pytest
+
+from core.base import StorageMixin
+from core.downloads import ImageDownloader
+from core.images import ImageFile
+
+
+class FakeDownloader:
+    # Hands out futures the test resolves itself
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, url, path, rate_limiter=None):
+        future = Future()
+        self.futures.append((future, path))
+        return future
+
+    def shutdown(self):
+        pass
+
+
+class Storage(StorageMixin):
+    search_phrase = 'economy'
+    export_formats = ['csv']
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return Storage(downloader=FakeDownloader())
+
+
+def test_image_resolves_once_archived(storage):
+    image = storage.download_image('https://example.com/a.jpg')
+    download, path = storage.downloader.futures[0]
+    with open(path, 'wb') as image_file:
+        image_file.write(b'image')
+
+    download.set_result(path)
+
+    assert image.result(timeout=1) == ImageFile(path, size=5)
+    assert storage.image_archive.members == 1
+
+
+def test_shared_image_url_is_downloaded_once(storage):
+    first = storage.download_image('https://example.com/a.jpg')
+    second = storage.download_image('https://example.com/a.jpg')
+    assert first is second
+    assert len(storage.downloader.futures) == 1
+
+    download, path = storage.downloader.futures[0]
+    with open(path, 'wb') as image_file:
+        image_file.write(b'image')
+    download.set_result(path)
+
+    assert second.result(timeout=1).path == path
+    assert storage.image_archive.members == 1
+
+
+def test_image_resolves_when_the_download_raises(storage):
+    image = storage.download_image('https://example.com/a.jpg')
+    download, _ = storage.downloader.futures[0]
+
+    download.set_exception(sqlite3.OperationalError('database is locked'))
+
+    assert image.result(timeout=1) is None
+
+
+def test_image_resolves_when_archiving_raises(storage, monkeypatch):
+    def add(path):
+        raise RuntimeError('archive closed')
+
+    monkeypatch.setattr(storage.image_archive, 'add', add)
+    image = storage.download_image('https://example.com/a.jpg')
+    download, path = storage.downloader.futures[0]
+    with open(path, 'wb') as image_file:
+        image_file.write(b'image')
+
+    download.set_result(path)
+
+    assert image.result(timeout=1).path == path
+
+
+def test_download_logs_image_store_errors(tmp_path):
+    class LockedStore:
+        def lookup(self, url):
+            raise sqlite3.OperationalError('database is locked')
+
+        def close(self):
+            pass
+
+    downloader = ImageDownloader(store=LockedStore())
+    try:
+        future = downloader.submit('https://example.com/a.jpg', str(tmp_path / 'a.jpg'))
+        assert future.result(timeout=5) is None
+    finally:
+        downloader.shutdown()
@@ -0,0 +1,73 @@
+from concurrent.futures import Future
+from datetime import datetime
+
+import pytest
+
+from bots.aljazeera_bot.model import AljazeeraModel
+from models.base import derived_property
+
+
+def make_item(**values):
+    return AljazeeraModel(**{'title': "Economy grows", 'description': "The economy gained $11.5 billion",
+                             'image_path': 'output/images/1.jpg', 'search_phrase': 'economy',
+                             'publish_date': datetime(2024, 6, 12), **values})
+
+
+def test_items_carry_no_per_instance_storage():
+    item = make_item()
+    assert not hasattr(item, '__dict__')
+    assert set(AljazeeraModel.__slots__) == {'_count_search_phrases', '_contains_money'}
+
+
+def test_derived_values_follow_field_updates():
+    item = make_item()
+    assert item.count_search_phrases == 2
+    assert item.contains_money
+
+    item.add_value('description', "Nothing to report")
+    assert item.count_search_phrases == 1
+    assert not item.contains_money
+
+
+def test_derived_values_are_computed_once(monkeypatch):
+    item = make_item()
+    calls = []
+    pattern = AljazeeraModel.phrase_pattern('economy')
+    monkeypatch.setattr(AljazeeraModel, 'phrase_pattern', staticmethod(lambda phrase: calls.append(phrase) or pattern))
+
+    item.to_tuple()
+    item.load_items()
+    assert item.count_search_phrases == 2
+    assert calls == ['economy']
+
+
+def test_evaluate_caches_every_derived_value():
+    items = AljazeeraModel.evaluate(make_item() for _ in range(3))
+
+    assert len(items) == 3
+    for item in items:
+        assert (item._count_search_phrases, item._contains_money) == (2, True)
+
+
+def test_derived_property_needs_a_slot():
+    with pytest.raises(TypeError):
+        class Undeclared(AljazeeraModel):
+            __slots__ = ()
+
+            @derived_property
+            def word_count(self) -> int:
+                return len(self.description.split())
+
+
+def test_rows_follow_the_cached_headers():
+    image = Future()
+    image.set_result('output/images/1.webp')
+    item = make_item(image_path=image)
+
+    headers = AljazeeraModel.header_names()
+    assert headers is AljazeeraModel.header_names()
+    assert headers[-2:] == ('contains_money', 'count_search_phrases')
+
+    row = dict(zip(headers, item.to_tuple()))
+    assert row['image_path'] == 'output/images/1.webp'
+    assert row == item.load_items()
@@ -0,0 +1,37 @@
+from core.pagination import ShardedPagination, plan_shards
+
+
+def test_short_windows_fetch_one_page_at_a_time():
+    assert plan_shards(0.5, months_per_shard=3, max_shards=4) == 1
+    assert plan_shards(1, months_per_shard=3, max_shards=4) == 1
+    assert plan_shards(3, months_per_shard=3, max_shards=4) == 1
+
+
+def test_shards_grow_with_the_window_up_to_the_cap():
+    assert plan_shards(4, months_per_shard=3, max_shards=4) == 2
+    assert plan_shards(12, months_per_shard=3, max_shards=4) == 4
+    assert plan_shards(120, months_per_shard=3, max_shards=4) == 4
+
+    shards = [plan_shards(month, months_per_shard=3, max_shards=4) for month in range(1, 25)]
+    assert shards == sorted(shards)
+    assert max(shards) == 4
+
+
+def test_sharded_pages_are_merged_in_order_without_duplicates():
+    pages = {0: [{'url': 'a'}, {'url': 'b'}], 1: [{'url': 'b'}, {'url': 'c'}], 2: [{'url': 'd'}], 3: []}
+    pagination = ShardedPagination(lambda page: pages.get(page, []), shards=2)
+
+    assert list(pagination.waves()) == [
+        (1, [{'url': 'a'}, {'url': 'b'}, {'url': 'c'}]),
+        (3, [{'url': 'd'}]),
+    ]
+
+
+def test_no_page_past_the_wave_is_fetched_once_iteration_stops():
+    fetched = []
+    pagination = ShardedPagination(lambda page: fetched.append(page) or [{'url': str(page)}], shards=3, start_page=2)
+
+    for last_page, records in pagination.waves():
+        assert (last_page, len(records)) == (4, 3)
+        break
+    assert sorted(fetched) == [2, 3, 4]
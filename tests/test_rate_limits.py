@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.common import TimeoutException
+
+from bots.aljazeera_bot.bot import AlJazeeraScraper
+from core.rate_limits import RateLimiter
+
+
+def test_healthy_responses_raise_the_rate_up_to_the_maximum():
+    limiter = RateLimiter(max_rate=5, initial_rate=4)
+    for _ in range(5):
+        with limiter.track():
+            pass
+
+    assert limiter.rate == 5
+    assert limiter.metrics()['requests'] == 5
+
+
+def test_retryable_errors_are_retried_at_a_lower_rate():
+    limiter = RateLimiter(max_rate=100, initial_rate=100)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TimeoutException("page load timed out")
+        return 'loaded'
+
+    assert limiter.call(flaky, retryable=lambda e: isinstance(e, TimeoutException)) == 'loaded'
+    assert len(attempts) == 3
+    assert limiter.rate < 100
+    assert limiter.metrics()['errors'] == 2
+
+
+def test_other_errors_are_raised_at_once():
+    limiter = RateLimiter()
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise ValueError("bad selector")
+
+    with pytest.raises(ValueError):
+        limiter.call(broken, retryable=lambda e: isinstance(e, TimeoutException))
+    assert len(attempts) == 1
+
+
+def test_retried_show_more_click_is_skipped_once_results_arrived():
+    # The first click landed after its wait timed out, the retry finds the results already loaded
+    clicks = []
+    scraper = SimpleNamespace(
+        cursor=SimpleNamespace(index=10),
+        count_results=lambda: 20 if clicks else 10,
+        browser=SimpleNamespace(click_element_when_clickable=clicks.append),
+        waits=SimpleNamespace(wait_for=lambda *args, **kwargs: False),
+        click_next_button_xpath='//button',
+        search_results_xpath='//article',
+    )
+
+    with pytest.raises(TimeoutException):
+        AlJazeeraScraper.load_next_results(scraper)
+    AlJazeeraScraper.load_next_results(scraper)
+
+    assert clicks == ['//button']
@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from core.seen_index import SeenIndex
+
+
+def test_records_and_forgets_articles(tmp_path):
+    index = SeenIndex.load(str(tmp_path / 'seen.sqlite3'))
+    index.add('economy', 'https://example.com/1', 'output/1.jpg')
+
+    assert index.contains('economy', 'https://example.com/1')
+    assert index.get_image_path('economy', 'https://example.com/1') == 'output/1.jpg'
+    assert not index.contains('war', 'https://example.com/1')
+
+    index.forget_since('economy', '2000-01-01T00:00:00')
+    assert not index.contains('economy', 'https://example.com/1')
+    index.close()
+
+
+def test_scrapers_of_a_batch_share_one_index(tmp_path):
+    path = str(tmp_path / 'seen.sqlite3')
+    first, second = SeenIndex.load(path), SeenIndex.load(path)
+    assert first is second
+
+    # Concurrent writers used to fail with "database is locked" after the busy timeout
+    def scrape(phrase):
+        for number in range(120):
+            first.add(phrase, f'https://example.com/{number}', None)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(scrape, ['economy', 'war']))
+
+    first.close()
+    assert second.contains('war', 'https://example.com/119')
+    second.close()
+
+    reopened = SeenIndex.load(path)
+    assert reopened is not first
+    assert reopened.contains('economy', 'https://example.com/0')
+    reopened.close()
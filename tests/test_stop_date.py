@@ -0,0 +1,32 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from bots.aljazeera_bot.bot import AlJazeeraScraper
+
+
+def articles_dated(*days):
+    return [{'description': f'{day} Jun 2024 ... Article {day}'} for day in days]
+
+
+def split(articles, stop_date=datetime(2024, 6, 10)):
+    scraper = SimpleNamespace(stop_date=stop_date, read_publish_date=AlJazeeraScraper.read_publish_date)
+    return AlJazeeraScraper.split_at_stop_date(scraper, articles)
+
+
+def test_page_before_the_stop_date_is_kept_whole():
+    articles = articles_dated(14, 13, 12)
+    assert split(articles) == (articles, False)
+
+
+def test_page_is_cut_at_the_first_article_past_the_stop_date():
+    articles = articles_dated(12, 11, 10, 9)
+    assert split(articles) == (articles[:2], True)
+
+
+def test_page_entirely_past_the_stop_date_is_dropped():
+    assert split(articles_dated(9, 8)) == ([], True)
+
+
+def test_undated_articles_do_not_stop_the_crawl():
+    articles = [{'description': 'No date here'}, *articles_dated(12)]
+    assert split(articles) == (articles, False)
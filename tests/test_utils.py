@@ -0,0 +1,37 @@
+from concurrent.futures import Future
+
+import pytest
+
+from core.utils import chain_future, slugify
+
+
+def test_slugify():
+    assert slugify("Climate Change: 2024!") == 'climate-change-2024'
+    assert slugify("اقتصاد") == ''
+
+
+def test_chained_future_resolves_with_its_source():
+    image = Future()
+    width = chain_future(image, lambda image_file: image_file and image_file['width'])
+    assert not width.done()
+
+    image.set_result({'width': 640})
+    assert width.result(timeout=1) == 640
+
+
+def test_chained_future_fails_with_its_source():
+    image = Future()
+    width = chain_future(image, lambda image_file: image_file['width'])
+
+    image.set_exception(OSError("download failed"))
+    with pytest.raises(OSError):
+        width.result(timeout=1)
+
+
+def test_chained_future_fails_with_its_function():
+    image = Future()
+    width = chain_future(image, lambda image_file: image_file['width'])
+
+    image.set_result({})
+    with pytest.raises(KeyError):
+        width.result(timeout=1)
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from bots.aljazeera_bot.bot import AlJazeeraScraper
+from constants import WAIT_MIN_SAMPLES, WAIT_MIN_TIMEOUT, WAIT_OPTIONAL_TIMEOUT
+from core.profiler import RunProfiler
+from core.waits import WaitEngine, WaitTimings
+
+
+def learned_timings(tmp_path, key, duration):
+    timings = WaitTimings(str(tmp_path / 'wait_timings.json'))
+    for _ in range(WAIT_MIN_SAMPLES):
+        timings.record(key, duration)
+    return timings
+
+
+def test_timeouts_are_learned_and_survive_a_restart(tmp_path):
+    timings = learned_timings(tmp_path, 'visible://div', 2.0)
+    assert timings.timeout_for('visible://div', default=2, maximum=10) == 6.0
+    assert timings.timeout_for('visible://new', default=2, maximum=10) == 2
+
+    timings.save()
+    reloaded = WaitTimings(timings.path)
+    assert reloaded.timeout_for('visible://div', default=2, maximum=10) == 6.0
+
+
+def test_fast_selectors_never_go_below_the_minimum(tmp_path):
+    timings = learned_timings(tmp_path, 'visible://div', 0.01)
+    assert timings.timeout_for('visible://div', default=10) == WAIT_MIN_TIMEOUT
+
+
+def engine_with(timings, met=True):
+    engine = WaitEngine(browser=None, timings=timings)
+    waited = []
+
+    def wait(xpath, state, count, timeout):
+        waited.append(timeout)
+        return met
+
+    engine._wait = wait
+    return engine, waited
+
+
+def test_required_waits_keep_their_full_timeout(tmp_path):
+    # Learned from fast loads, a slow page must still get the full timeout
+    engine, waited = engine_with(learned_timings(tmp_path, 'visible://article', 0.1), met=False)
+    assert not engine.wait_for('//article', timeout=10)
+    assert waited == [10]
+
+
+def test_optional_waits_use_the_learned_timeout(tmp_path):
+    engine, waited = engine_with(learned_timings(tmp_path, 'visible://button', 2.0), met=False)
+    engine.wait_for('//button', optional=True)
+    engine.wait_for('//other', optional=True)
+    assert waited == [6.0, WAIT_OPTIONAL_TIMEOUT]
+
+
+def test_count_waits_share_one_history(tmp_path):
+    timings = WaitTimings(str(tmp_path / 'wait_timings.json'))
+    engine, _ = engine_with(timings)
+    for count in (10, 20, 30):
+        engine.wait_for('//article', state='count', count=count)
+
+    assert list(timings.history) == ['count://article']
+    assert len(timings.history['count://article']) == 3
+
+
+def test_last_page_is_detected_without_waiting(tmp_path):
+    engine, waited = engine_with(WaitTimings(str(tmp_path / 'wait_timings.json')), met=False)
+    scraper = SimpleNamespace(browser=SimpleNamespace(execute_javascript=lambda script: None), waits=engine,
+                              profiler=RunProfiler(), click_next_button_xpath='//button[@data-testid="show-more"]')
+
+    assert not AlJazeeraScraper.click_next_item(scraper)
+    assert waited == [0]